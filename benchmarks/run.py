@@ -0,0 +1,258 @@
+"""EDRR micro-benchmarks for the analysis and output hot paths.
+
+Usage:
+    python -m benchmarks.run --sizes 1000 10000 100000 --output bench.json
+    python -m benchmarks.run --compare bench.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from benchmarks.synthetic import DEFAULT_ASSETS, DEFAULT_START, generate_events
+from edrr.analysis.risk_aggregator import RiskAggregator
+from edrr.models.config import Config
+from edrr.models.events import Event, EventCategory
+from edrr.outputs.alerts import AlertManager
+from edrr.outputs.calendar_view import CalendarView
+from edrr.outputs.recommendations import RecommendationEngine
+
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+
+@dataclass
+class BenchmarkResult:
+    benchmark: str
+    events: int
+    repeats: int
+    best_seconds: float
+    median_seconds: float
+    throughput_events_per_second: float
+    peak_memory_bytes: int
+
+
+@dataclass
+class BenchmarkContext:
+    events: List[Event]
+    config: Config
+    aggregator: RiskAggregator
+    start: datetime
+
+    def tick(self, iteration: int) -> datetime:
+        # Each iteration gets its own time bucket so snapshot caches do not
+        # turn repeats into dictionary lookups.
+        return self.start + timedelta(seconds=iteration * 2)
+
+
+def _bench_calculate_score(ctx: BenchmarkContext) -> Callable[[int], None]:
+    scorer = ctx.aggregator.impact_scorer
+
+    def run(iteration: int) -> None:
+        current_time = ctx.tick(iteration)
+        for event in ctx.events:
+            scorer.calculate_score(event, "SPY", current_time)
+
+    return run
+
+
+def _bench_get_current_risk(ctx: BenchmarkContext) -> Callable[[int], None]:
+    return lambda iteration: ctx.aggregator.get_current_risk(ctx.tick(iteration))
+
+
+def _bench_get_risk_timeline(ctx: BenchmarkContext) -> Callable[[int], None]:
+    # Every 15 minutes for three days, as a pre-trade planner would ask for.
+    def run(iteration: int) -> None:
+        start = ctx.tick(iteration)
+        times = [start + timedelta(minutes=15 * i) for i in range(288)]
+        ctx.aggregator.get_risk_timeline(times)
+
+    return run
+
+
+def _bench_detect_clustering(ctx: BenchmarkContext) -> Callable[[int], None]:
+    return lambda iteration: ctx.aggregator.detect_clustering(ctx.tick(iteration))
+
+
+def _bench_get_danger_zones(ctx: BenchmarkContext) -> Callable[[int], None]:
+    return lambda iteration: ctx.aggregator.get_danger_zones(ctx.tick(iteration))
+
+
+def _bench_check_thresholds(ctx: BenchmarkContext) -> Callable[[int], None]:
+    manager = AlertManager(ctx.aggregator, ctx.config)
+    return lambda iteration: manager.check_thresholds(ctx.tick(iteration))
+
+
+def _bench_generate_week(ctx: BenchmarkContext) -> Callable[[int], None]:
+    calendar = CalendarView(ctx.aggregator, ctx.config)
+    return lambda iteration: calendar.generate_week(ctx.tick(iteration))
+
+
+def _bench_get_all_recommendations(ctx: BenchmarkContext) -> Callable[[int], None]:
+    engine = RecommendationEngine(ctx.config)
+    risks = ctx.aggregator.get_current_risk(ctx.start)
+    return lambda iteration: engine.get_all_recommendations(risks)
+
+
+BENCHMARKS: Dict[str, Callable[[BenchmarkContext], Callable[[int], None]]] = {
+    "impact_scorer.calculate_score": _bench_calculate_score,
+    "risk_aggregator.get_current_risk": _bench_get_current_risk,
+    "risk_aggregator.get_risk_timeline": _bench_get_risk_timeline,
+    "risk_aggregator.detect_clustering": _bench_detect_clustering,
+    "risk_aggregator.get_danger_zones": _bench_get_danger_zones,
+    "alerts.check_thresholds": _bench_check_thresholds,
+    "calendar_view.generate_week": _bench_generate_week,
+    "recommendations.get_all_recommendations": _bench_get_all_recommendations,
+}
+
+
+def run_benchmark(
+    name: str,
+    ctx: BenchmarkContext,
+    repeats: int = 5,
+) -> BenchmarkResult:
+    """Time one benchmark and measure its peak traced memory.
+
+    The benchmark runs `repeats` timed iterations followed by one extra
+    iteration under tracemalloc, so tracing overhead does not skew timings.
+    """
+    run = BENCHMARKS[name](ctx)
+    timings: List[float] = []
+    for iteration in range(repeats):
+        started = time.perf_counter()
+        run(iteration)
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        run(repeats)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    best = min(timings)
+    return BenchmarkResult(
+        benchmark=name,
+        events=len(ctx.events),
+        repeats=repeats,
+        best_seconds=best,
+        median_seconds=statistics.median(timings),
+        throughput_events_per_second=len(ctx.events) / best if best > 0 else float("inf"),
+        peak_memory_bytes=peak,
+    )
+
+
+def run_suite(
+    sizes: Sequence[int],
+    benchmarks: Optional[Sequence[str]] = None,
+    assets: Optional[Sequence[str]] = None,
+    categories: Optional[Sequence[EventCategory]] = None,
+    repeats: int = 5,
+    seed: int = 0,
+    progress: Optional[Callable[[BenchmarkResult], None]] = None,
+) -> List[BenchmarkResult]:
+    results: List[BenchmarkResult] = []
+    for size in sizes:
+        events = generate_events(size, assets=assets, categories=categories, seed=seed)
+        config = Config()
+        aggregator = RiskAggregator(config)
+        aggregator.set_events(events)
+        ctx = BenchmarkContext(events=events, config=config, aggregator=aggregator, start=DEFAULT_START)
+
+        for name in benchmarks or BENCHMARKS:
+            result = run_benchmark(name, ctx, repeats)
+            results.append(result)
+            if progress:
+                progress(result)
+    return results
+
+
+def _metadata(args: argparse.Namespace) -> Dict[str, object]:
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "sizes": args.sizes,
+        "assets": args.assets,
+        "repeats": args.repeats,
+        "seed": args.seed,
+    }
+
+
+def _print_result(result: BenchmarkResult, baseline: Optional[Dict[str, object]] = None) -> None:
+    line = (
+        f"  {result.benchmark:42} | {result.events:>9,} events | "
+        f"{result.best_seconds * 1000:10.2f} ms | "
+        f"{result.throughput_events_per_second:14,.0f} ev/s | "
+        f"{result.peak_memory_bytes / 1024 / 1024:8.1f} MiB"
+    )
+    if baseline:
+        ratio = result.best_seconds / float(baseline["best_seconds"]) if baseline["best_seconds"] else 0.0
+        line += f" | {ratio:5.2f}x vs baseline"
+    print(line)
+
+
+def _load_baseline(path: Optional[str]) -> Dict[tuple, Dict[str, object]]:
+    if not path:
+        return {}
+    with open(path) as f:
+        data = json.load(f)
+    return {(r["benchmark"], r["events"]): r for r in data.get("results", [])}
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="benchmarks.run",
+        description="Benchmark EDRR scoring, clustering, alerting and output paths",
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Event counts to benchmark")
+    parser.add_argument("--assets", nargs="+", default=DEFAULT_ASSETS, help="Asset universe for generated events")
+    parser.add_argument("--categories", nargs="+", default=None, help="Event categories (e.g. economic crypto)")
+    parser.add_argument("--benchmarks", nargs="+", choices=list(BENCHMARKS), default=None, help="Subset to run")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed iterations per benchmark")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic data seed")
+    parser.add_argument("--output", type=str, default=None, help="Write results as JSON to this path")
+    parser.add_argument("--compare", type=str, default=None, help="Baseline JSON to compare against")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
+    categories = [EventCategory(c) for c in args.categories] if args.categories else None
+    baseline = _load_baseline(args.compare)
+
+    print("EDRR BENCHMARKS")
+    print("-" * 60)
+    results = run_suite(
+        args.sizes,
+        benchmarks=args.benchmarks,
+        assets=args.assets,
+        categories=categories,
+        repeats=args.repeats,
+        seed=args.seed,
+        progress=lambda r: _print_result(r, baseline.get((r.benchmark, r.events))),
+    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {"meta": _metadata(args), "results": [asdict(r) for r in results]},
+                f,
+                indent=2,
+            )
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,66 @@
+import random
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence
+
+from edrr.models.events import Event, EventCategory, EventTier
+
+
+DEFAULT_START = datetime(2025, 1, 15, 12, 0, 0)
+DEFAULT_ASSETS = ["SPY", "QQQ", "BTC", "GOLD"]
+
+IMPACT_HOURS_BY_TIER = {
+    EventTier.TIER_1: (2, 14),
+    EventTier.TIER_2: (1, 2),
+    EventTier.TIER_3: (6, 24),
+    EventTier.TIER_4: (4, 48),
+}
+
+
+def generate_events(
+    count: int,
+    assets: Optional[Sequence[str]] = None,
+    categories: Optional[Sequence[EventCategory]] = None,
+    seed: int = 0,
+    start: datetime = DEFAULT_START,
+    past_hours: float = 24,
+    horizon_days: float = 30,
+) -> List[Event]:
+    """Generate a deterministic synthetic event set.
+
+    Args:
+        count: Number of events to generate.
+        assets: Asset universe to draw affected assets from.
+        categories: Event categories to draw from (defaults to all).
+        seed: Random seed; the same arguments always give the same events.
+        start: Reference "now" for the generated calendar.
+        past_hours: How far before start events may be scheduled.
+        horizon_days: How far after start events may be scheduled.
+
+    Returns:
+        List of events with unique ids, scheduled between
+        start - past_hours and start + horizon_days.
+    """
+    rng = random.Random(seed)
+    assets = list(assets or DEFAULT_ASSETS)
+    categories = list(categories or EventCategory)
+    tiers = list(EventTier)
+    earliest = -past_hours * 3600
+    latest = horizon_days * 86400
+
+    events: List[Event] = []
+    for i in range(count):
+        tier = rng.choice(tiers)
+        low, high = IMPACT_HOURS_BY_TIER[tier]
+        affected = rng.sample(assets, rng.randint(1, len(assets)))
+        events.append(
+            Event(
+                id=f"bench-{seed}-{i}",
+                title=f"Synthetic Event {i}",
+                category=rng.choice(categories),
+                tier=tier,
+                scheduled_time=start + timedelta(seconds=int(rng.uniform(earliest, latest))),
+                impact_window=timedelta(hours=rng.randint(low, high)),
+                affected_assets=affected,
+            )
+        )
+    return events
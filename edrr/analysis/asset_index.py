@@ -0,0 +1,236 @@
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from edrr.analysis.impact_scorer import EventArrays, ImpactScorer, datetimes_to_array
+from edrr.models.assets import ASSET_REGISTRY
+from edrr.models.events import Event
+
+
+# Events at least this far ahead all use the "24h_plus" multiplier, so their
+# score does not depend on the current time.
+STATIC_HORIZON = timedelta(hours=24)
+
+# score_timeline groups reference times into chunks no wider than this, and
+# scores at most this many (time, event) cells in one vectorized pass.
+TIMELINE_CHUNK_SPAN = timedelta(hours=6)
+TIMELINE_CHUNK_CELLS = 1_000_000
+
+
+class _AssetEvents:
+    """Time-sorted events for one asset plus their time-independent scores."""
+
+    def __init__(self) -> None:
+        self.events: List[Event] = []
+        self.times: List[datetime] = []
+        # Static score (1-10) -> sorted scheduled times of events with that score
+        self.static_times: Dict[int, List[datetime]] = {}
+        self.static_scores: Dict[str, int] = {}
+        # Upper bound on impact windows; never shrinks, which only widens the horizon.
+        self.max_impact = timedelta(0)
+        self._arrays: Optional[EventArrays] = None
+
+    def load(self, arrays: EventArrays, static_scores: np.ndarray) -> None:
+        """Fill an empty entry from event arrays already sorted by scheduled time."""
+        self.events = arrays.events
+        self.times = [event.scheduled_time for event in arrays.events]
+        self.static_scores = dict(zip((event.id for event in arrays.events), static_scores.tolist()))
+        for score in np.unique(static_scores).tolist():
+            positions = np.flatnonzero(static_scores == score).tolist()
+            self.static_times[score] = [self.times[i] for i in positions]
+        if len(arrays):
+            self.max_impact = timedelta(microseconds=int(arrays.impact_windows.max().astype(np.int64)))
+        self._arrays = arrays
+
+    def add(self, event: Event, static_score: int) -> None:
+        i = bisect_right(self.times, event.scheduled_time)
+        self.times.insert(i, event.scheduled_time)
+        self.events.insert(i, event)
+        insort(self.static_times.setdefault(static_score, []), event.scheduled_time)
+        self.static_scores[event.id] = static_score
+        self.max_impact = max(self.max_impact, event.impact_window)
+        self._arrays = None
+
+    def remove(self, event: Event) -> None:
+        lo = bisect_left(self.times, event.scheduled_time)
+        hi = bisect_right(self.times, event.scheduled_time)
+        for i in range(lo, hi):
+            if self.events[i].id == event.id:
+                del self.events[i]
+                del self.times[i]
+                self._arrays = None
+                break
+        score = self.static_scores.pop(event.id)
+        times = self.static_times[score]
+        del times[bisect_left(times, event.scheduled_time)]
+
+    def arrays(self) -> EventArrays:
+        """Columnar view of the events, rebuilt lazily after changes."""
+        if self._arrays is None:
+            self._arrays = EventArrays.from_events(self.events)
+        return self._arrays
+
+    def max_static_from(self, start: datetime) -> int:
+        """Highest static score among events scheduled at or after start (0 if none)."""
+        for score in sorted(self.static_times, reverse=True):
+            times = self.static_times[score]
+            if bisect_left(times, start) < len(times):
+                return score
+        return 0
+
+
+class AssetEventIndex:
+    """Inverted index from asset to its events, sorted by scheduled time.
+
+    Scoring an asset only evaluates events whose score can still change with
+    time: those from (now - longest impact window) up to now + 24h. Events
+    further out use a precomputed static score, looked up per score level by
+    binary search; events already past their impact window score the floor
+    of 1. Events can be added and removed without rebuilding.
+    """
+
+    def __init__(self, scorer: ImpactScorer, events: Iterable[Event] = ()) -> None:
+        self.scorer = scorer
+        self._assets: Dict[str, _AssetEvents] = {}
+        self._by_id: Dict[str, Event] = {}
+        self._load(sorted(events, key=lambda e: e.scheduled_time))
+
+    def _load(self, events: List[Event]) -> None:
+        if not events:
+            return
+        for event in events:
+            self._by_id[event.id] = event
+
+        arrays = EventArrays.from_events(events)
+        union = 0
+        for event in events:
+            union |= event.asset_mask
+        assets = ASSET_REGISTRY.symbols(union)
+
+        # Scoring from a day before the earliest event makes every multiplier
+        # the 24h+ one, which yields all static scores in one pass.
+        static = self.scorer.score_matrix(
+            arrays.times,
+            arrays.tiers,
+            arrays.categories,
+            arrays.impact_windows,
+            assets,
+            events[0].scheduled_time - STATIC_HORIZON,
+        )
+        affected = arrays.affected_matrix(assets)
+        for column, asset in enumerate(assets):
+            rows = np.flatnonzero(affected[:, column])
+            entries = self._assets[asset] = _AssetEvents()
+            entries.load(arrays.take(rows), static[rows, column])
+
+    def add(self, event: Event) -> None:
+        """Add an event, replacing any indexed event with the same id."""
+        if event.id in self._by_id:
+            self.remove(event)
+        self._by_id[event.id] = event
+        for asset in event.affected_assets:
+            entries = self._assets.get(asset)
+            if entries is None:
+                entries = self._assets[asset] = _AssetEvents()
+            entries.add(event, self.scorer.static_score(event, asset))
+
+    def remove(self, event: Event) -> None:
+        """Remove the indexed event with this event's id, if any."""
+        indexed = self._by_id.pop(event.id, None)
+        if indexed is None:
+            return
+        for asset in indexed.affected_assets:
+            self._assets[asset].remove(indexed)
+
+    def events_for(self, asset: str) -> List[Event]:
+        entries = self._assets.get(asset)
+        return entries.events if entries else []
+
+    def next_event(self, asset: str, current_time: datetime) -> Optional[Event]:
+        """First event for the asset scheduled strictly after current_time."""
+        entries = self._assets.get(asset)
+        if not entries:
+            return None
+        i = bisect_right(entries.times, current_time)
+        return entries.events[i] if i < len(entries.events) else None
+
+    def max_score(self, asset: str, current_time: datetime) -> int:
+        """Highest score of any event affecting the asset (0 if it has none).
+
+        Equal to max(calculate_score(e, asset, current_time)) over the asset's
+        events, without scoring events outside the active horizon.
+        """
+        entries = self._assets.get(asset)
+        if not entries or not entries.events:
+            return 0
+
+        lo = bisect_left(entries.times, current_time - entries.max_impact)
+        hi = bisect_left(entries.times, current_time + STATIC_HORIZON)
+        best = max(1, entries.max_static_from(current_time + STATIC_HORIZON))
+        if lo < hi:
+            arrays = entries.arrays()
+            scores = self.scorer.score_matrix(
+                arrays.times[lo:hi],
+                arrays.tiers[lo:hi],
+                arrays.categories[lo:hi],
+                arrays.impact_windows[lo:hi],
+                [asset],
+                current_time,
+            )
+            best = max(best, int(scores.max()))
+        return best
+
+    def score_timeline(self, asset: str, times: Sequence[datetime]) -> np.ndarray:
+        """max_score for the asset at each of many times, batched.
+
+        Times are scored in sorted chunks spanning at most TIMELINE_CHUNK_SPAN,
+        each against only the events that can score differently within it, in
+        one vectorized pass of at most TIMELINE_CHUNK_CELLS cells.
+
+        Returns:
+            int64 array with one score per time, in the order given.
+        """
+        scores = np.zeros(len(times), dtype=np.int64)
+        entries = self._assets.get(asset)
+        if not entries or not entries.events or not len(times):
+            return scores
+
+        time_values = datetimes_to_array(times)
+        order = np.argsort(time_values, kind="stable")
+        sorted_times = [times[i] for i in order.tolist()]
+        arrays = entries.arrays()
+        start = 0
+        while start < len(sorted_times):
+            first = sorted_times[start]
+            end = bisect_right(sorted_times, first + TIMELINE_CHUNK_SPAN, lo=start)
+            lo = bisect_left(entries.times, first - entries.max_impact)
+            hi = bisect_left(entries.times, sorted_times[end - 1] + STATIC_HORIZON)
+            if lo < hi:
+                end = min(end, start + max(1, TIMELINE_CHUNK_CELLS // (hi - lo)))
+
+            # Events past the window are static for every time in the chunk.
+            best = np.full(
+                end - start,
+                float(max(1, entries.max_static_from(sorted_times[end - 1] + STATIC_HORIZON))),
+            )
+            if lo < hi:
+                raw = self.scorer.max_raw_scores(
+                    arrays.times[lo:hi],
+                    arrays.tiers[lo:hi],
+                    arrays.categories[lo:hi],
+                    arrays.impact_windows[lo:hi],
+                    asset,
+                    time_values[order[start:end]],
+                )
+                best = np.maximum(best, np.clip(np.rint(raw), 1, 10))
+            scores[order[start:end]] = best
+            start = end
+        return scores
+
+    def __contains__(self, event_id: object) -> bool:
+        return event_id in self._by_id
+
+    def __len__(self) -> int:
+        return len(self._by_id)
@@ -0,0 +1,123 @@
+import heapq
+from datetime import datetime, timedelta
+from itertools import count
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from edrr.models.assets import ASSET_REGISTRY
+from edrr.models.events import Event
+
+
+# Offsets before an event at which its time multiplier changes bucket
+# (see ImpactScorer._get_time_multiplier). The score also drops when the
+# impact window after the event ends.
+LEAD_BREAKPOINTS: Tuple[timedelta, ...] = (
+    timedelta(hours=24),
+    timedelta(hours=12),
+    timedelta(hours=4),
+    timedelta(hours=1),
+)
+
+# An event's intraday danger window opens this long before it
+# (see RiskAggregator._get_intraday_windows).
+DANGER_WINDOW_LEAD = timedelta(minutes=30)
+
+
+def event_breakpoints(event: Event) -> List[datetime]:
+    """Instants after which the event's score for any asset can change.
+
+    Scores are piecewise constant in time, so between consecutive breakpoints
+    of all events an asset's risk stays the same.
+    """
+    times = [event.scheduled_time - lead for lead in LEAD_BREAKPOINTS]
+    times.append(event.scheduled_time + event.impact_window)
+    return times
+
+
+def _queue_entries(event: Event) -> List[Tuple[datetime, bool]]:
+    """Breakpoints of the event, flagged True where its danger window opens."""
+    entries = [(time, False) for time in event_breakpoints(event)]
+    entries.append((event.scheduled_time - DANGER_WINDOW_LEAD, True))
+    return entries
+
+
+class BreakpointQueue:
+    """Min-heap of upcoming score breakpoints across all events.
+
+    Each entry carries the asset mask of its event, so popping the due
+    breakpoints says which assets need their risk recomputed. The queue
+    also holds the instants where danger windows open: scores do not
+    change there, but danger-zone alerts need a full check. Removed or
+    replaced events are dropped lazily when their entries reach the top.
+    """
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[datetime, int, Event, bool]] = []
+        self._live: Dict[str, Event] = {}
+        self._stale = 0
+        self._counter = count()
+        self._cutoff = datetime.min
+
+    def set_events(self, events: Iterable[Event], current_time: datetime) -> None:
+        """Replace all events, keeping only breakpoints after current_time."""
+        self._live = {event.id: event for event in events}
+        self._cutoff = current_time
+        self._rebuild()
+
+    def add(self, event: Event) -> None:
+        """Add an event, replacing any queued event with the same id."""
+        if event.id in self._live:
+            self.remove(event)
+        self._live[event.id] = event
+        for time, opens_window in _queue_entries(event):
+            if time > self._cutoff:
+                heapq.heappush(self._heap, (time, next(self._counter), event, opens_window))
+
+    def remove(self, event: Event) -> None:
+        """Forget the queued event with this event's id, if any."""
+        if self._live.pop(event.id, None) is None:
+            return
+        self._stale += 1
+        if self._stale > len(self._live):
+            self._rebuild()
+
+    def next_time(self) -> Optional[datetime]:
+        """Earliest pending breakpoint, or None if there are none."""
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, current_time: datetime) -> Tuple[List[str], bool]:
+        """Remove breakpoints at or before current_time.
+
+        Returns:
+            Symbols of the assets affected by those events, in registry
+            order, and whether any of them opened a danger window.
+        """
+        mask = 0
+        opened = False
+        while True:
+            self._drop_stale()
+            if not self._heap or self._heap[0][0] > current_time:
+                break
+            _, _, event, opens_window = heapq.heappop(self._heap)
+            mask |= event.asset_mask
+            opened = opened or opens_window
+        self._cutoff = max(self._cutoff, current_time)
+        return list(ASSET_REGISTRY.symbols(mask)), opened
+
+    def _drop_stale(self) -> None:
+        heap = self._heap
+        while heap and self._live.get(heap[0][2].id) is not heap[0][2]:
+            heapq.heappop(heap)
+
+    def _rebuild(self) -> None:
+        self._heap = [
+            (time, next(self._counter), event, opens_window)
+            for event in self._live.values()
+            for time, opens_window in _queue_entries(event)
+            if time > self._cutoff
+        ]
+        heapq.heapify(self._heap)
+        self._stale = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
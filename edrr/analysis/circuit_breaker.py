@@ -0,0 +1,65 @@
+import time
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency while its circuit is open."""
+
+
+class CircuitBreaker:
+    """Stops calls to a failing dependency until it has had time to recover.
+
+    After `failure_threshold` consecutive failed requests the circuit opens and
+    every caller fails fast. Once `reset_seconds` have passed, one trial request
+    is let through (half-open): success closes the circuit, failure reopens it.
+    A trial that never reports back is replaced after another `reset_seconds`.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 60.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.consecutive_failures = 0
+        self.times_opened = 0
+        self._opened_at = 0.0
+        self._state = self.CLOSED
+        self._trial_in_flight = False
+        self._trial_started = 0.0
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_seconds:
+            return self.HALF_OPEN
+        return self._state
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN:
+            now = time.monotonic()
+            if not self._trial_in_flight or now - self._trial_started >= self.reset_seconds:
+                self._trial_in_flight = True
+                self._trial_started = now
+                return True
+        return False
+
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+        self._trial_in_flight = False
+        self._state = self.CLOSED
+
+    def record_ignored(self) -> None:
+        """End a request whose outcome says nothing about the dependency's health."""
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        tripped = self._state == self.CLOSED and self.consecutive_failures >= self.failure_threshold
+        if tripped or self._trial_in_flight:
+            self.times_opened += 1
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+        self._trial_in_flight = False
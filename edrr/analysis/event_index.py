@@ -0,0 +1,68 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Iterable, Iterator, List
+
+from edrr.models.events import Event
+
+
+class EventIndex:
+    """Events kept sorted by scheduled time for binary-search range queries.
+
+    Events with the same scheduled time keep their original relative order.
+    """
+
+    def __init__(self, events: Iterable[Event] = ()) -> None:
+        self._events: List[Event] = sorted(events, key=lambda e: e.scheduled_time)
+        self._times: List[datetime] = [e.scheduled_time for e in self._events]
+
+    @property
+    def events(self) -> List[Event]:
+        return self._events
+
+    def between(
+        self,
+        start: datetime,
+        end: datetime,
+        include_end: bool = True,
+    ) -> List[Event]:
+        """Get events scheduled in [start, end] (or [start, end) if include_end is False).
+
+        Args:
+            start: Inclusive lower bound.
+            end: Upper bound.
+            include_end: Whether events exactly at end are included.
+
+        Returns:
+            Matching events in scheduled-time order.
+        """
+        lo = bisect_left(self._times, start)
+        if include_end:
+            hi = bisect_right(self._times, end)
+        else:
+            hi = bisect_left(self._times, end)
+        return self._events[lo:hi]
+
+    def add(self, event: Event) -> None:
+        """Insert an event after any already indexed at the same time."""
+        i = bisect_right(self._times, event.scheduled_time)
+        self._times.insert(i, event.scheduled_time)
+        self._events.insert(i, event)
+
+    def remove(self, event: Event) -> None:
+        """Remove the indexed event with this event's id and scheduled time, if any."""
+        lo = bisect_left(self._times, event.scheduled_time)
+        hi = bisect_right(self._times, event.scheduled_time)
+        for i in range(lo, hi):
+            if self._events[i].id == event.id:
+                del self._events[i]
+                del self._times[i]
+                return
+
+    def count_between(self, start: datetime, end: datetime) -> int:
+        return bisect_right(self._times, end) - bisect_left(self._times, start)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self) -> Iterator[Event]:
+        return iter(self._events)
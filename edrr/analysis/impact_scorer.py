@@ -1,11 +1,102 @@
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence, Union
 
+import numpy as np
+
+from edrr.models.assets import ASSET_REGISTRY
 from edrr.models.config import Config, TIME_MULTIPLIERS, ASSET_EVENT_CORRELATIONS
 from edrr.models.events import Event, EventCategory
 
 
+CATEGORIES: List[EventCategory] = list(EventCategory)
+CATEGORY_CODES: Dict[EventCategory, int] = {category: i for i, category in enumerate(CATEGORIES)}
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def datetimes_to_array(values: Sequence[datetime]) -> np.ndarray:
+    """Convert naive datetimes to a datetime64[us] array."""
+    return np.fromiter(
+        ((value - _EPOCH) // _MICROSECOND for value in values),
+        dtype=np.int64,
+        count=len(values),
+    ).view("datetime64[us]")
+
+
+def timedeltas_to_array(values: Sequence[timedelta]) -> np.ndarray:
+    """Convert timedeltas to a timedelta64[us] array."""
+    return np.fromiter(
+        (value // _MICROSECOND for value in values),
+        dtype=np.int64,
+        count=len(values),
+    ).view("timedelta64[us]")
+
+
+@dataclass
+class EventArrays:
+    """Columnar view of a list of events for vectorized scoring."""
+
+    events: List[Event]
+    times: np.ndarray  # datetime64[us]
+    tiers: np.ndarray  # tier values (1-4)
+    categories: np.ndarray  # indexes into CATEGORIES
+    impact_windows: np.ndarray  # timedelta64[us]
+
+    @classmethod
+    def from_events(cls, events: Sequence[Event]) -> "EventArrays":
+        events = list(events)
+        return cls(
+            events=events,
+            times=datetimes_to_array([e.scheduled_time for e in events]),
+            tiers=np.fromiter((e.tier.value for e in events), dtype=np.int64, count=len(events)),
+            categories=np.fromiter(
+                (CATEGORY_CODES[e.category] for e in events), dtype=np.int64, count=len(events)
+            ),
+            impact_windows=timedeltas_to_array([e.impact_window for e in events]),
+        )
+
+    def affected_matrix(self, assets: Sequence[str]) -> np.ndarray:
+        """Boolean events x assets matrix of which events affect which assets."""
+        matrix = np.zeros((len(self.events), len(assets)), dtype=bool)
+        if len(ASSET_REGISTRY) < 64:
+            masks = np.fromiter(
+                (e.asset_mask for e in self.events), dtype=np.int64, count=len(self.events)
+            )
+            for column, asset in enumerate(assets):
+                matrix[:, column] = (masks & ASSET_REGISTRY.lookup(asset)) != 0
+            return matrix
+
+        # Masks no longer fit in int64; test bits one event at a time.
+        for column, asset in enumerate(assets):
+            bit = ASSET_REGISTRY.lookup(asset)
+            matrix[:, column] = [bool(e.asset_mask & bit) for e in self.events]
+        return matrix
+
+    def take(self, indices: np.ndarray) -> "EventArrays":
+        """Subset of rows, in the given order."""
+        return EventArrays(
+            events=[self.events[i] for i in indices.tolist()],
+            times=self.times[indices],
+            tiers=self.tiers[indices],
+            categories=self.categories[indices],
+            impact_windows=self.impact_windows[indices],
+        )
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+
 class ImpactScorer:
+    TIER_IMPACTS: Dict[int, float] = {
+        1: 8.0,
+        2: 5.0,
+        3: 6.0,
+        4: 4.0,
+    }
+    DEFAULT_BASE_IMPACT = 5.0
+
     def __init__(self, config: Optional[Config] = None) -> None:
         self.config = config or Config()
         self.time_multipliers = self.config.time_multipliers
@@ -26,14 +117,109 @@ class ImpactScorer:
         raw_score = base_impact * time_multiplier * correlation_weight
         return self._clamp_score(raw_score)
 
+    def static_score(self, event: Event, asset: str) -> int:
+        """Score of an event that is still 24 hours or more away.
+
+        Beyond 24 hours the time multiplier is constant, so this is the score
+        calculate_score returns for any such current_time.
+        """
+        raw_score = (
+            self._get_base_impact(event)
+            * self.time_multipliers.get("24h_plus", 1.0)
+            * self._get_correlation_weight(event.category, asset)
+        )
+        return self._clamp_score(raw_score)
+
+    def score_events(
+        self,
+        events: Sequence[Event],
+        assets: Sequence[str],
+        current_time: Optional[datetime] = None,
+    ) -> np.ndarray:
+        """Score every event against every asset in one vectorized pass.
+
+        Returns:
+            int64 array of shape (len(events), len(assets)); entry [i, j] equals
+            calculate_score(events[i], assets[j], current_time).
+        """
+        arrays = EventArrays.from_events(events)
+        return self.score_matrix(
+            arrays.times,
+            arrays.tiers,
+            arrays.categories,
+            arrays.impact_windows,
+            assets,
+            current_time,
+        )
+
+    def score_matrix(
+        self,
+        event_times: np.ndarray,
+        tiers: np.ndarray,
+        categories: np.ndarray,
+        impact_windows: np.ndarray,
+        assets: Sequence[str],
+        current_time: Optional[datetime] = None,
+    ) -> np.ndarray:
+        """Vectorized calculate_score over arrays of events and a list of assets.
+
+        Args:
+            event_times: datetime64 array of scheduled times.
+            tiers: Array of tier values (1-4).
+            categories: Array of category codes (indexes into CATEGORIES).
+            impact_windows: timedelta64 array of impact windows.
+            assets: Asset symbols, one column each.
+            current_time: Reference time (defaults to now).
+
+        Returns:
+            int64 array of shape (events, assets) with the same rounding and
+            clamping as _clamp_score.
+        """
+        current_time = current_time or datetime.now()
+        if len(event_times) == 0:
+            return np.zeros((0, len(assets)), dtype=np.int64)
+
+        base_impact = self._base_impact_array(tiers)
+        time_multiplier = self._time_multiplier_array(event_times, impact_windows, current_time)
+        correlation = self._correlation_matrix(assets)[categories]
+
+        raw_scores = (base_impact * time_multiplier)[:, None] * correlation
+        return np.clip(np.rint(raw_scores), 1, 10).astype(np.int64)
+
+    def max_raw_scores(
+        self,
+        event_times: np.ndarray,
+        tiers: np.ndarray,
+        categories: np.ndarray,
+        impact_windows: np.ndarray,
+        asset: str,
+        times: np.ndarray,
+    ) -> np.ndarray:
+        """Highest unrounded score of any event for one asset at each of many times.
+
+        Rounding and clamping are monotonic, so applying them to the result
+        gives the highest calculate_score at each time.
+
+        Args:
+            event_times, tiers, categories, impact_windows: Event columns as
+                for score_matrix (at least one event).
+            asset: Asset to score against.
+            times: datetime64 array of reference times.
+
+        Returns:
+            float array with one entry per time.
+        """
+        base_impact = self._base_impact_array(tiers)
+        correlation = self._correlation_matrix([asset])[categories, 0]
+        time_multiplier = self._time_multiplier_array(
+            event_times, impact_windows, np.asarray(times, dtype="datetime64[us]")[:, None]
+        )
+        # Same operation order as score_matrix so rounding agrees exactly.
+        raw_scores = (base_impact[None, :] * time_multiplier) * correlation[None, :]
+        return raw_scores.max(axis=1)
+
     def _get_base_impact(self, event: Event) -> float:
-        tier_impacts: Dict[int, float] = {
-            1: 8.0,
-            2: 5.0,
-            3: 6.0,
-            4: 4.0,
-        }
-        return tier_impacts.get(event.tier.value, 5.0)
+        return self.TIER_IMPACTS.get(event.tier.value, self.DEFAULT_BASE_IMPACT)
 
     def _get_time_multiplier(self, event: Event, current_time: datetime) -> float:
         time_until_event = event.scheduled_time - current_time
@@ -64,3 +250,52 @@ class ImpactScorer:
     def _clamp_score(self, raw_score: float) -> int:
         clamped = max(1, min(10, round(raw_score)))
         return clamped
+
+    def _base_impact_array(self, tiers: np.ndarray) -> np.ndarray:
+        lookup = np.full(max(self.TIER_IMPACTS) + 1, self.DEFAULT_BASE_IMPACT)
+        for tier, impact in self.TIER_IMPACTS.items():
+            lookup[tier] = impact
+        tiers = np.asarray(tiers, dtype=np.int64)
+        in_range = (tiers >= 0) & (tiers < len(lookup))
+        return np.where(in_range, lookup[np.where(in_range, tiers, 0)], self.DEFAULT_BASE_IMPACT)
+
+    def _time_multiplier_array(
+        self,
+        event_times: np.ndarray,
+        impact_windows: np.ndarray,
+        current_time: Union[datetime, np.ndarray],
+    ) -> np.ndarray:
+        # Same arithmetic as timedelta.total_seconds() / 3600 so bucket edges agree.
+        now = np.asarray(current_time, dtype="datetime64[us]")
+        until_us = (np.asarray(event_times, dtype="datetime64[us]") - now).astype(np.int64)
+        impact_us = np.asarray(impact_windows, dtype="timedelta64[us]").astype(np.int64)
+        hours_until = until_us / 1e6 / 3600
+        impact_hours = impact_us / 1e6 / 3600
+
+        multipliers = self.time_multipliers
+        upcoming = np.select(
+            [hours_until < 1, hours_until < 4, hours_until < 12, hours_until < 24],
+            [
+                multipliers.get("under_1h", 2.0),
+                multipliers.get("1_to_4h", 1.8),
+                multipliers.get("4_to_12h", 1.5),
+                multipliers.get("12_to_24h", 1.2),
+            ],
+            default=multipliers.get("24h_plus", 1.0),
+        )
+        elapsed = np.where(
+            np.abs(hours_until) <= impact_hours,
+            multipliers.get("under_1h", 2.0),
+            0.0,
+        )
+        return np.where(hours_until < 0, elapsed, upcoming)
+
+    def _correlation_matrix(self, assets: Sequence[str]) -> np.ndarray:
+        """Categories x assets matrix of correlation weights."""
+        return np.array(
+            [
+                [self._get_correlation_weight(category, asset) for asset in assets]
+                for category in CATEGORIES
+            ],
+            dtype=np.float64,
+        ).reshape(len(CATEGORIES), len(assets))
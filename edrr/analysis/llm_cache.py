@@ -0,0 +1,133 @@
+import hashlib
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_llm_responses_created_at ON llm_responses(created_at);
+"""
+
+
+@dataclass
+class LLMCacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LLMResponseCache:
+    """Two-tier cache for LLM responses: an LRU dict in front of SQLite.
+
+    Entries are keyed by a hash of everything that determines the response,
+    so a change to the model, prompt or sampling settings is a clean miss.
+    The disk tier is optional and survives restarts.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: Optional[float] = 86400,
+        path: Optional[str] = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.path = path
+        self.stats = LLMCacheStats()
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        if path:
+            self._conn = sqlite3.connect(path)
+            self._conn.executescript(SCHEMA)
+
+    @staticmethod
+    def make_key(model: str, system: str, prompt: str, temperature: float) -> str:
+        payload = json.dumps([model, system, prompt, temperature], separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is not None:
+            if not self._expired(entry[1], now):
+                self._memory.move_to_end(key)
+                self.stats.memory_hits += 1
+                return entry[0]
+            del self._memory[key]
+
+        if self._conn is not None:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is not None and not self._expired(row[1], now):
+                self._remember(key, row[0], row[1])
+                self.stats.disk_hits += 1
+                return row[0]
+
+        self.stats.misses += 1
+        return None
+
+    def set(self, key: str, response: str) -> None:
+        created_at = time.time()
+        self._remember(key, response, created_at)
+        if self._conn is not None:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses (key, response, created_at) VALUES (?, ?, ?)",
+                    (key, response, created_at),
+                )
+
+    def prune_expired(self) -> int:
+        """Drop expired entries from both tiers.
+
+        Returns:
+            Number of disk entries deleted.
+        """
+        if self.ttl_seconds is None:
+            return 0
+        now = time.time()
+        for key in [k for k, (_, created) in self._memory.items() if self._expired(created, now)]:
+            del self._memory[key]
+        if self._conn is None:
+            return 0
+        with self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM llm_responses WHERE created_at <= ?",
+                (now - self.ttl_seconds,),
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at >= self.ttl_seconds
+
+    def _remember(self, key: str, response: str, created_at: float) -> None:
+        self._memory[key] = (response, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
@@ -1,21 +1,105 @@
 import asyncio
 import json
-from typing import Any, Dict, List, Optional
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
 
 import anthropic
 
+from edrr.analysis.circuit_breaker import CircuitBreaker, CircuitOpenError
+from edrr.analysis.llm_cache import LLMResponseCache
+from edrr.analysis.rate_limit import RateLimiter
+from edrr.metrics import REGISTRY
 from edrr.models.events import Event, EventCategory, EventTier
 
 
+SYSTEM_PROMPT = "You are a financial market analyst. Respond only with valid JSON."
+
+CLASSIFICATION_FIELDS = """1. "is_market_moving": boolean - true if this could significantly move markets
+2. "category": one of ["economic", "fed_speaker", "earnings", "geopolitical", "crypto", "regulatory"]
+3. "tier": integer 1-4 (1=highest impact, 4=lowest)
+4. "affected_assets": list of affected assets from ["SPY", "QQQ", "BTC", "GOLD", "ETH"]
+5. "impact_hours": estimated hours of market impact (1-48)
+6. "confidence": float 0-1 indicating classification confidence"""
+
+BATCH_CONTENT_CHARS = 300
+BATCH_TOKENS_PER_ITEM = 150
+
+RATE_LIMIT_STATUSES = {429, 529}  # Too Many Requests, Overloaded
+NON_RETRYABLE_STATUSES = {400, 401, 403, 404, 413, 422}
+
+LLM_REQUEST_SECONDS = REGISTRY.histogram(
+    "edrr_llm_request_seconds",
+    "Latency of individual LLM API requests",
+    ["outcome"],
+)
+
+
+@dataclass
+class LLMMetrics:
+    requests: int = 0
+    successes: int = 0
+    failures: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    short_circuited: int = 0
+    total_latency_seconds: float = 0.0
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=1000))
+
+    def record(self, latency: float, success: bool) -> None:
+        self.requests += 1
+        if success:
+            self.successes += 1
+        else:
+            self.failures += 1
+        self.total_latency_seconds += latency
+        self.latencies.append(latency)
+        LLM_REQUEST_SECONDS.labels("success" if success else "failure").observe(latency)
+
+    def latency_percentile(self, percentile: float) -> float:
+        """Latency at the given percentile (0-100) over recent requests."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+        return ordered[index]
+
+
 class LLMClient:
-    def __init__(self, api_key: Optional[str] = None, model: str = "claude-sonnet-4-20250514"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "claude-sonnet-4-20250514",
+        cache: Optional[LLMResponseCache] = None,
+        max_concurrency: int = 4,
+        requests_per_second: Optional[float] = 2.0,
+        batch_size: int = 20,
+        breaker_failure_threshold: int = 5,
+        breaker_reset_seconds: float = 60.0,
+        min_requests_per_second: float = 0.1,
+    ):
         self.api_key = api_key
         self.client: Optional[anthropic.AsyncAnthropic] = None
         if api_key:
-            self.client = anthropic.AsyncAnthropic(api_key=api_key)
+            # Retries are handled here so backoff and the breaker see every failure.
+            self.client = anthropic.AsyncAnthropic(api_key=api_key, max_retries=0)
         self.model = model
         self.max_retries = 3
         self.retry_delay = 1.0
+        self.max_retry_delay = 30.0
+        self.temperature = 0.3
+        self.cache = cache if cache is not None else LLMResponseCache()
+        self.batch_size = batch_size
+        self.rate_limiter = RateLimiter(
+            requests_per_second,
+            burst=max_concurrency,
+            min_rate_per_second=min_requests_per_second,
+        )
+        self.breaker = CircuitBreaker(breaker_failure_threshold, breaker_reset_seconds)
+        self.metrics = LLMMetrics()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
 
     async def analyze_event(self, event: Event) -> Dict[str, Any]:
         prompt = f"""Analyze the following market event and assess its potential impact:
@@ -36,7 +120,7 @@ Provide a JSON response with:
 
 Respond with valid JSON only."""
 
-        response = await self._call_with_retry(prompt)
+        response = await self._call_or_fallback(prompt)
         try:
             return json.loads(response)
         except json.JSONDecodeError:
@@ -55,52 +139,225 @@ Headline: {headline}
 Content: {content[:1000]}
 
 Classify and respond with valid JSON:
-1. "is_market_moving": boolean - true if this could significantly move markets
-2. "category": one of ["economic", "fed_speaker", "earnings", "geopolitical", "crypto", "regulatory"]
-3. "tier": integer 1-4 (1=highest impact, 4=lowest)
-4. "affected_assets": list of affected assets from ["SPY", "QQQ", "BTC", "GOLD", "ETH"]
-5. "impact_hours": estimated hours of market impact (1-48)
-6. "confidence": float 0-1 indicating classification confidence
+{CLASSIFICATION_FIELDS}
 
 Respond with valid JSON only."""
 
-        response = await self._call_with_retry(prompt)
+        response = await self._call_or_fallback(prompt)
         try:
-            result = json.loads(response)
-            if "category" in result:
-                result["category"] = EventCategory(result["category"])
-            if "tier" in result:
-                result["tier"] = EventTier(result["tier"])
-            return result
-        except (json.JSONDecodeError, ValueError):
-            return {
-                "is_market_moving": False,
-                "category": EventCategory.GEOPOLITICAL,
-                "tier": EventTier.TIER_3,
-                "affected_assets": [],
-                "impact_hours": 6,
-                "confidence": 0.0,
-            }
+            return self._normalize_classification(json.loads(response))
+        except (json.JSONDecodeError, ValueError, TypeError):
+            return self._default_classification()
+
+    async def classify_news_batch(
+        self,
+        articles: Sequence[Tuple[str, str]],
+        batch_size: Optional[int] = None,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Classify many (headline, content) pairs with as few requests as possible.
+
+        Articles are packed into prompts of `batch_size` items that each return
+        a JSON array. Batches run concurrently, bounded by the client's
+        semaphore and request rate. A batch whose reply cannot be parsed is
+        split in half and retried, down to single articles.
+
+        Returns:
+            One classification per article, in input order, or None for an
+            article whose request failed or whose reply could not be parsed.
+        """
+        size = max(1, batch_size or self.batch_size)
+        batches = [list(articles[i:i + size]) for i in range(0, len(articles), size)]
+        results = await asyncio.gather(*(self._classify_batch(batch) for batch in batches))
+        return [item for batch in results for item in batch]
+
+    async def _classify_batch(self, articles: List[Tuple[str, str]]) -> List[Optional[Dict[str, Any]]]:
+        if not articles:
+            return []
+        
+        items = "\n\n".join(
+            f"[{i}] Headline: {headline}\nContent: {content[:BATCH_CONTENT_CHARS]}"
+            for i, (headline, content) in enumerate(articles)
+        )
+        prompt = f"""Analyze each of these {len(articles)} news articles for market-moving potential:
+
+{items}
 
-    async def _call_with_retry(self, prompt: str) -> str:
-        if not self.client:
+Respond with a JSON array containing exactly one object per article, in the same order.
+Each object has "index" (the article number in brackets) and:
+{CLASSIFICATION_FIELDS}
+
+Respond with valid JSON only."""
+
+        try:
+            response = await self._call_with_retry(
+                prompt,
+                max_tokens=BATCH_TOKENS_PER_ITEM * len(articles) + 256,
+            )
+        except Exception:
+            # Retries are exhausted; splitting would only multiply failing requests.
+            return [None] * len(articles)
+        
+        parsed = self._parse_batch(response, len(articles))
+        if parsed is not None:
+            return parsed
+        
+        if len(articles) == 1:
+            return [None]
+        middle = len(articles) // 2
+        first, second = await asyncio.gather(
+            self._classify_batch(articles[:middle]),
+            self._classify_batch(articles[middle:]),
+        )
+        return first + second
+
+    def _parse_batch(self, response: str, expected: int) -> Optional[List[Optional[Dict[str, Any]]]]:
+        try:
+            data = json.loads(response)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(data, list) or len(data) != expected:
+            return None
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * expected
+        for position, item in enumerate(data):
+            if not isinstance(item, dict):
+                return None
+            index = item.pop("index", position)
+            if not isinstance(index, int) or not 0 <= index < expected or results[index] is not None:
+                return None
+            try:
+                results[index] = self._normalize_classification(item)
+            except (ValueError, TypeError):
+                return None
+        return results
+
+    def _normalize_classification(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        if "category" in result:
+            result["category"] = EventCategory(result["category"])
+        if "tier" in result:
+            result["tier"] = EventTier(result["tier"])
+        return result
+
+    def _default_classification(self) -> Dict[str, Any]:
+        return {
+            "is_market_moving": False,
+            "category": EventCategory.GEOPOLITICAL,
+            "tier": EventTier.TIER_3,
+            "affected_assets": [],
+            "impact_hours": 6,
+            "confidence": 0.0,
+        }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "requests": self.metrics.requests,
+            "successes": self.metrics.successes,
+            "failures": self.metrics.failures,
+            "retries": self.metrics.retries,
+            "rate_limited": self.metrics.rate_limited,
+            "short_circuited": self.metrics.short_circuited,
+            "latency_p50_seconds": self.metrics.latency_percentile(50),
+            "latency_p95_seconds": self.metrics.latency_percentile(95),
+            "breaker_state": self.breaker.state,
+            "requests_per_second": self.rate_limiter.rate_per_second,
+            "cache_hits": self.cache.stats.hits,
+            "cache_misses": self.cache.stats.misses,
+        }
+
+    async def _call_or_fallback(self, prompt: str) -> str:
+        # An open circuit yields an empty reply, which callers turn into their JSON fallback.
+        try:
+            return await self._call_with_retry(prompt)
+        except CircuitOpenError:
+            return ""
+
+    async def _call_with_retry(self, prompt: str, max_tokens: int = 1024) -> str:
+        client = self.client
+        if not client:
             raise RuntimeError("LLM client not configured - ANTHROPIC_API_KEY not set")
         
+        key = self.cache.make_key(self.model, SYSTEM_PROMPT, prompt, self.temperature)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
+        response = await self._request_with_retry(client, prompt, max_tokens)
+        if self._is_json(response):
+            # Unparseable replies fall back to defaults; don't pin them in the cache.
+            self.cache.set(key, response)
+        return response
+
+    def _is_json(self, response: str) -> bool:
+        try:
+            json.loads(response)
+        except json.JSONDecodeError:
+            return False
+        return True
+
+    async def _request_with_retry(
+        self,
+        client: anthropic.AsyncAnthropic,
+        prompt: str,
+        max_tokens: int = 1024,
+    ) -> str:
         last_error: Optional[Exception] = None
         for attempt in range(self.max_retries):
+            if not self.breaker.allow():
+                self.metrics.short_circuited += 1
+                raise CircuitOpenError(f"LLM circuit open after {self.breaker.consecutive_failures} failures")
+            
+            started = time.perf_counter()
             try:
-                response = await self.client.messages.create(
-                    model=self.model,
-                    max_tokens=1024,
-                    system="You are a financial market analyst. Respond only with valid JSON.",
-                    messages=[
-                        {"role": "user", "content": prompt},
-                    ],
-                    temperature=0.3,
-                )
-                return response.content[0].text if response.content else ""
+                async with self._semaphore:
+                    await self.rate_limiter.acquire()
+                    response = await client.messages.create(
+                        model=self.model,
+                        max_tokens=max_tokens,
+                        system=SYSTEM_PROMPT,
+                        messages=[
+                            {"role": "user", "content": prompt},
+                        ],
+                        temperature=self.temperature,
+                    )
             except Exception as e:
+                self.metrics.record(time.perf_counter() - started, success=False)
                 last_error = e
+                
+                status = getattr(e, "status_code", None)
+                if status in NON_RETRYABLE_STATUSES:
+                    # The request was at fault, not the service; leave the circuit alone.
+                    self.breaker.record_ignored()
+                    raise
+                self.breaker.record_failure()
+                retry_after = self._retry_after(e)
+                if status in RATE_LIMIT_STATUSES:
+                    self.metrics.rate_limited += 1
+                    self.rate_limiter.penalize(retry_after)
                 if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay * (attempt + 1))
+                    self.metrics.retries += 1
+                    await asyncio.sleep(self._backoff_delay(attempt, retry_after))
+                continue
+            
+            self.metrics.record(time.perf_counter() - started, success=True)
+            self.breaker.record_success()
+            self.rate_limiter.reward()
+            return response.content[0].text if response.content else ""
         raise last_error or Exception("Max retries exceeded")
+
+    def _backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Exponential backoff with full jitter, never shorter than a server Retry-After."""
+        ceiling = min(self.max_retry_delay, self.retry_delay * (2 ** attempt))
+        delay = random.uniform(0, ceiling)
+        if retry_after:
+            delay = max(delay, retry_after)
+        return delay
+
+    def _retry_after(self, error: Exception) -> Optional[float]:
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        if not headers:
+            return None
+        try:
+            return float(headers.get("retry-after"))
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,75 @@
+import asyncio
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """Async token bucket shared by every request a client makes.
+
+    Tokens refill at `rate_per_second` up to `burst`; each request takes
+    one. Waiters are served in arrival order.
+
+    The rate adapts to the server: `penalize()` halves it (never below
+    `min_rate_per_second`) and optionally pauses all callers for a
+    Retry-After period, while each `reward()` adds `recovery_step` back
+    until the configured rate is reached again.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: Optional[float],
+        burst: int = 1,
+        min_rate_per_second: float = 0.1,
+        recovery_step: float = 0.1,
+    ) -> None:
+        self.max_rate_per_second = rate_per_second
+        self.rate_per_second = rate_per_second
+        self.min_rate_per_second = min_rate_per_second
+        self.recovery_step = recovery_step
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if not self.rate_per_second and time.monotonic() >= self._paused_until:
+            return
+
+        async with self._lock:
+            pause = self._paused_until - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+            if not self.rate_per_second:
+                return
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate_per_second)
+
+    def penalize(self, retry_after: Optional[float] = None) -> None:
+        """Back off after a rate-limit or overload response."""
+        if self.rate_per_second:
+            self._refill()
+            self.rate_per_second = max(self.min_rate_per_second, self.rate_per_second / 2)
+            self._tokens = min(self._tokens, 0.0)
+        if retry_after:
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+
+    def reward(self) -> None:
+        """Recover toward the configured rate after a successful request."""
+        if self.rate_per_second and self.max_rate_per_second:
+            self._refill()
+            self.rate_per_second = min(
+                self.max_rate_per_second,
+                self.rate_per_second + self.recovery_step,
+            )
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        if self.rate_per_second:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate_per_second)
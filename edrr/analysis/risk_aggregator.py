@@ -1,10 +1,28 @@
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
+
+from edrr.models.assets import ASSET_REGISTRY
 from edrr.models.config import Config
 from edrr.models.events import AssetRisk, Event, RiskWindow
-from edrr.analysis.impact_scorer import ImpactScorer
+from edrr.analysis.asset_index import AssetEventIndex
+from edrr.analysis.breakpoints import DANGER_WINDOW_LEAD
+from edrr.analysis.event_index import EventIndex
+from edrr.analysis.impact_scorer import EventArrays, ImpactScorer
+from edrr.analysis.snapshot import RiskSnapshot
+from edrr.metrics import REGISTRY
+from edrr.storage.event_store import EventDiff
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+SCORING_SECONDS = REGISTRY.histogram(
+    "edrr_scoring_seconds",
+    "Time spent computing risk, by aggregator stage",
+    ["stage"],
+)
 
 
 @dataclass
@@ -14,6 +32,7 @@ class ClusterInfo:
     events: List[Event]
     compound_risk: int
     assets_affected: List[str]
+    asset: Optional[str] = None  # Set for per-asset clusters
 
 
 class RiskAggregator:
@@ -27,97 +46,240 @@ class RiskAggregator:
         self.config = config or Config()
         self.impact_scorer = impact_scorer or ImpactScorer(self.config)
         self.events: List[Event] = []
+        self.event_index = EventIndex()
+        self.asset_index = AssetEventIndex(self.impact_scorer)
+        self._events_by_id: Dict[str, Event] = {}
+        self.version = 0
+        self._snapshot: Optional[RiskSnapshot] = None
 
     def set_events(self, events: List[Event]) -> None:
         self.events = events
-
+        self.event_index = EventIndex(events)
+        self.asset_index = AssetEventIndex(self.impact_scorer, self.event_index.events)
+        self._events_by_id = {event.id: event for event in events}
+        self.version += 1
+
+    def apply_event_diff(self, diff: EventDiff, events: List[Event]) -> None:
+        """Update the indexes in place from a store diff instead of rebuilding.
+
+        Args:
+            diff: Added, changed and removed events since the last update.
+            events: The full current event list, kept as self.events.
+        """
+        for event in diff.removed + diff.changed:
+            previous = self._events_by_id.pop(event.id, None)
+            if previous is not None:
+                self.event_index.remove(previous)
+                self.asset_index.remove(previous)
+        for event in diff.added + diff.changed:
+            self._events_by_id[event.id] = event
+            self.event_index.add(event)
+            self.asset_index.add(event)
+        self.events = events
+        self.version += 1
+
+    def get_snapshot(self, current_time: Optional[datetime] = None) -> RiskSnapshot:
+        """Get the risk snapshot for the time bucket containing current_time.
+
+        A snapshot is computed at most once per (event-set version, time bucket)
+        and shared by every caller in that bucket.
+        """
+        key = self.snapshot_key(current_time)
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.key == key:
+            return snapshot
+
+        as_of = key[1]
+
+        snapshot = RiskSnapshot.build(
+            version=self.version,
+            as_of=as_of,
+            event_count=len(self.events),
+            asset_risks=self.get_current_risk(as_of),
+            danger_zones=self.get_danger_zones(as_of),
+            clusters=self.detect_clustering(as_of),
+            asset_clusters=self.detect_asset_clustering(as_of),
+        )
+        self._snapshot = snapshot
+        return snapshot
+
+    def snapshot_key(self, current_time: Optional[datetime] = None) -> Tuple[int, datetime]:
+        """(event-set version, bucket start) of the snapshot for current_time.
+
+        Cheap to compute, so callers can tell whether anything derived from the
+        snapshot is still current without building it.
+        """
+        return self.version, self._bucket_start(current_time or datetime.now())
+
+    def _bucket_start(self, current_time: datetime) -> datetime:
+        bucket = timedelta(seconds=self.config.snapshot_bucket_seconds)
+        return _EPOCH + (current_time - _EPOCH) // bucket * bucket
+
+    @SCORING_SECONDS.labels("get_current_risk").timed
     def get_current_risk(
         self,
         current_time: Optional[datetime] = None,
+        assets: Optional[Sequence[str]] = None,
     ) -> Dict[str, AssetRisk]:
+        """Current score, status and next event for each asset.
+
+        Args:
+            current_time: Reference time (defaults to now).
+            assets: Assets to report (defaults to DEFAULT_ASSETS).
+        """
         current_time = current_time or datetime.now()
         results: Dict[str, AssetRisk] = {}
 
-        for asset in self.DEFAULT_ASSETS:
-            max_score = 0
-            next_event: Optional[Event] = None
-            next_event_time: Optional[datetime] = None
-
-            for event in self.events:
-                if asset not in event.affected_assets:
-                    continue
-
-                score = self.impact_scorer.calculate_score(event, asset, current_time)
-                if score > max_score:
-                    max_score = score
-
-                if event.scheduled_time > current_time:
-                    if next_event_time is None or event.scheduled_time < next_event_time:
-                        next_event_time = event.scheduled_time
-                        next_event = event
-
-            status = self._get_status_for_score(max_score)
+        for asset in assets if assets is not None else self.DEFAULT_ASSETS:
+            max_score = self.asset_index.max_score(asset, current_time)
             results[asset] = AssetRisk(
                 asset=asset,
                 score=max_score,
-                status=status,
-                next_event=next_event,
+                status=self._get_status_for_score(max_score),
+                next_event=self.asset_index.next_event(asset, current_time),
             )
 
         return results
 
+    @SCORING_SECONDS.labels("get_risk_timeline").timed
+    def get_risk_timeline(
+        self,
+        times: Sequence[datetime],
+        assets: Optional[Sequence[str]] = None,
+    ) -> Dict[str, List[int]]:
+        """Scores for each asset at many reference times, batched per asset.
+
+        Args:
+            times: Reference times, in any order.
+            assets: Assets to score (defaults to DEFAULT_ASSETS).
+
+        Returns:
+            For each asset, one score per time, matching get_current_risk at that time.
+        """
+        return {
+            asset: self.asset_index.score_timeline(asset, times).tolist()
+            for asset in (assets if assets is not None else self.DEFAULT_ASSETS)
+        }
+
+    @SCORING_SECONDS.labels("detect_clustering").timed
     def detect_clustering(
         self,
         current_time: Optional[datetime] = None,
-        lookhead_hours: int = 24,
-        window_hours: int = 2,
+        lookhead_hours: Optional[int] = None,
+        window_hours: Optional[int] = None,
+        asset: Optional[str] = None,
     ) -> List[ClusterInfo]:
+        """Find windows where two or more upcoming events fall close together.
+
+        Args:
+            current_time: Reference time (defaults to now).
+            lookhead_hours: How far ahead to look (defaults to config).
+            window_hours: Width of a cluster window (defaults to config).
+            asset: Only consider events affecting this asset.
+
+        Returns:
+            Non-overlapping clusters in time order.
+        """
         current_time = current_time or datetime.now()
-        end_time = current_time + timedelta(hours=lookhead_hours)
-        clusters: List[ClusterInfo] = []
+        relevant_events = self._events_in_lookahead(current_time, lookhead_hours)
+        if asset is not None:
+            relevant_events = [e for e in relevant_events if e.affects(asset)]
 
-        relevant_events = [
-            e for e in self.events
-            if current_time <= e.scheduled_time <= end_time
-        ]
+        return self._find_clusters(relevant_events, current_time, window_hours, asset)
 
-        if not relevant_events:
-            return clusters
+    def detect_asset_clustering(
+        self,
+        current_time: Optional[datetime] = None,
+        lookhead_hours: Optional[int] = None,
+        window_hours: Optional[int] = None,
+        assets: Optional[Sequence[str]] = None,
+    ) -> Dict[str, List[ClusterInfo]]:
+        """Find clusters separately for each asset.
+
+        Returns:
+            Clusters keyed by asset (defaults to DEFAULT_ASSETS); assets with no
+            clusters map to an empty list.
+        """
+        current_time = current_time or datetime.now()
+        assets = list(assets) if assets is not None else self.DEFAULT_ASSETS
 
-        relevant_events.sort(key=lambda e: e.scheduled_time)
+        upcoming = self._events_in_lookahead(current_time, lookhead_hours)
+        per_asset: Dict[str, List[Event]] = {}
+        for asset in assets:
+            bit = ASSET_REGISTRY.lookup(asset)
+            per_asset[asset] = [e for e in upcoming if e.asset_mask & bit]
 
-        checked: set = set()
-        for event in relevant_events:
-            if event.id in checked:
-                continue
+        return {
+            asset: self._find_clusters(events, current_time, window_hours, asset)
+            for asset, events in per_asset.items()
+        }
 
-            window_start = event.scheduled_time
-            window_end = window_start + timedelta(hours=window_hours)
-            events_in_window = [
-                e for e in relevant_events
-                if window_start <= e.scheduled_time <= window_end
-            ]
+    def _events_in_lookahead(
+        self,
+        current_time: datetime,
+        lookhead_hours: Optional[int],
+    ) -> List[Event]:
+        if lookhead_hours is None:
+            lookhead_hours = self.config.cluster_lookahead_hours
+        end_time = current_time + timedelta(hours=lookhead_hours)
+        return self.event_index.between(current_time, end_time)
 
-            if len(events_in_window) >= 2:
-                for e in events_in_window:
-                    checked.add(e.id)
+    def _find_clusters(
+        self,
+        events: List[Event],
+        current_time: datetime,
+        window_hours: Optional[int],
+        asset: Optional[str] = None,
+    ) -> List[ClusterInfo]:
+        """Sliding-window scan over events already sorted by scheduled time.
+
+        Each window starts at the first event not yet part of a cluster and
+        spans window_hours; the right edge only ever moves forward, so the
+        scan is linear in the number of events.
+        """
+        if window_hours is None:
+            window_hours = self.config.cluster_window_hours
+        window = timedelta(hours=window_hours)
+        clusters: List[ClusterInfo] = []
 
+        count = len(events)
+        start = 0
+        end = 0
+        while start < count:
+            window_start = events[start].scheduled_time
+            window_end = window_start + window
+            end = max(end, start + 1)
+            while end < count and events[end].scheduled_time <= window_end:
+                end += 1
+
+            if end - start < 2:
+                start += 1
+                continue
+
+            events_in_window = events[start:end]
+            if asset is not None:
+                assets_affected = [asset]
+            else:
                 assets_affected = list(
                     set(a for e in events_in_window for a in e.affected_assets)
                 )
-                compound_risk = self._calculate_compound_risk(events_in_window)
-                clusters.append(
-                    ClusterInfo(
-                        window_start=window_start,
-                        window_end=window_end,
-                        events=events_in_window,
-                        compound_risk=compound_risk,
-                        assets_affected=assets_affected,
-                    )
+            clusters.append(
+                ClusterInfo(
+                    window_start=window_start,
+                    window_end=window_end,
+                    events=events_in_window,
+                    compound_risk=self._calculate_compound_risk(
+                        events_in_window, current_time, asset
+                    ),
+                    assets_affected=assets_affected,
+                    asset=asset,
                 )
+            )
+            start = end
 
         return clusters
 
+    @SCORING_SECONDS.labels("get_danger_zones").timed
     def get_danger_zones(
         self,
         current_time: Optional[datetime] = None,
@@ -139,22 +301,21 @@ class RiskAggregator:
         windows: List[RiskWindow] = []
         end_of_day = current_time.replace(hour=23, minute=59, second=59)
 
-        for event in self.events:
-            if current_time <= event.scheduled_time <= end_of_day:
-                window_start = event.scheduled_time - timedelta(minutes=30)
-                window_end = event.scheduled_time + event.impact_window
-                risk_level = self._calculate_event_risk_level(event)
+        for event in self.event_index.between(current_time, end_of_day):
+            window_start = event.scheduled_time - DANGER_WINDOW_LEAD
+            window_end = event.scheduled_time + event.impact_window
+            risk_level = self._calculate_event_risk_level(event, current_time)
 
-                if risk_level >= self.config.risk_thresholds.elevated:
-                    windows.append(
-                        RiskWindow(
-                            start_time=max(window_start, current_time),
-                            end_time=window_end,
-                            level=risk_level,
-                            events=[event],
-                            assets=event.affected_assets,
-                        )
+            if risk_level >= self.config.risk_thresholds.elevated:
+                windows.append(
+                    RiskWindow(
+                        start_time=max(window_start, current_time),
+                        end_time=window_end,
+                        level=risk_level,
+                        events=[event],
+                        assets=event.affected_assets,
                     )
+                )
 
         return windows
 
@@ -163,15 +324,14 @@ class RiskAggregator:
         end_of_week = current_time + timedelta(days=7)
         
         daily_events: Dict[str, List[Event]] = {}
-        for event in self.events:
-            if current_time <= event.scheduled_time <= end_of_week:
-                day_key = event.scheduled_time.strftime("%Y-%m-%d")
-                if day_key not in daily_events:
-                    daily_events[day_key] = []
-                daily_events[day_key].append(event)
+        for event in self.event_index.between(current_time, end_of_week):
+            day_key = event.scheduled_time.strftime("%Y-%m-%d")
+            if day_key not in daily_events:
+                daily_events[day_key] = []
+            daily_events[day_key].append(event)
 
         for day_key, events in daily_events.items():
-            daily_risk = self._calculate_compound_risk(events)
+            daily_risk = self._calculate_compound_risk(events, current_time)
             if daily_risk >= self.config.risk_thresholds.high:
                 day_start = datetime.strptime(day_key, "%Y-%m-%d")
                 day_end = day_start.replace(hour=23, minute=59, second=59)
@@ -195,13 +355,10 @@ class RiskAggregator:
         week_start = current_time
         while week_start < end_of_month:
             week_end = week_start + timedelta(days=7)
-            week_events = [
-                e for e in self.events
-                if week_start <= e.scheduled_time < week_end
-            ]
+            week_events = self.event_index.between(week_start, week_end, include_end=False)
 
             if week_events:
-                weekly_risk = self._calculate_compound_risk(week_events)
+                weekly_risk = self._calculate_compound_risk(week_events, current_time)
                 if weekly_risk >= self.config.risk_thresholds.danger:
                     all_assets = list(set(a for e in week_events for a in e.affected_assets))
                     windows.append(
@@ -231,21 +388,54 @@ class RiskAggregator:
         else:
             return "normal"
 
-    def _calculate_event_risk_level(self, event: Event) -> int:
-        max_score = 0
-        for asset in event.affected_assets:
-            score = self.impact_scorer.calculate_score(event, asset)
-            max_score = max(max_score, score)
-        return max_score
+    def score_events(
+        self,
+        events: Sequence[Event],
+        current_time: Optional[datetime] = None,
+        asset: Optional[str] = None,
+    ) -> List[int]:
+        """Score each event as its highest score across its affected assets.
+
+        Args:
+            events: Events to score.
+            current_time: Reference time (defaults to now).
+            asset: Only score against this asset.
+
+        Returns:
+            One score per event, 0 for events with no (matching) affected assets.
+        """
+        if not events:
+            return []
 
-    def _calculate_compound_risk(self, events: List[Event]) -> int:
+        arrays = EventArrays.from_events(events)
+        if asset is not None:
+            assets = [asset]
+        else:
+            assets = sorted({a for e in events for a in e.affected_assets})
+        scores = self.impact_scorer.score_matrix(
+            arrays.times,
+            arrays.tiers,
+            arrays.categories,
+            arrays.impact_windows,
+            assets,
+            current_time,
+        )
+        affected = arrays.affected_matrix(assets)
+        return np.where(affected, scores, 0).max(axis=1, initial=0).tolist()
+
+    def _calculate_event_risk_level(self, event: Event, current_time: datetime) -> int:
+        return self.score_events([event], current_time)[0]
+
+    def _calculate_compound_risk(
+        self,
+        events: List[Event],
+        current_time: datetime,
+        asset: Optional[str] = None,
+    ) -> int:
         if not events:
             return 0
 
-        max_base = 0
-        for event in events:
-            base_score = self._calculate_event_risk_level(event)
-            max_base = max(max_base, base_score)
+        max_base = max(self.score_events(events, current_time, asset))
 
         cluster_bonus = min(3, len(events) - 1)
         compound = min(10, max_base + cluster_bonus)
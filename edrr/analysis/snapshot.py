@@ -0,0 +1,59 @@
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Tuple
+
+from edrr.models.events import AssetRisk, Event, RiskWindow
+
+if TYPE_CHECKING:
+    from edrr.analysis.risk_aggregator import ClusterInfo
+
+
+@dataclass(frozen=True)
+class RiskSnapshot:
+    """Immutable view of all computed risk for one event-set version and time bucket.
+
+    Alerts, the API, the calendar and the CLI all read from the same snapshot,
+    so outputs produced within one tick are consistent with each other.
+    """
+
+    version: int
+    as_of: datetime
+    event_count: int
+    asset_risks: Mapping[str, AssetRisk]
+    danger_zones: Mapping[str, Tuple[RiskWindow, ...]]
+    clusters: Tuple["ClusterInfo", ...]
+    asset_clusters: Mapping[str, Tuple["ClusterInfo", ...]]
+
+    @classmethod
+    def build(
+        cls,
+        version: int,
+        as_of: datetime,
+        event_count: int,
+        asset_risks: Dict[str, AssetRisk],
+        danger_zones: Dict[str, List[RiskWindow]],
+        clusters: List["ClusterInfo"],
+        asset_clusters: Dict[str, List["ClusterInfo"]],
+    ) -> "RiskSnapshot":
+        return cls(
+            version=version,
+            as_of=as_of,
+            event_count=event_count,
+            asset_risks=MappingProxyType(dict(asset_risks)),
+            danger_zones=MappingProxyType(
+                {name: tuple(windows) for name, windows in danger_zones.items()}
+            ),
+            clusters=tuple(clusters),
+            asset_clusters=MappingProxyType(
+                {asset: tuple(found) for asset, found in asset_clusters.items()}
+            ),
+        )
+
+    @property
+    def key(self) -> Tuple[int, datetime]:
+        return (self.version, self.as_of)
+
+    @property
+    def next_events(self) -> Dict[str, Optional[Event]]:
+        return {asset: risk.next_event for asset, risk in self.asset_risks.items()}
@@ -1,56 +1,110 @@
-from datetime import datetime
-from typing import Any, Dict, Optional
+import json
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from aiohttp import web
 
 from edrr.models.config import Config
 from edrr.models.events import AssetRisk
+from edrr.models.serialization import asset_risk_to_dict
 from edrr.analysis.risk_aggregator import RiskAggregator
 from edrr.outputs.calendar_view import CalendarView
 from edrr.outputs.recommendations import RecommendationEngine
+from edrr.api.response_cache import CachedResponse, ResponseCache, etag_matches, make_etag
+from edrr.api.shared_snapshot import ResponseKey, SharedSnapshotReader, SnapshotBusyError
+from edrr.api.stream import StreamBroker, sse_frame
+from edrr.metrics import CACHE_ENTRIES, PROMETHEUS_CONTENT_TYPE, REGISTRY
+
+
+API_REQUEST_SECONDS = REGISTRY.histogram(
+    "edrr_api_request_seconds",
+    "API request latency by route",
+    ["method", "route", "status"],
+)
+STREAM_SUBSCRIBERS = REGISTRY.gauge("edrr_stream_subscribers", "Open /stream connections")
 
 
 class EDRRApi:
+    """REST API over a risk aggregator.
+
+    With a snapshot_reader, the API runs in an API worker process: risk,
+    recommendation and calendar responses come pre-rendered from the
+    engine's shared snapshot, and the routes that need the live event set
+    (/risk/timeline, /stream) are not served. Nor is /metrics: the engine
+    serves every worker's metrics from its own port (see edrr.api.workers).
+    """
+
     def __init__(
         self,
         risk_aggregator: Optional[RiskAggregator] = None,
         config: Optional[Config] = None,
+        stream_broker: Optional[StreamBroker] = None,
+        snapshot_reader: Optional[SharedSnapshotReader] = None,
     ) -> None:
         self.config = config or Config()
         self.risk_aggregator = risk_aggregator or RiskAggregator(self.config)
+        self.stream_broker = stream_broker or StreamBroker(self.config.stream_queue_size)
+        self.snapshot_reader = snapshot_reader
         self.calendar_view = CalendarView(self.risk_aggregator, self.config)
         self.recommendation_engine = RecommendationEngine(self.config)
+        self.response_cache = ResponseCache()
+        self._renderers: Dict[str, Callable[[Optional[str], datetime], Tuple[int, Dict[str, Any]]]] = {
+            "risk": self._render_risk,
+            "recommendation": self._render_recommendation,
+            "calendar/today": self._render_calendar_today,
+            "calendar/week": self._render_calendar_week,
+        }
+        CACHE_ENTRIES.labels("api_responses").track(self.response_cache, len)
+        STREAM_SUBSCRIBERS.labels().track(self.stream_broker, lambda broker: broker.subscriber_count)
 
     def create_app(self) -> web.Application:
-        app = web.Application()
+        app = web.Application(middlewares=[self._metrics_middleware])
         app.router.add_get("/risk", self.get_current_risk)
         app.router.add_get("/risk/{asset}", self.get_current_risk)
+        if self.snapshot_reader is None:
+            app.router.add_post("/risk/timeline", self.get_risk_timeline)
+            app.router.add_get("/stream", self.stream)
         app.router.add_get("/calendar", self.get_calendar)
         app.router.add_get("/calendar/today", self.get_calendar_today)
         app.router.add_get("/calendar/week", self.get_calendar_week)
         app.router.add_get("/recommendation", self.get_recommendation)
         app.router.add_get("/recommendation/{asset}", self.get_recommendation)
         app.router.add_get("/health", self.health_check)
+        if self.snapshot_reader is None:
+            app.router.add_get("/metrics", self.get_metrics)
+        app.on_shutdown.append(self._close_streams)
         return app
 
     async def get_current_risk(self, request: web.Request) -> web.Response:
         asset = request.match_info.get("asset")
-        current_time = datetime.now()
-        risks = self.risk_aggregator.get_current_risk(current_time)
+        asset = asset.upper() if asset else None
+        return self._cached_json(request, "risk", asset)
 
-        if asset:
-            asset = asset.upper()
-            if asset not in risks:
-                return web.json_response(
-                    {"error": f"Unknown asset: {asset}"},
-                    status=404,
-                )
-            risk = risks[asset]
-            return web.json_response(self._serialize_asset_risk(risk))
+    async def get_risk_timeline(self, request: web.Request) -> web.Response:
+        """Scores for many assets at many reference times in one request.
+
+        The JSON body gives "assets" (default: all) and either "timestamps",
+        a list of ISO datetimes, or "start", "end" and "step_minutes".
+        """
+        try:
+            body = await request.json()
+            if not isinstance(body, dict):
+                raise ValueError("request body must be a JSON object")
+            assets = [str(a).upper() for a in body.get("assets") or self.risk_aggregator.DEFAULT_ASSETS]
+            times = self._parse_timeline_times(body)
+        except KeyError as e:
+            return web.json_response({"error": f"Missing field: {e.args[0]}"}, status=400)
+        except (ValueError, TypeError) as e:
+            return web.json_response({"error": str(e)}, status=400)
+
+        unknown = [a for a in assets if a not in self.risk_aggregator.DEFAULT_ASSETS]
+        if unknown:
+            return web.json_response({"error": f"Unknown asset: {', '.join(unknown)}"}, status=400)
 
         return web.json_response({
-            asset: self._serialize_asset_risk(risk)
-            for asset, risk in risks.items()
+            "timestamps": [t.isoformat() for t in times],
+            "scores": self.risk_aggregator.get_risk_timeline(times, assets),
         })
 
     async def get_calendar(self, request: web.Request) -> web.Response:
@@ -60,52 +114,258 @@ class EDRRApi:
         return await self.get_calendar_today(request)
 
     async def get_calendar_today(self, request: web.Request) -> web.Response:
-        current_time = datetime.now()
-        calendar_text = self.calendar_view.generate_today(current_time)
-        return web.json_response({
-            "view": "today",
-            "date": current_time.strftime("%Y-%m-%d"),
-            "calendar": calendar_text,
-        })
+        return self._cached_json(request, "calendar/today", None)
 
     async def get_calendar_week(self, request: web.Request) -> web.Response:
-        current_time = datetime.now()
-        calendar_text = self.calendar_view.generate_week(current_time)
-        return web.json_response({
-            "view": "week",
-            "start_date": current_time.strftime("%Y-%m-%d"),
-            "calendar": calendar_text,
-        })
+        return self._cached_json(request, "calendar/week", None)
 
     async def get_recommendation(self, request: web.Request) -> web.Response:
         asset = request.match_info.get("asset")
-        current_time = datetime.now()
-        risks = self.risk_aggregator.get_current_risk(current_time)
+        asset = asset.upper() if asset else None
+        return self._cached_json(request, "recommendation", asset)
 
-        if asset:
-            asset = asset.upper()
-            if asset not in risks:
-                return web.json_response(
-                    {"error": f"Unknown asset: {asset}"},
-                    status=404,
-                )
-            risk = risks[asset]
-            recommendation = self.recommendation_engine.get_recommendation(risk)
-            return web.json_response(self._serialize_recommendation(recommendation))
+    async def stream(self, request: web.Request) -> web.StreamResponse:
+        """Server-Sent Events stream of risk changes, alerts and new events.
 
-        recommendations = self.recommendation_engine.get_all_recommendations(risks)
-        return web.json_response({
-            asset: self._serialize_recommendation(rec)
-            for asset, rec in recommendations.items()
-        })
+        Query parameters:
+            assets: Comma-separated symbols to receive (default: all).
+            min_severity: Skip messages below this severity (default: 0).
+
+        The stream opens with the current risk of each matching asset. A
+        client that falls behind loses its oldest queued messages and is told
+        how many with a "dropped" event.
+        """
+        assets = [a.strip().upper() for a in request.query.get("assets", "").split(",") if a.strip()]
+        try:
+            min_severity = int(request.query.get("min_severity", "0"))
+        except ValueError:
+            return web.json_response({"error": "min_severity must be an integer"}, status=400)
+
+        subscription = self.stream_broker.subscribe(assets, min_severity)
+        response = web.StreamResponse(
+            headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"},
+        )
+        try:
+            await response.prepare(request)
+            risks = self.risk_aggregator.get_snapshot(datetime.now()).asset_risks
+            for asset, risk in risks.items():
+                if subscription.assets is None or asset in subscription.assets:
+                    await response.write(sse_frame("risk", asset_risk_to_dict(risk)))
+
+            reported_drops = 0
+            while True:
+                message = await subscription.get(self.config.stream_heartbeat_seconds)
+                if subscription.closed:
+                    break
+                if subscription.dropped > reported_drops:
+                    await response.write(
+                        sse_frame("dropped", {"count": subscription.dropped - reported_drops})
+                    )
+                    reported_drops = subscription.dropped
+                if message is None:
+                    await response.write(b": keepalive\n\n")
+                else:
+                    await response.write(message.encode())
+        except ConnectionResetError:
+            pass
+        finally:
+            self.stream_broker.unsubscribe(subscription)
+        return response
+
+    async def _close_streams(self, app: web.Application) -> None:
+        # Stream handlers otherwise wait for the client, holding up runner.cleanup().
+        self.stream_broker.close_all()
+
+    async def get_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(
+            body=REGISTRY.render().encode(),
+            headers={"Content-Type": PROMETHEUS_CONTENT_TYPE},
+        )
+
+    @web.middleware
+    async def _metrics_middleware(self, request: web.Request, handler: Callable) -> web.StreamResponse:
+        # Label by route template (/risk/{asset}), not by path, to bound cardinality.
+        resource = request.match_info.route.resource
+        route = resource.canonical if resource is not None else "unmatched"
+        started = time.perf_counter()
+        status = 500
+        try:
+            response = await handler(request)
+            status = response.status
+            return response
+        except web.HTTPException as e:
+            status = e.status
+            raise
+        finally:
+            # Long-lived /stream connections would swamp the latency buckets.
+            if route != "/stream":
+                API_REQUEST_SECONDS.labels(request.method, route, str(status)).observe(
+                    time.perf_counter() - started
+                )
 
     async def health_check(self, request: web.Request) -> web.Response:
+        if self.snapshot_reader is not None:
+            self.snapshot_reader.refresh()
+            events_loaded = self.snapshot_reader.events_loaded
+        else:
+            events_loaded = len(self.risk_aggregator.events)
         return web.json_response({
             "status": "healthy",
             "timestamp": datetime.now().isoformat(),
-            "events_loaded": len(self.risk_aggregator.events),
+            "events_loaded": events_loaded,
         })
 
+    def render_responses(
+        self,
+        current_time: Optional[datetime] = None,
+    ) -> Tuple[Tuple[int, datetime], Dict[ResponseKey, CachedResponse]]:
+        """Every cacheable response for the current snapshot generation.
+
+        Used by the engine to publish a shared snapshot for API workers.
+        Returns the generation and the responses keyed by (route, asset).
+        """
+        generation = self.risk_aggregator.snapshot_key(current_time)
+        responses: Dict[ResponseKey, CachedResponse] = {}
+        for route in self._renderers:
+            assets: List[Optional[str]] = [None]
+            if route in ("risk", "recommendation"):
+                assets.extend(self.risk_aggregator.DEFAULT_ASSETS)
+            for asset in assets:
+                responses[(route, asset)] = self._cached_response(generation, route, asset)
+        return generation, responses
+
+    def _cached_response(
+        self,
+        generation: Tuple[int, datetime],
+        route: str,
+        asset: Optional[str],
+    ) -> CachedResponse:
+        key = (route, asset)
+        cached = self.response_cache.get(generation, key)
+        if cached is None:
+            status, payload = self._renderers[route](asset, generation[1])
+            body = json.dumps(payload).encode()
+            cached = CachedResponse(status=status, body=body, etag=make_etag(body))
+            self.response_cache.set(generation, key, cached)
+        return cached
+
+    def _cached_json(
+        self,
+        request: web.Request,
+        route: str,
+        asset: Optional[str],
+    ) -> web.Response:
+        """Serve a JSON response rendered at most once per snapshot generation.
+
+        Successful responses carry a strong ETag, and a matching If-None-Match
+        gets 304 Not Modified without a body.
+        """
+        current_time = datetime.now()
+        if self.snapshot_reader is not None:
+            try:
+                cached = self.snapshot_reader.get(route, asset)
+            except SnapshotBusyError:
+                return web.json_response(
+                    {"error": "Risk snapshot is being updated"},
+                    status=503,
+                    headers={"Retry-After": "1"},
+                )
+            if cached is None:
+                if self.snapshot_reader.version == 0:
+                    return web.json_response({"error": "Risk snapshot not published yet"}, status=503)
+                # Only assets the engine tracks are published.
+                return web.json_response({"error": f"Unknown asset: {asset}"}, status=404)
+            as_of = self.snapshot_reader.as_of
+            assert as_of is not None  # Set by the read that returned cached
+        else:
+            generation = self.risk_aggregator.snapshot_key(current_time)
+            cached = self._cached_response(generation, route, asset)
+            as_of = generation[1]
+
+        if cached.status != 200:
+            return web.Response(status=cached.status, body=cached.body, content_type="application/json")
+
+        headers = {
+            "ETag": cached.etag,
+            "Cache-Control": self._cache_control(as_of, current_time),
+        }
+        if etag_matches(request.headers.get("If-None-Match"), cached.etag):
+            return web.Response(status=304, headers=headers)
+        return web.Response(
+            status=200,
+            body=cached.body,
+            content_type="application/json",
+            headers=headers,
+        )
+
+    def _parse_timeline_times(self, body: Dict[str, Any]) -> List[datetime]:
+        max_points = self.config.timeline_max_points
+        if "timestamps" in body:
+            times = [datetime.fromisoformat(t) for t in body["timestamps"]]
+        else:
+            start = datetime.fromisoformat(body["start"])
+            end = datetime.fromisoformat(body["end"])
+            step = timedelta(minutes=float(body["step_minutes"]))
+            if step <= timedelta(0):
+                raise ValueError("step_minutes must be positive")
+            if end < start:
+                raise ValueError("end must not be before start")
+            count = (end - start) // step + 1
+            if count > max_points:
+                raise ValueError(f"at most {max_points} timestamps per request")
+            times = [start + step * i for i in range(count)]
+        if len(times) > max_points:
+            raise ValueError(f"at most {max_points} timestamps per request")
+        if any(t.tzinfo is not None for t in times):
+            raise ValueError("timestamps must be naive local times")
+        return times
+
+    def _cache_control(self, as_of: datetime, current_time: datetime) -> str:
+        # Fresh until the snapshot bucket ends; clients revalidate after that.
+        bucket_end = as_of + timedelta(seconds=self.config.snapshot_bucket_seconds)
+        max_age = max(0, int((bucket_end - current_time).total_seconds()))
+        return f"max-age={max_age}, must-revalidate"
+
+    def _render_risk(self, asset: Optional[str], as_of: datetime) -> Tuple[int, Dict[str, Any]]:
+        risks = self.risk_aggregator.get_snapshot(as_of).asset_risks
+        if asset:
+            if asset not in risks:
+                return 404, {"error": f"Unknown asset: {asset}"}
+            return 200, self._serialize_asset_risk(risks[asset])
+
+        return 200, {
+            name: self._serialize_asset_risk(risk)
+            for name, risk in risks.items()
+        }
+
+    def _render_recommendation(self, asset: Optional[str], as_of: datetime) -> Tuple[int, Dict[str, Any]]:
+        risks = self.risk_aggregator.get_snapshot(as_of).asset_risks
+        if asset:
+            if asset not in risks:
+                return 404, {"error": f"Unknown asset: {asset}"}
+            recommendation = self.recommendation_engine.get_recommendation(risks[asset])
+            return 200, self._serialize_recommendation(recommendation)
+
+        recommendations = self.recommendation_engine.get_all_recommendations(risks)
+        return 200, {
+            name: self._serialize_recommendation(rec)
+            for name, rec in recommendations.items()
+        }
+
+    def _render_calendar_today(self, asset: Optional[str], as_of: datetime) -> Tuple[int, Dict[str, Any]]:
+        return 200, {
+            "view": "today",
+            "date": as_of.strftime("%Y-%m-%d"),
+            "calendar": self.calendar_view.generate_today(as_of),
+        }
+
+    def _render_calendar_week(self, asset: Optional[str], as_of: datetime) -> Tuple[int, Dict[str, Any]]:
+        return 200, {
+            "view": "week",
+            "start_date": as_of.strftime("%Y-%m-%d"),
+            "calendar": self.calendar_view.generate_week(as_of),
+        }
+
     def _serialize_asset_risk(self, risk: AssetRisk) -> Dict[str, Any]:
         result: Dict[str, Any] = {
             "asset": risk.asset,
@@ -139,8 +399,25 @@ class EDRRApi:
 def create_api(
     risk_aggregator: Optional[RiskAggregator] = None,
     config: Optional[Config] = None,
+    stream_broker: Optional[StreamBroker] = None,
 ) -> EDRRApi:
-    return EDRRApi(risk_aggregator, config)
+    return EDRRApi(risk_aggregator, config, stream_broker)
+
+
+async def start_server(
+    api: EDRRApi,
+    host: str = "0.0.0.0",
+    port: int = 8080,
+) -> web.AppRunner:
+    """Serve the API on the running event loop and return its runner.
+
+    Call `await runner.cleanup()` to stop it.
+    """
+    runner = web.AppRunner(api.create_app())
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    return runner
 
 
 def run_server(
@@ -0,0 +1,69 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Hashable, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    status: int
+    body: bytes
+    etag: str
+
+
+def make_etag(body: bytes) -> str:
+    """Strong entity tag for a response body."""
+    return '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches etag (weak comparison, RFC 9110)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class ResponseCache:
+    """Rendered API responses for the current snapshot generation.
+
+    Entries are keyed by (route, asset) within one generation, the
+    (event-set version, time bucket) pair of the risk snapshot. Moving to a
+    new generation drops every entry, so the cache never holds more than one
+    response per route and asset.
+    """
+
+    def __init__(self) -> None:
+        self._generation: Optional[Tuple[int, datetime]] = None
+        self._entries: Dict[Hashable, CachedResponse] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, generation: Tuple[int, datetime], key: Hashable) -> Optional[CachedResponse]:
+        if generation != self._generation:
+            self._generation = generation
+            self._entries.clear()
+        cached = self._entries.get(key)
+        if cached is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return cached
+
+    def set(self, generation: Tuple[int, datetime], key: Hashable, response: CachedResponse) -> None:
+        if generation == self._generation:
+            self._entries[key] = response
+
+    def clear(self) -> None:
+        self._generation = None
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
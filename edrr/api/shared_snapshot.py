@@ -0,0 +1,202 @@
+import json
+import mmap
+import os
+import struct
+from datetime import datetime
+from typing import Dict, Mapping, Optional, Tuple
+
+from edrr.api.response_cache import CachedResponse
+
+
+MAGIC = b"EDRRSNP1"
+DEFAULT_CAPACITY = 1024 * 1024
+# Attempts to get a consistent read before falling back to the previous version.
+MAX_READ_ATTEMPTS = 1000
+
+# File layout: magic | sequence | fields | index JSON | response bodies.
+# The sequence is odd while a publish is in progress (a seqlock): readers
+# retry until they see the same even value before and after reading.
+_SEQUENCE = struct.Struct("<Q")
+_SEQUENCE_OFFSET = len(MAGIC)
+_FIELDS = struct.Struct("<QQdQ")  # index length, bodies length, as_of, events loaded
+_FIELDS_OFFSET = _SEQUENCE_OFFSET + _SEQUENCE.size
+HEADER_SIZE = _FIELDS_OFFSET + _FIELDS.size
+
+ResponseKey = Tuple[str, Optional[str]]  # (route, asset)
+
+
+class SnapshotBusyError(Exception):
+    """Raised when no consistent read was possible because publishes kept overlapping it."""
+
+
+class SharedSnapshotWriter:
+    """Publishes rendered API responses to a memory-mapped file.
+
+    The engine process owns the writer and publishes once per snapshot
+    generation; API worker processes map the same file with a
+    SharedSnapshotReader. The file grows when a snapshot outgrows it.
+    Publishing the same responses again is a no-op, so readers keep their
+    copies and the sequence only moves when something changed.
+    """
+
+    def __init__(self, path: str, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.path = path
+        self._file = open(path, "w+b")
+        self._file.truncate(max(capacity, HEADER_SIZE))
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self._map[:HEADER_SIZE] = MAGIC + bytes(HEADER_SIZE - len(MAGIC))
+        self._sequence = 0
+        self._published: Optional[Tuple[bytes, int]] = None
+
+    @property
+    def version(self) -> int:
+        return self._sequence // 2
+
+    def publish(
+        self,
+        responses: Mapping[ResponseKey, CachedResponse],
+        as_of: datetime,
+        events_loaded: int,
+    ) -> int:
+        """Write responses as the next version and return the current version.
+
+        Nothing is written when every response (by ETag, status and size)
+        and the event count match the last publish.
+        """
+        index = []
+        offset = 0
+        for (route, asset), response in responses.items():
+            index.append([route, asset, response.status, response.etag, offset, len(response.body)])
+            offset += len(response.body)
+        index_bytes = json.dumps(index).encode()
+        if self._published == (index_bytes, events_loaded):
+            return self.version
+        size = HEADER_SIZE + len(index_bytes) + offset
+        if size > len(self._map):
+            self._grow(size)
+
+        self._set_sequence(self._sequence + 1)
+        position = HEADER_SIZE
+        self._map[position:position + len(index_bytes)] = index_bytes
+        position += len(index_bytes)
+        for response in responses.values():
+            self._map[position:position + len(response.body)] = response.body
+            position += len(response.body)
+        _FIELDS.pack_into(
+            self._map, _FIELDS_OFFSET, len(index_bytes), offset, as_of.timestamp(), events_loaded
+        )
+        self._set_sequence(self._sequence + 1)
+        self._published = (index_bytes, events_loaded)
+        return self.version
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def _set_sequence(self, sequence: int) -> None:
+        self._sequence = sequence
+        _SEQUENCE.pack_into(self._map, _SEQUENCE_OFFSET, sequence)
+
+    def _grow(self, size: int) -> None:
+        # Readers with a shorter mapping remap when a header points past its end.
+        self._map.close()
+        self._file.truncate(max(size, 2 * os.fstat(self._file.fileno()).st_size))
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+
+class SharedSnapshotReader:
+    """Serves responses published by a SharedSnapshotWriter in another process.
+
+    Checking for a new version reads eight bytes of the mapping in place.
+    A body is copied out the first time it is requested, and kept only if
+    the sequence did not move while copying, so a concurrent publish can
+    never produce a torn response. Copies whose ETag is unchanged carry
+    over to the next version.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not an EDRR snapshot file")
+        self._sequence = 0
+        self._index: Dict[ResponseKey, Tuple[int, str, int, int]] = {}
+        self._responses: Dict[ResponseKey, CachedResponse] = {}
+        self._bodies_offset = HEADER_SIZE
+        self.as_of: Optional[datetime] = None
+        self.events_loaded = 0
+
+    @property
+    def version(self) -> int:
+        """Version currently loaded; 0 until the first publish is seen."""
+        return self._sequence // 2
+
+    def refresh(self) -> bool:
+        """Load the latest published version; False if nothing is published yet."""
+        for _ in range(MAX_READ_ATTEMPTS):
+            sequence = self._read_sequence()
+            if sequence == self._sequence:
+                break
+            if sequence % 2:
+                continue
+            index_length, bodies_length, as_of, events_loaded = _FIELDS.unpack_from(
+                self._map, _FIELDS_OFFSET
+            )
+            if HEADER_SIZE + index_length + bodies_length > len(self._map):
+                self._remap()
+            index_bytes = self._map[HEADER_SIZE:HEADER_SIZE + index_length]
+            if self._read_sequence() != sequence:
+                continue
+            self._index = {
+                (route, asset): (status, etag, offset, length)
+                for route, asset, status, etag, offset, length in json.loads(index_bytes)
+            }
+            self._responses = {
+                key: cached
+                for key, cached in self._responses.items()
+                if key in self._index and self._index[key][1] == cached.etag
+            }
+            self._bodies_offset = HEADER_SIZE + index_length
+            self._sequence = sequence
+            self.as_of = datetime.fromtimestamp(as_of)
+            self.events_loaded = events_loaded
+            break
+        return self._sequence > 0
+
+    def get(self, route: str, asset: Optional[str] = None) -> Optional[CachedResponse]:
+        """Response for (route, asset) in the latest version, or None if absent.
+
+        Raises:
+            SnapshotBusyError: The body could not be copied without a
+                publish overlapping every attempt.
+        """
+        key = (route, asset)
+        for _ in range(MAX_READ_ATTEMPTS):
+            if not self.refresh():
+                return None
+            cached = self._responses.get(key)
+            if cached is not None:
+                return cached
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            status, etag, offset, length = entry
+            start = self._bodies_offset + offset
+            body = self._map[start:start + length]
+            if self._read_sequence() != self._sequence:
+                continue
+            cached = self._responses[key] = CachedResponse(status=status, body=body, etag=etag)
+            return cached
+        raise SnapshotBusyError(f"{route} changed during {MAX_READ_ATTEMPTS} read attempts")
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def _read_sequence(self) -> int:
+        return _SEQUENCE.unpack_from(self._map, _SEQUENCE_OFFSET)[0]
+
+    def _remap(self) -> None:
+        self._map.close()
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
@@ -0,0 +1,142 @@
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Optional, Sequence, Set
+
+
+def sse_frame(kind: str, data: Dict[str, Any], message_id: Optional[int] = None) -> bytes:
+    """Encode one Server-Sent Events frame."""
+    prefix = f"id: {message_id}\n" if message_id is not None else ""
+    return f"{prefix}event: {kind}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+# Queued by Subscription.close() to wake a waiting reader; never returned.
+_CLOSED = object()
+
+
+@dataclass(frozen=True)
+class StreamMessage:
+    id: int
+    kind: str  # "risk", "alert" or "event"
+    data: Dict[str, Any]
+    assets: FrozenSet[str]
+    severity: int
+
+    def encode(self) -> bytes:
+        return sse_frame(self.kind, self.data, self.id)
+
+
+class Subscription:
+    """One client's filtered, bounded view of the stream.
+
+    When the client falls behind and its queue is full, the oldest queued
+    message is dropped to make room, so a slow reader sees the most recent
+    state and never holds up the publisher or other clients.
+    """
+
+    def __init__(
+        self,
+        assets: Optional[Sequence[str]] = None,
+        min_severity: int = 0,
+        max_queue: int = 256,
+    ) -> None:
+        self.assets: Optional[FrozenSet[str]] = (
+            frozenset(a.upper() for a in assets) if assets else None
+        )
+        self.min_severity = min_severity
+        self.dropped = 0
+        self.closed = False
+        self._queue: "asyncio.Queue[StreamMessage]" = asyncio.Queue(maxsize=max(1, max_queue))
+
+    def wants(self, message: StreamMessage) -> bool:
+        if message.severity < self.min_severity:
+            return False
+        if self.assets is None or not message.assets:
+            return True
+        return not self.assets.isdisjoint(message.assets)
+
+    def offer(self, message: StreamMessage) -> None:
+        if self.closed or not self.wants(message):
+            return
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(message)
+
+    def close(self) -> None:
+        """End the subscription, waking a reader blocked in get()."""
+        if self.closed:
+            return
+        self.closed = True
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(_CLOSED)  # type: ignore[arg-type]
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[StreamMessage]:
+        """Next message, or None if none arrives within timeout seconds.
+
+        Also None once the subscription is closed; check `closed`.
+        """
+        if not self._queue.empty():
+            message = self._queue.get_nowait()
+        else:
+            try:
+                message = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        return None if message is _CLOSED else message
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+
+class StreamBroker:
+    """Fans risk changes, alerts and new events out to stream subscribers.
+
+    Publishing never blocks: each subscriber has its own bounded queue.
+    """
+
+    def __init__(self, max_queue: int = 256) -> None:
+        self.max_queue = max_queue
+        self.published = 0
+        self._subscribers: Set[Subscription] = set()
+
+    def subscribe(
+        self,
+        assets: Optional[Sequence[str]] = None,
+        min_severity: int = 0,
+    ) -> Subscription:
+        subscription = Subscription(assets, min_severity, self.max_queue)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscribers.discard(subscription)
+
+    def close_all(self) -> None:
+        """Close every subscription so open streams end, e.g. on server shutdown."""
+        for subscription in list(self._subscribers):
+            subscription.close()
+
+    def publish(
+        self,
+        kind: str,
+        data: Dict[str, Any],
+        assets: Sequence[str] = (),
+        severity: int = 0,
+    ) -> StreamMessage:
+        self.published += 1
+        message = StreamMessage(
+            id=self.published,
+            kind=kind,
+            data=data,
+            assets=frozenset(assets),
+            severity=severity,
+        )
+        for subscription in self._subscribers:
+            subscription.offer(message)
+        return message
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
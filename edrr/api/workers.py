@@ -0,0 +1,178 @@
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+from multiprocessing.process import BaseProcess
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from aiohttp import web
+
+from edrr.models.config import Config
+from edrr.api.endpoints import EDRRApi
+from edrr.api.shared_snapshot import SharedSnapshotReader
+from edrr.metrics import PROMETHEUS_CONTENT_TYPE, REGISTRY, MetricsDump
+
+
+# How often each worker writes its metrics for the engine's /metrics to merge.
+METRICS_EXPORT_SECONDS = 5.0
+
+# Workers only serve requests; everything else is measured in the engine.
+WORKER_METRICS = ("edrr_api_request_seconds",)
+
+
+def _export_metrics(path: str) -> None:
+    # Write then rename, so the engine never reads a partial file.
+    temporary = f"{path}.tmp"
+    with open(temporary, "w") as f:
+        json.dump(REGISTRY.dump(WORKER_METRICS), f)
+    os.replace(temporary, path)
+
+
+def run_worker(
+    snapshot_path: str,
+    host: str,
+    port: int,
+    config: Optional[Config] = None,
+    metrics_path: Optional[str] = None,
+    metrics_export_seconds: float = METRICS_EXPORT_SECONDS,
+) -> None:
+    """Serve the API from a shared snapshot file until SIGINT or SIGTERM.
+
+    With metrics_path, the worker's WORKER_METRICS are written there every
+    metrics_export_seconds and once more on shutdown.
+    """
+    reader = SharedSnapshotReader(snapshot_path)
+    api = EDRRApi(config=config, snapshot_reader=reader)
+    app = api.create_app()
+
+    if metrics_path is not None:
+        tasks: List[asyncio.Task] = []
+
+        async def export_loop() -> None:
+            while True:
+                _export_metrics(metrics_path)
+                await asyncio.sleep(metrics_export_seconds)
+
+        async def start_export(app: web.Application) -> None:
+            tasks.append(asyncio.create_task(export_loop()))
+
+        async def stop_export(app: web.Application) -> None:
+            for task in tasks:
+                task.cancel()
+            _export_metrics(metrics_path)
+
+        app.on_startup.append(start_export)
+        app.on_cleanup.append(stop_export)
+
+    try:
+        web.run_app(app, host=host, port=port, reuse_port=True, print=None)
+    finally:
+        reader.close()
+
+
+class ApiWorkerPool:
+    """API worker processes sharing one port through SO_REUSEPORT.
+
+    The kernel spreads incoming connections across the workers, and each
+    worker answers from the snapshot the engine publishes with a
+    SharedSnapshotWriter, so serving scales with cores while events are
+    still fetched and scored once, in the engine process.
+
+    Workers export their metrics to files next to the snapshot; the
+    engine serves its own metrics together with every worker's, labelled
+    by worker, from start_metrics_server().
+    """
+
+    def __init__(
+        self,
+        snapshot_path: str,
+        workers: int,
+        host: str = "0.0.0.0",
+        port: int = 8080,
+        config: Optional[Config] = None,
+        metrics_export_seconds: float = METRICS_EXPORT_SECONDS,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.snapshot_path = snapshot_path
+        self.workers = workers
+        self.host = host
+        self.port = port
+        self.config = config or Config()
+        self.metrics_export_seconds = metrics_export_seconds
+        self._processes: List[BaseProcess] = []
+
+    def start(self) -> None:
+        if not hasattr(socket, "SO_REUSEPORT"):
+            raise RuntimeError("API workers need SO_REUSEPORT, which this platform lacks")
+        # Spawn rather than fork: the parent is running an event loop and threads.
+        context = multiprocessing.get_context("spawn")
+        for i in range(self.workers):
+            process = context.Process(
+                target=run_worker,
+                args=(
+                    self.snapshot_path,
+                    self.host,
+                    self.port,
+                    self.config,
+                    self.metrics_path(i),
+                    self.metrics_export_seconds,
+                ),
+                name=f"edrr-api-{i}",
+                daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.kill()
+                process.join()
+        self._processes = []
+        for i in range(self.workers):
+            for path in (self.metrics_path(i), f"{self.metrics_path(i)}.tmp"):
+                if os.path.exists(path):
+                    os.unlink(path)
+
+    def alive_count(self) -> int:
+        return sum(1 for process in self._processes if process.is_alive())
+
+    def metrics_path(self, worker: int) -> str:
+        return f"{self.snapshot_path}.worker-{worker}.json"
+
+    def collect_metrics(self) -> List[Tuple[Mapping[str, str], MetricsDump]]:
+        """Latest exported metrics of each worker, as (labels, dump) pairs."""
+        collected: List[Tuple[Mapping[str, str], MetricsDump]] = []
+        for i in range(self.workers):
+            try:
+                with open(self.metrics_path(i)) as f:
+                    dump: Dict = json.load(f)
+            except (OSError, ValueError):
+                continue  # Not exported yet
+            collected.append(({"worker": str(i)}, dump))
+        return collected
+
+    async def start_metrics_server(self, host: str = "0.0.0.0", port: int = 8081) -> web.AppRunner:
+        """Serve this process's metrics and the workers' on GET /metrics.
+
+        Call `await runner.cleanup()` to stop it.
+        """
+
+        async def get_metrics(request: web.Request) -> web.Response:
+            return web.Response(
+                body=REGISTRY.render(self.collect_metrics()).encode(),
+                headers={"Content-Type": PROMETHEUS_CONTENT_TYPE},
+            )
+
+        app = web.Application()
+        app.router.add_get("/metrics", get_metrics)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, host, port).start()
+        return runner
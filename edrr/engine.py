@@ -1,28 +1,105 @@
-from datetime import datetime
-from typing import Dict, List, Optional
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from edrr.models.config import Config
 from edrr.models.events import AssetRisk, Event
+from edrr.models.serialization import asset_risk_to_dict, event_to_dict
 from edrr.sources.base import EventSource
 from edrr.sources.economic_calendar import EconomicCalendarSource
 from edrr.sources.fed_calendar import FedCalendarSource
 from edrr.sources.earnings_calendar import EarningsCalendarSource
 from edrr.sources.news_monitor import NewsMonitorSource
 from edrr.sources.crypto_events import CryptoEventsSource
+from edrr.sources.http_client import HTTPClient
 from edrr.analysis.impact_scorer import ImpactScorer
 from edrr.analysis.risk_aggregator import RiskAggregator
+from edrr.analysis.snapshot import RiskSnapshot
+from edrr.analysis.llm_cache import LLMResponseCache
 from edrr.analysis.llm_client import LLMClient
 from edrr.outputs.calendar_view import CalendarView
-from edrr.outputs.alerts import AlertManager
+from edrr.outputs.alerts import Alert, AlertManager
 from edrr.outputs.recommendations import RecommendationEngine
+from edrr.api.endpoints import EDRRApi
+from edrr.api.shared_snapshot import SharedSnapshotWriter
+from edrr.api.stream import StreamBroker
+from edrr.metrics import CACHE_ENTRIES, REGISTRY
 from edrr.scheduler import Scheduler
+from edrr.storage.cache import Cache, create_cache
+from edrr.storage.event_store import EventDiff, EventStore
+from edrr.storage.sqlite_store import SQLiteEventStore
+
+
+SOURCE_FETCH_SECONDS = REGISTRY.histogram(
+    "edrr_source_fetch_seconds",
+    "Time taken by each source fetch",
+    ["source", "status"],
+)
+ALERTS_SENT = REGISTRY.counter("edrr_alerts", "Alerts dispatched", ["alert_type"])
+EVENTS_LOADED = REGISTRY.gauge("edrr_events_loaded", "Events currently tracked")
+ALERT_DEDUP_ENTRIES = REGISTRY.gauge(
+    "edrr_alert_dedup_entries",
+    "Entries kept to avoid repeating alerts",
+    ["kind"],
+)
+
+
+@dataclass
+class SourceFetchStats:
+    source: str
+    status: str  # "ok", "cached", "timeout" or "error"
+    elapsed_seconds: float
+    event_count: int
+    fetched_at: datetime
+    error: Optional[str] = None
 
 
 class RiskRadarEngine:
-    def __init__(self, config: Optional[Config] = None) -> None:
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        cache: Optional[Cache] = None,
+    ) -> None:
         self.config = config or Config()
         self._running = False
         self._events: List[Event] = []
+        self.event_store = EventStore()
+        self._source_stats: Dict[str, SourceFetchStats] = {}
+        self.cache = cache or create_cache(self.config)
+        self.persistent_store: Optional[SQLiteEventStore] = (
+            SQLiteEventStore(self.config.event_db_path) if self.config.event_db_path else None
+        )
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._last_full_fetch: Optional[datetime] = None
+        self.snapshot_writer: Optional[SharedSnapshotWriter] = None
+        self._snapshot_api: Optional[EDRRApi] = None
+        self._shared_snapshot_task: Optional[asyncio.Task] = None
+        self._recalculations = 0
+        self._shared_snapshot_key: Optional[Tuple[int, int, date]] = None
+        
+        self.http_client = HTTPClient(
+            max_connections=self.config.http_max_connections,
+            max_connections_per_host=self.config.http_max_connections_per_host,
+            timeout_seconds=self.config.http_timeout_seconds,
+            max_response_bytes=self.config.http_max_response_bytes,
+        )
+        
+        self.llm_client = LLMClient(
+            api_key=self.config.anthropic_api_key,
+            cache=LLMResponseCache(
+                max_entries=self.config.llm_cache_max_entries,
+                ttl_seconds=self.config.llm_cache_ttl_seconds,
+                path=self.config.llm_cache_path,
+            ),
+            max_concurrency=self.config.llm_max_concurrency,
+            requests_per_second=self.config.llm_requests_per_second,
+            batch_size=self.config.llm_batch_size,
+            breaker_failure_threshold=self.config.llm_breaker_failure_threshold,
+            breaker_reset_seconds=self.config.llm_breaker_reset_seconds,
+            min_requests_per_second=self.config.llm_min_requests_per_second,
+        )
         
         self._sources: List[EventSource] = [
             EconomicCalendarSource(),
@@ -31,17 +108,20 @@ class RiskRadarEngine:
             NewsMonitorSource(
                 api_key=self.config.news_api_key,
                 api_url="https://newsapi.org/v2/everything",
+                http_client=self.http_client,
+                llm_client=self.llm_client,
             ),
             CryptoEventsSource(),
         ]
         
         self.impact_scorer = ImpactScorer(self.config)
         self.risk_aggregator = RiskAggregator(self.config, self.impact_scorer)
-        self.llm_client = LLMClient(api_key=self.config.anthropic_api_key)
         
         self.calendar_view = CalendarView(self.risk_aggregator, self.config)
         self.alert_manager = AlertManager(self.risk_aggregator, self.config)
         self.recommendation_engine = RecommendationEngine(self.config)
+        self.stream_broker = StreamBroker(self.config.stream_queue_size)
+        self._streamed_scores: Dict[str, int] = {}
         
         self.scheduler = Scheduler(
             config=self.config,
@@ -49,73 +129,306 @@ class RiskRadarEngine:
             on_news_monitor=self._on_news_monitor,
             on_risk_recalculate=self._on_risk_recalculate,
         )
+        self._register_gauges()
+
+    def _register_gauges(self) -> None:
+        # Read lazily when /metrics is rendered, so they cost nothing otherwise.
+        EVENTS_LOADED.labels().track(self.event_store, len)
+        CACHE_ENTRIES.labels("llm_responses").track(self.llm_client.cache, len)
+        for kind in self.alert_manager.dedup_counts():
+            ALERT_DEDUP_ENTRIES.labels(kind).track(
+                self.alert_manager,
+                lambda manager, kind=kind: manager.dedup_counts()[kind],
+            )
 
     async def start(self) -> None:
         if self._running:
             return
         
-        await self._fetch_all_events()
+        if self._fetched_recently():
+            pass  # e.g. run_check just fetched; the scheduled polls take over
+        elif len(self.event_store) > 0 or self.warm_start():
+            # Serve loaded events now; sources catch up in the background.
+            self._refresh_task = asyncio.create_task(self._on_calendar_poll())
+        else:
+            await self._fetch_all_events()
         self.scheduler.start()
+        if self.snapshot_writer is not None:
+            self._shared_snapshot_task = asyncio.create_task(self._publish_shared_snapshot_loop())
         self._running = True
 
-    def stop(self) -> None:
-        if not self._running:
-            return
+    async def stop(self) -> None:
+        if self._running:
+            self.scheduler.stop()
+            self._running = False
         
-        self.scheduler.stop()
-        self._running = False
+        for task in (self._refresh_task, self._shared_snapshot_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        
+        if self.snapshot_writer is not None:
+            self.snapshot_writer.close()
+            self.snapshot_writer = None
+        await self.http_client.close()
+        await self.cache.close()
+        if self.persistent_store is not None:
+            self.persistent_store.close()
+        self.llm_client.cache.close()
 
     def is_running(self) -> bool:
         return self._running
 
-    async def _fetch_all_events(self) -> None:
-        all_events: List[Event] = []
-        for source in self._sources:
+    async def _fetch_all_events(self) -> EventDiff:
+        results = await asyncio.gather(
+            *(self._fetch_source(source) for source in self._sources)
+        )
+
+        diff = EventDiff()
+        for source, events in zip(self._sources, results):
+            if events is not None:
+                diff.extend(self._store_source_events(source, events))
+        
+        self._apply_event_diff(diff)
+        self._last_full_fetch = datetime.now()
+        return diff
+
+    def _fetched_recently(self) -> bool:
+        """Whether this engine fetched every source within the calendar poll interval."""
+        if self._last_full_fetch is None:
+            return False
+        age = (datetime.now() - self._last_full_fetch).total_seconds()
+        return age < self.config.calendar_poll_interval_seconds
+
+    def _store_source_events(self, source: EventSource, events: List[Event]) -> EventDiff:
+        name = source.get_source_name()
+        if not source.incremental:
+            diff = self.event_store.replace_source(name, events)
+        else:
+            diff = self.event_store.merge_source(name, events)
+            diff.extend(self.event_store.prune_expired(name, datetime.now()))
+        
+        if self.persistent_store is not None:
+            self.persistent_store.apply_diff(name, diff, fetched_at=datetime.now())
+        return diff
+
+    def warm_start(self, current_time: Optional[datetime] = None) -> bool:
+        """Load events persisted by an earlier run so outputs can be served before fetching.
+
+        Returns:
+            True if any persisted events were loaded.
+        """
+        if self.persistent_store is None:
+            return False
+        
+        self.persistent_store.prune_expired(current_time or datetime.now())
+        diff = EventDiff()
+        for name, events in self.persistent_store.load().items():
+            diff.extend(self.event_store.replace_source(name, events))
+        self._apply_event_diff(diff)
+        return len(self.event_store) > 0
+
+    def persisted_is_fresh(self, current_time: Optional[datetime] = None) -> bool:
+        """Whether every source was fetched within the calendar poll interval."""
+        if self.persistent_store is None:
+            return False
+        
+        current_time = current_time or datetime.now()
+        fetched = self.persistent_store.last_fetched()
+        max_age = self.config.calendar_poll_interval_seconds
+        return all(
+            source.get_source_name() in fetched
+            and (current_time - fetched[source.get_source_name()]).total_seconds() < max_age
+            for source in self._sources
+        )
+
+    def _apply_event_diff(self, diff: EventDiff) -> None:
+        if diff.is_empty():
+            return
+        
+        self._events = self.event_store.get_events()
+        self.risk_aggregator.apply_event_diff(diff, self._events)
+        self.scheduler.apply_event_diff(diff, self._events)
+        self.alert_manager.apply_event_diff(diff)
+        self._stream_new_events(diff.added)
+        self.publish_shared_snapshot()
+
+    async def _fetch_source(self, source: EventSource) -> Optional[List[Event]]:
+        """Fetch a single source under its deadline and record how long it took.
+
+        Non-incremental sources are served from a shared cache while another
+        process's fetch is still fresh, and successful fetches are written back.
+
+        Returns:
+            The fetched events, or None if the source timed out or failed.
+        """
+        name = source.get_source_name()
+        started = time.perf_counter()
+        use_cache = self.cache.shared and not source.incremental
+        if use_cache:
+            cached = await self.cache.get_source_events(name)
+            if cached is not None:
+                self._record_source_stats(name, "cached", started, cached)
+                return cached
+
+        events: Optional[List[Event]] = None
+        error: Optional[str] = None
+        try:
+            events = await asyncio.wait_for(
+                source.fetch_events(),
+                timeout=self.config.source_timeout_seconds,
+            )
+            status = "ok"
+        except asyncio.TimeoutError:
+            status = "timeout"
+            error = f"timed out after {self.config.source_timeout_seconds}s"
+        except Exception as e:
+            status = "error"
+            error = f"{type(e).__name__}: {e}"
+
+        if events is not None and not source.incremental:
+            await self.cache.set_source_events(name, events, self.config.source_cache_ttl_seconds)
+
+        self._record_source_stats(name, status, started, events, error)
+        return events
+
+    def _record_source_stats(
+        self,
+        name: str,
+        status: str,
+        started: float,
+        events: Optional[List[Event]],
+        error: Optional[str] = None,
+    ) -> None:
+        elapsed = time.perf_counter() - started
+        SOURCE_FETCH_SECONDS.labels(name, status).observe(elapsed)
+        self._source_stats[name] = SourceFetchStats(
+            source=name,
+            status=status,
+            elapsed_seconds=elapsed,
+            event_count=len(events) if events is not None else 0,
+            fetched_at=datetime.now(),
+            error=error,
+        )
+
+    def share_snapshot(self, path: str) -> SharedSnapshotWriter:
+        """Publish rendered API responses to a memory-mapped file at path.
+
+        API worker processes (see edrr.api.workers) serve from that file.
+        Responses are re-rendered when the event set changes, at each score
+        breakpoint and when the date rolls over; the file is only rewritten
+        when one of them changed.
+        """
+        self.snapshot_writer = SharedSnapshotWriter(path)
+        self._snapshot_api = self.create_api()
+        self.publish_shared_snapshot()
+        return self.snapshot_writer
+
+    def publish_shared_snapshot(self, current_time: Optional[datetime] = None) -> None:
+        if self.snapshot_writer is None or self._snapshot_api is None:
+            return
+        current_time = current_time or datetime.now()
+        # Bodies only change with the event set, at score breakpoints (each of
+        # which runs _on_risk_recalculate) and with the calendar date.
+        key = (self.risk_aggregator.version, self._recalculations, current_time.date())
+        if key == self._shared_snapshot_key:
+            return
+        (_, as_of), responses = self._snapshot_api.render_responses(current_time)
+        self.snapshot_writer.publish(responses, as_of, len(self._events))
+        self._shared_snapshot_key = key
+
+    async def _publish_shared_snapshot_loop(self) -> None:
+        # Breakpoints and event changes publish as they happen; this only
+        # catches the date rollover, and each tick is a key comparison.
+        interval = max(
+            1,
+            self.config.snapshot_bucket_seconds,
+            self.config.shared_snapshot_interval_seconds,
+        )
+        while True:
+            await asyncio.sleep(interval - time.time() % interval + 0.001)
             try:
-                events = await source.fetch_events()
-                all_events.extend(events)
+                self.publish_shared_snapshot()
             except Exception:
-                pass
-        
-        self._events = all_events
-        self.risk_aggregator.set_events(all_events)
-        self.scheduler.set_events(all_events)
+                pass  # Workers keep serving the previous version
 
     async def _on_calendar_poll(self) -> None:
         await self._fetch_all_events()
-        alerts = self.alert_manager.check_thresholds()
-        for alert in alerts:
-            self.alert_manager.send_alert(alert)
+        self._dispatch_alerts(self.alert_manager.check_thresholds())
+        self._stream_risk_changes()
 
     async def _on_news_monitor(self) -> None:
         try:
             news_source = self._sources[3]
-            new_events = await news_source.fetch_events()
+            new_events = await self._fetch_source(news_source)
+            if new_events is None:
+                return
             
-            existing_ids = {e.id for e in self._events}
-            for event in new_events:
-                if event.id not in existing_ids:
-                    self._events.append(event)
+            diff = self._store_source_events(news_source, new_events)
+            self._apply_event_diff(diff)
             
-            self.risk_aggregator.set_events(self._events)
-            self.scheduler.set_events(self._events)
-            
-            alerts = self.alert_manager.check_thresholds()
-            for alert in alerts:
-                self.alert_manager.send_alert(alert)
+            self._dispatch_alerts(self.alert_manager.check_thresholds())
+            self._stream_risk_changes()
         except Exception:
             pass
 
-    async def _on_risk_recalculate(self) -> None:
-        alerts = self.alert_manager.check_thresholds()
+    async def _on_risk_recalculate(self, assets: Optional[Sequence[str]] = None) -> None:
+        """Recheck risk, limited to the given assets when only their scores moved."""
+        if assets is None:
+            alerts = self.alert_manager.check_thresholds()
+        else:
+            alerts = self.alert_manager.check_asset_thresholds(assets)
+        self._dispatch_alerts(alerts)
+        self._stream_risk_changes(assets)
+        self._recalculations += 1
+        self.publish_shared_snapshot()
+
+    def _dispatch_alerts(self, alerts: List[Alert]) -> None:
         for alert in alerts:
             self.alert_manager.send_alert(alert)
+            ALERTS_SENT.labels(alert.alert_type.value).inc()
+            self.stream_broker.publish("alert", alert.to_dict(), alert.assets, alert.severity)
+
+    def _stream_risk_changes(self, assets: Optional[Sequence[str]] = None) -> None:
+        """Push a message for each asset whose score changed since the last push."""
+        for asset, risk in self.risk_aggregator.get_current_risk(datetime.now(), assets).items():
+            previous = self._streamed_scores.get(asset)
+            if previous == risk.score:
+                continue
+            self._streamed_scores[asset] = risk.score
+            data = asset_risk_to_dict(risk)
+            data["previous_score"] = previous
+            # Severity covers both levels so high-severity subscribers also see de-escalations.
+            self.stream_broker.publish("risk", data, [asset], max(risk.score, previous or 0))
+
+    def _stream_new_events(self, events: List[Event]) -> None:
+        if not events or not self.stream_broker.subscriber_count:
+            return
+        scores = self.risk_aggregator.score_events(events, datetime.now())
+        for event, score in zip(events, scores):
+            self.stream_broker.publish("event", event_to_dict(event), event.affected_assets, score)
+
+    def get_snapshot(self, current_time: Optional[datetime] = None) -> RiskSnapshot:
+        return self.risk_aggregator.get_snapshot(current_time)
+
+    def create_api(self) -> EDRRApi:
+        """API that serves this engine's live state from the same event loop.
+
+        Handlers read the aggregator's current RiskSnapshot, which is immutable
+        and replaced by a single attribute assignment. Event updates are applied
+        without awaiting, so a request never sees a half-applied change and no
+        locks are needed.
+        """
+        return EDRRApi(self.risk_aggregator, self.config, self.stream_broker)
 
     def get_status(
         self,
         current_time: Optional[datetime] = None,
     ) -> Dict[str, AssetRisk]:
-        return self.risk_aggregator.get_current_risk(current_time)
+        return dict(self.get_snapshot(current_time).asset_risks)
 
     def get_calendar_today(self, current_time: Optional[datetime] = None) -> str:
         return self.calendar_view.generate_today(current_time)
@@ -125,3 +438,6 @@ class RiskRadarEngine:
 
     def get_events(self) -> List[Event]:
         return self._events
+
+    def get_source_stats(self) -> Dict[str, SourceFetchStats]:
+        return dict(self._source_stats)
@@ -2,14 +2,18 @@
 
 import argparse
 import asyncio
+import os
 import signal
 import sys
+import tempfile
 from typing import Optional
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
+from edrr.api.endpoints import start_server
+from edrr.api.workers import ApiWorkerPool
 from edrr.engine import RiskRadarEngine
 from edrr.models.config import Config
 
@@ -31,27 +35,61 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Filter by asset (e.g., SPY, QQQ, BTC, GOLD)",
     )
+    parser.add_argument(
+        "--api",
+        action="store_true",
+        help="In daemon mode, also serve the REST API from the same process",
+    )
+    parser.add_argument(
+        "--api-host",
+        type=str,
+        default="0.0.0.0",
+        help="Address for the embedded API to listen on (default: 0.0.0.0)",
+    )
+    parser.add_argument(
+        "--api-port",
+        type=int,
+        default=8080,
+        help="Port for the embedded API (default: 8080)",
+    )
+    parser.add_argument(
+        "--api-workers",
+        type=int,
+        default=0,
+        help="Serve the API from N worker processes sharing --api-port instead of "
+        "the daemon process; /stream and /risk/timeline are not served (default: 0)",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="With --api-workers, port for the daemon's /metrics, which includes "
+        "every worker's metrics (default: --api-port + 1)",
+    )
     return parser.parse_args()
 
 
 async def run_check(engine: RiskRadarEngine, asset: Optional[str] = None) -> None:
-    await engine._fetch_all_events()
+    warm = engine.warm_start()
+    if not warm:
+        await engine._fetch_all_events()
+    snapshot = engine.get_snapshot()
     
     print("\n" + "=" * 60)
     print("EVENT-DRIVEN RISK RADAR - STATUS CHECK")
     print("=" * 60)
     
-    print("\n" + engine.get_calendar_today())
+    print("\n" + engine.get_calendar_today(snapshot.as_of))
     print("\n" + "-" * 60)
     print("WEEK AHEAD")
     print("-" * 60)
-    print(engine.get_calendar_week())
+    print(engine.get_calendar_week(snapshot.as_of))
     
     print("\n" + "-" * 60)
     print("CURRENT RISK STATUS")
     print("-" * 60)
     
-    status = engine.get_status()
+    status = dict(snapshot.asset_risks)
     
     if asset:
         asset_upper = asset.upper()
@@ -74,6 +112,26 @@ async def run_check(engine: RiskRadarEngine, asset: Optional[str] = None) -> Non
         rec = engine.recommendation_engine.get_recommendation(risk)
         formatted = engine.recommendation_engine.format_recommendation(rec)
         print(formatted)
+    
+    print("\n" + "-" * 60)
+    print("SOURCE FETCH TIMES")
+    print("-" * 60)
+    
+    if warm:
+        # Output above came from the event store; refresh it for the next run.
+        if engine.persisted_is_fresh():
+            print("  Served from event store (all sources fresh)")
+            return
+        print("  Served from event store, refreshing sources...")
+        await engine._fetch_all_events()
+    
+    source_stats = sorted(
+        engine.get_source_stats().values(),
+        key=lambda s: s.elapsed_seconds,
+        reverse=True,
+    )
+    for stats in source_stats:
+        _print_source_stats(stats)
 
 
 def _print_asset_risk(asset_name: str, risk) -> None:
@@ -85,7 +143,22 @@ def _print_asset_risk(asset_name: str, risk) -> None:
     print(f"  {asset_name:6} | Score: {score:4.1f} | Status: {status_str:10}{next_event_str}")
 
 
-async def run_daemon(engine: RiskRadarEngine, asset: Optional[str] = None) -> None:
+def _print_source_stats(stats) -> None:
+    error_str = f" | {stats.error}" if stats.error else ""
+    print(
+        f"  {stats.source:18} | {stats.elapsed_seconds * 1000:8.1f} ms | "
+        f"{stats.status.upper():7} | {stats.event_count:3} events{error_str}"
+    )
+
+
+async def run_daemon(
+    engine: RiskRadarEngine,
+    asset: Optional[str] = None,
+    api_host: Optional[str] = None,
+    api_port: int = 8080,
+    api_workers: int = 0,
+    metrics_port: Optional[int] = None,
+) -> None:
     print("\n" + "=" * 60)
     print("EVENT-DRIVEN RISK RADAR - DAEMON MODE")
     print("=" * 60)
@@ -94,8 +167,28 @@ async def run_daemon(engine: RiskRadarEngine, asset: Optional[str] = None) -> No
     
     await run_check(engine, asset)
     
+    snapshot_path = None
+    if api_host is not None and api_workers > 0:
+        fd, snapshot_path = tempfile.mkstemp(prefix="edrr-snapshot-", suffix=".bin")
+        os.close(fd)
+        engine.share_snapshot(snapshot_path)
+    
     await engine.start()
     
+    api_runner = None
+    metrics_runner = None
+    worker_pool = None
+    if api_host is not None and snapshot_path is not None:
+        worker_pool = ApiWorkerPool(snapshot_path, api_workers, api_host, api_port, engine.config)
+        worker_pool.start()
+        metrics_port = metrics_port if metrics_port is not None else api_port + 1
+        metrics_runner = await worker_pool.start_metrics_server(api_host, metrics_port)
+        print(f"API listening on http://{api_host}:{api_port} ({api_workers} workers)")
+        print(f"Metrics on http://{api_host}:{metrics_port}/metrics\n")
+    elif api_host is not None:
+        api_runner = await start_server(engine.create_api(), api_host, api_port)
+        print(f"API listening on http://{api_host}:{api_port}\n")
+    
     stop_event = asyncio.Event()
     
     def signal_handler(sig, frame):
@@ -108,7 +201,15 @@ async def run_daemon(engine: RiskRadarEngine, asset: Optional[str] = None) -> No
     try:
         await stop_event.wait()
     finally:
-        engine.stop()
+        if api_runner is not None:
+            await api_runner.cleanup()
+        if metrics_runner is not None:
+            await metrics_runner.cleanup()
+        if worker_pool is not None:
+            worker_pool.stop()
+        await engine.stop()
+        if snapshot_path is not None:
+            os.unlink(snapshot_path)
         print("Stopped.")
 
 
@@ -119,9 +220,19 @@ async def async_main() -> None:
     engine = RiskRadarEngine(config)
     
     if args.mode == "daemon":
-        await run_daemon(engine, args.asset)
+        await run_daemon(
+            engine,
+            args.asset,
+            api_host=args.api_host if args.api or args.api_workers else None,
+            api_port=args.api_port,
+            api_workers=args.api_workers,
+            metrics_port=args.metrics_port,
+        )
     else:
-        await run_check(engine, args.asset)
+        try:
+            await run_check(engine, args.asset)
+        finally:
+            await engine.stop()
 
 
 def main() -> None:
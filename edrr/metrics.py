@@ -0,0 +1,352 @@
+import math
+import time
+import weakref
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+
+# Metric name -> [[label values, state], ...], as produced by MetricsRegistry.dump().
+MetricsDump = Dict[str, List[List[Any]]]
+
+# Latency buckets in seconds, from sub-millisecond scoring to slow source fetches.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+class _Timer:
+    """Context manager that observes its elapsed wall time on exit."""
+
+    __slots__ = ("_child", "_started")
+
+    def __init__(self, child: "HistogramChild") -> None:
+        self._child = child
+        self._started = 0.0
+
+    def __enter__(self) -> "_Timer":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._child.observe(time.perf_counter() - self._started)
+
+
+class HistogramChild:
+    __slots__ = ("_buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self._buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self._buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def time(self) -> _Timer:
+        return _Timer(self)
+
+    def timed(self, func: Callable) -> Callable:
+        """Decorate a synchronous function so every call is observed."""
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.observe(time.perf_counter() - started)
+
+        return wrapper
+
+
+class CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class GaugeChild:
+    __slots__ = ("value", "_function", "_tracked")
+
+    def __init__(self) -> None:
+        self.value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+        self._tracked: Optional[weakref.WeakKeyDictionary] = None
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Read the value from function whenever metrics are rendered."""
+        self._function = function
+
+    def track(self, owner: Any, read: Callable[[Any], float]) -> None:
+        """Add read(owner) to the value for as long as owner is alive.
+
+        Owners are held weakly, so every live instance counts once and none
+        is kept alive by the registry. read must not close over owner.
+        """
+        if self._tracked is None:
+            self._tracked = weakref.WeakKeyDictionary()
+        self._tracked[owner] = read
+
+    def get(self) -> float:
+        if self._function is not None:
+            return float(self._function())
+        if self._tracked is not None:
+            return float(sum(read(owner) for owner, read in list(self._tracked.items())))
+        return self.value
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+
+    def labels(self, *values: str, **labels: str):
+        """Child for one combination of label values, created on first use."""
+        if labels:
+            values = tuple(labels[name] for name in self.labelnames)
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            child = self._children[key] = self._new_child()
+        return child
+
+    @abstractmethod
+    def _new_child(self):
+        pass
+
+    @abstractmethod
+    def _dump_child(self, child) -> Any:
+        pass
+
+    @abstractmethod
+    def _load_child(self, state: Any):
+        pass
+
+    @abstractmethod
+    def _samples(
+        self,
+        labelnames: Sequence[str],
+        children: Iterable[Tuple[Sequence[str], Any]],
+    ) -> Iterator[str]:
+        pass
+
+    def dump(self) -> List[List[Any]]:
+        """JSON-compatible state of every child, for rendering in another process."""
+        dumped = []
+        for values, child in list(self._children.items()):
+            try:
+                dumped.append([list(values), self._dump_child(child)])
+            except Exception:
+                continue
+        return dumped
+
+    def render(self, remote: Sequence[Tuple[Mapping[str, str], MetricsDump]] = ()) -> List[str]:
+        lines = [f"# HELP {self.name} {_escape(self.help)}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples(self.labelnames, list(self._children.items())))
+        for extra, dump in remote:
+            children = [
+                (tuple(values) + tuple(extra.values()), self._load_child(state))
+                for values, state in dump.get(self.name, [])
+            ]
+            lines.extend(self._samples(self.labelnames + tuple(extra), children))
+        return lines
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def _dump_child(self, child: HistogramChild) -> Any:
+        return {"counts": child.counts, "sum": child.sum, "count": child.count}
+
+    def _load_child(self, state: Any) -> HistogramChild:
+        child = HistogramChild(self.buckets)
+        child.counts = list(state["counts"])
+        child.sum = state["sum"]
+        child.count = state["count"]
+        return child
+
+    def _samples(
+        self,
+        labelnames: Sequence[str],
+        children: Iterable[Tuple[Sequence[str], Any]],
+    ) -> Iterator[str]:
+        bounds = [_format_value(b) for b in self.buckets] + ["+Inf"]
+        for values, child in children:
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, child.counts):
+                cumulative += bucket_count
+                labels = _format_labels(labelnames, values, f'le="{bound}"')
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(labelnames, values)
+            yield f"{self.name}_sum{labels} {_format_value(child.sum)}"
+            yield f"{self.name}_count{labels} {child.count}"
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def _dump_child(self, child: CounterChild) -> Any:
+        return child.value
+
+    def _load_child(self, state: Any) -> CounterChild:
+        child = CounterChild()
+        child.value = state
+        return child
+
+    def _samples(
+        self,
+        labelnames: Sequence[str],
+        children: Iterable[Tuple[Sequence[str], Any]],
+    ) -> Iterator[str]:
+        for values, child in children:
+            labels = _format_labels(labelnames, values)
+            yield f"{self.name}_total{labels} {_format_value(child.value)}"
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+    def _dump_child(self, child: GaugeChild) -> Any:
+        return child.get()
+
+    def _load_child(self, state: Any) -> GaugeChild:
+        child = GaugeChild()
+        child.value = state
+        return child
+
+    def _samples(
+        self,
+        labelnames: Sequence[str],
+        children: Iterable[Tuple[Sequence[str], Any]],
+    ) -> Iterator[str]:
+        for values, child in children:
+            try:
+                value = child.get()
+            except Exception:
+                continue  # A failing callback drops its sample, not the whole page
+            yield f"{self.name}{_format_labels(labelnames, values)} {_format_value(value)}"
+
+
+class MetricsRegistry:
+    """Named metrics shared by every component of one process.
+
+    Recording is a dict lookup and a few additions, cheap enough to leave on:
+    components resolve their labelled children once and keep them.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labelnames))
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help_text, labelnames))
+
+    def _register(self, metric: _Metric):
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                raise ValueError(f"Metric {metric.name} already registered differently")
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def dump(self, names: Optional[Sequence[str]] = None) -> MetricsDump:
+        """JSON-compatible state of every metric (or just names) that has samples."""
+        dumped = {
+            name: metric.dump()
+            for name, metric in list(self._metrics.items())
+            if names is None or name in names
+        }
+        return {name: children for name, children in dumped.items() if children}
+
+    def render(self, remote: Sequence[Tuple[Mapping[str, str], MetricsDump]] = ()) -> str:
+        """Prometheus text for this process's metrics.
+
+        Args:
+            remote: (extra labels, dump) pairs from other processes, such as
+                API workers, rendered into the same families with the extra
+                labels appended so every series stays distinct.
+        """
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render(remote))
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+# Shared by every component that owns an in-memory cache.
+CACHE_ENTRIES = REGISTRY.gauge("edrr_cache_entries", "Entries held in memory by each cache", ["cache"])
@@ -0,0 +1,57 @@
+import sys
+from typing import Dict, Iterable, List, Tuple
+
+
+class AssetRegistry:
+    """Assigns each asset symbol a bit so a set of assets fits in one int.
+
+    Symbols are interned and registered on first use; the first symbols
+    registered get the lowest bits, which also fixes the order in which
+    a mask expands back into a list.
+    """
+
+    def __init__(self, symbols: Iterable[str] = ()) -> None:
+        self._bits: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._expanded: Dict[int, Tuple[str, ...]] = {0: ()}
+        for symbol in symbols:
+            self.bit(symbol)
+
+    def bit(self, symbol: str) -> int:
+        """Return the single-bit mask for a symbol, registering it if new."""
+        bit = self._bits.get(symbol)
+        if bit is None:
+            symbol = sys.intern(symbol)
+            bit = 1 << len(self._symbols)
+            self._bits[symbol] = bit
+            self._symbols.append(symbol)
+        return bit
+
+    def lookup(self, symbol: str) -> int:
+        """Return a symbol's bit without registering it (0 if unknown)."""
+        return self._bits.get(symbol, 0)
+
+    def mask(self, symbols: Iterable[str]) -> int:
+        mask = 0
+        for symbol in symbols:
+            mask |= self.bit(symbol)
+        return mask
+
+    def symbols(self, mask: int) -> Tuple[str, ...]:
+        """Expand a mask into its interned symbols in registration order."""
+        expanded = self._expanded.get(mask)
+        if expanded is None:
+            expanded = tuple(
+                symbol for i, symbol in enumerate(self._symbols) if mask >> i & 1
+            )
+            self._expanded[mask] = expanded
+        return expanded
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._bits
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+
+ASSET_REGISTRY = AssetRegistry(["SPY", "QQQ", "BTC", "GOLD"])
@@ -62,6 +62,27 @@ class Config:
     news_poll_interval_seconds: int = 300
     risk_recalc_interval_seconds: int = 60
     event_proximity_threshold_hours: int = 2
+    source_timeout_seconds: float = 10.0
+    snapshot_bucket_seconds: int = 1
+    cluster_lookahead_hours: int = 24
+    cluster_window_hours: int = 2
+    http_max_connections: int = 100
+    http_max_connections_per_host: int = 10
+    http_timeout_seconds: float = 10.0
+    http_max_response_bytes: int = 5 * 1024 * 1024
+    source_cache_ttl_seconds: int = 300
+    llm_cache_max_entries: int = 1024
+    llm_cache_ttl_seconds: int = 86400
+    llm_max_concurrency: int = 4
+    llm_requests_per_second: float = 2.0
+    llm_batch_size: int = 20
+    llm_min_requests_per_second: float = 0.1
+    llm_breaker_failure_threshold: int = 5
+    llm_breaker_reset_seconds: float = 60.0
+    stream_queue_size: int = 256
+    stream_heartbeat_seconds: float = 15.0
+    timeline_max_points: int = 5000
+    shared_snapshot_interval_seconds: int = 1
     
     risk_thresholds: RiskThresholds = field(default_factory=RiskThresholds)
     time_multipliers: Dict[str, float] = field(default_factory=lambda: TIME_MULTIPLIERS.copy())
@@ -73,3 +94,5 @@ class Config:
     news_api_key: Optional[str] = field(default_factory=lambda: os.environ.get("NEWS_API_KEY"))
     redis_host: Optional[str] = field(default_factory=lambda: os.environ.get("REDIS_HOST"))
     redis_port: Optional[int] = field(default_factory=lambda: int(os.environ.get("REDIS_PORT", "6379")))
+    event_db_path: Optional[str] = field(default_factory=lambda: os.environ.get("EDRR_EVENT_DB"))
+    llm_cache_path: Optional[str] = field(default_factory=lambda: os.environ.get("EDRR_LLM_CACHE"))
@@ -1,7 +1,13 @@
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from edrr.models.assets import ASSET_REGISTRY
+
+
+# Distinct asset orderings, shared by every event that lists the same assets.
+_ASSET_ORDERS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
 
 
 class EventCategory(Enum):
@@ -20,15 +26,75 @@ class EventTier(Enum):
     TIER_4 = 4  # Crypto-specific: protocol upgrades, token unlocks
 
 
-@dataclass
+@dataclass(init=False, repr=False, slots=True)
 class Event:
+    """A scheduled or detected market event.
+
+    Stored compactly: the class is slotted and affected assets are kept as a
+    bitmask over ASSET_REGISTRY, so membership checks are a single AND.
+    `affected_assets` still reads and writes as a list of symbols, in the
+    order they were given.
+    """
+
     id: str
     title: str
     category: EventCategory
     tier: EventTier
     scheduled_time: datetime
     impact_window: timedelta
-    affected_assets: List[str] = field(default_factory=list)
+    asset_mask: int
+    _assets: Tuple[str, ...]
+
+    def __init__(
+        self,
+        id: str,
+        title: str,
+        category: EventCategory,
+        tier: EventTier,
+        scheduled_time: datetime,
+        impact_window: timedelta,
+        affected_assets: Optional[Iterable[str]] = None,
+        *,
+        asset_mask: Optional[int] = None,
+    ) -> None:
+        self.id = id
+        self.title = title
+        self.category = category
+        self.tier = tier
+        self.scheduled_time = scheduled_time
+        self.impact_window = impact_window
+        assets = tuple(affected_assets or ())
+        if asset_mask is None:
+            asset_mask = ASSET_REGISTRY.mask(assets)
+        elif not assets:
+            assets = ASSET_REGISTRY.symbols(asset_mask)
+        self.asset_mask = asset_mask
+        self._assets = _ASSET_ORDERS.setdefault(assets, assets)
+
+    @property
+    def affected_assets(self) -> List[str]:
+        """Symbols of the affected assets, in the order they were given.
+
+        Returns a new list on every read, so edit the assets by assigning
+        a new collection rather than changing the returned list in place.
+        """
+        return list(self._assets)
+
+    @affected_assets.setter
+    def affected_assets(self, assets: Iterable[str]) -> None:
+        symbols = tuple(assets)
+        self.asset_mask = ASSET_REGISTRY.mask(symbols)
+        self._assets = _ASSET_ORDERS.setdefault(symbols, symbols)
+
+    def affects(self, asset: str) -> bool:
+        return bool(self.asset_mask & ASSET_REGISTRY.lookup(asset))
+
+    def __repr__(self) -> str:
+        return (
+            f"Event(id={self.id!r}, title={self.title!r}, category={self.category}, "
+            f"tier={self.tier}, scheduled_time={self.scheduled_time!r}, "
+            f"impact_window={self.impact_window!r}, affected_assets={self.affected_assets!r})"
+        )
 
 
 @dataclass
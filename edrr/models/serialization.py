@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+from edrr.models.events import AssetRisk, Event, EventCategory, EventTier
+
+
+def event_to_dict(event: Event) -> Dict[str, Any]:
+    """Convert an Event to a JSON-compatible dict."""
+    return {
+        "id": event.id,
+        "title": event.title,
+        "category": event.category.value,
+        "tier": event.tier.value,
+        "scheduled_time": event.scheduled_time.isoformat(),
+        "impact_window_seconds": event.impact_window.total_seconds(),
+        "affected_assets": list(event.affected_assets),
+    }
+
+
+def event_from_dict(data: Dict[str, Any]) -> Event:
+    """Rebuild an Event from the output of event_to_dict."""
+    return Event(
+        id=data["id"],
+        title=data["title"],
+        category=EventCategory(data["category"]),
+        tier=EventTier(data["tier"]),
+        scheduled_time=datetime.fromisoformat(data["scheduled_time"]),
+        impact_window=timedelta(seconds=data["impact_window_seconds"]),
+        affected_assets=list(data.get("affected_assets", [])),
+    )
+
+
+def asset_risk_to_dict(risk: AssetRisk) -> Dict[str, Any]:
+    return {
+        "asset": risk.asset,
+        "score": risk.score,
+        "status": risk.status,
+        "next_event": event_to_dict(risk.next_event) if risk.next_event else None,
+    }
+
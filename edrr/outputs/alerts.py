@@ -1,11 +1,21 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Sequence
 
 from edrr.models.config import Config
 from edrr.models.events import AssetRisk, Event, RiskWindow
+from edrr.models.serialization import event_to_dict
 from edrr.analysis.risk_aggregator import ClusterInfo, RiskAggregator
+from edrr.metrics import REGISTRY
+from edrr.storage.event_store import EventDiff
+
+
+ALERT_CHECK_SECONDS = REGISTRY.histogram(
+    "edrr_alert_check_seconds",
+    "Time spent checking alert conditions",
+    ["check"],
+)
 
 
 class AlertType(Enum):
@@ -25,6 +35,17 @@ class Alert:
     assets: List[str]
     event: Optional[Event] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "alert_type": self.alert_type.value,
+            "title": self.title,
+            "message": self.message,
+            "severity": self.severity,
+            "timestamp": self.timestamp.isoformat(),
+            "assets": list(self.assets),
+            "event": event_to_dict(self.event) if self.event else None,
+        }
+
 
 class AlertManager:
     def __init__(
@@ -38,6 +59,7 @@ class AlertManager:
         self._known_events: set = set()
         self._alerted_clusters: set = set()
 
+    @ALERT_CHECK_SECONDS.labels("check_thresholds").timed
     def check_thresholds(
         self,
         current_time: Optional[datetime] = None,
@@ -45,24 +67,56 @@ class AlertManager:
         current_time = current_time or datetime.now()
         alerts: List[Alert] = []
 
-        current_risks = self.risk_aggregator.get_current_risk(current_time)
-        alerts.extend(self._check_threshold_crossings(current_risks, current_time))
-
-        danger_zones = self.risk_aggregator.get_danger_zones(current_time)
-        alerts.extend(self._check_danger_zone_entry(danger_zones, current_time))
+        snapshot = self.risk_aggregator.get_snapshot(current_time)
 
+        alerts.extend(self._check_threshold_crossings(snapshot.asset_risks, current_time))
+        alerts.extend(self._check_danger_zone_entry(snapshot.danger_zones, current_time))
         alerts.extend(self._check_new_high_impact_events(current_time))
+        alerts.extend(self._check_clustering(snapshot.clusters, current_time))
+        asset_clusters = self._asset_only_clusters(snapshot.clusters, snapshot.asset_clusters)
+        alerts.extend(self._check_clustering(asset_clusters, current_time))
 
-        clusters = self.risk_aggregator.detect_clustering(current_time)
-        alerts.extend(self._check_clustering(clusters, current_time))
+        self._previous_risks = dict(snapshot.asset_risks)
 
-        self._previous_risks = current_risks
+        return alerts
+
+    @ALERT_CHECK_SECONDS.labels("check_asset_thresholds").timed
+    def check_asset_thresholds(
+        self,
+        assets: Sequence[str],
+        current_time: Optional[datetime] = None,
+    ) -> List[Alert]:
+        """Check threshold crossings for a few assets without a full snapshot.
 
+        Used when only these assets' scores can have changed since the last check.
+        """
+        current_time = current_time or datetime.now()
+        risks = self.risk_aggregator.get_current_risk(current_time, assets)
+        alerts = self._check_threshold_crossings(risks, current_time)
+        self._previous_risks.update(risks)
         return alerts
 
+    def dedup_counts(self) -> Dict[str, int]:
+        """Sizes of the sets kept to avoid repeating alerts."""
+        return {
+            "known_events": len(self._known_events),
+            "alerted_clusters": len(self._alerted_clusters),
+        }
+
+    def apply_event_diff(self, diff: EventDiff) -> None:
+        removed_ids = {e.id for e in diff.removed}
+        if not removed_ids:
+            return
+
+        self._known_events -= removed_ids
+        self._alerted_clusters = {
+            key for key in self._alerted_clusters
+            if not removed_ids.intersection(key[1])
+        }
+
     def _check_threshold_crossings(
         self,
-        current_risks: Dict[str, AssetRisk],
+        current_risks: Mapping[str, AssetRisk],
         current_time: datetime,
     ) -> List[Alert]:
         alerts: List[Alert] = []
@@ -97,7 +151,7 @@ class AlertManager:
 
     def _check_danger_zone_entry(
         self,
-        danger_zones: Dict[str, List[RiskWindow]],
+        danger_zones: Mapping[str, Sequence[RiskWindow]],
         current_time: datetime,
     ) -> List[Alert]:
         alerts: List[Alert] = []
@@ -147,9 +201,37 @@ class AlertManager:
 
         return alerts
 
+    def _asset_only_clusters(
+        self,
+        clusters: Sequence[ClusterInfo],
+        asset_clusters: Mapping[str, Sequence[ClusterInfo]],
+    ) -> List[ClusterInfo]:
+        """Per-asset clusters that are not already part of a cross-asset cluster.
+
+        Identical clusters found for several assets are merged into one.
+        """
+        covered = [{e.id for e in cluster.events} for cluster in clusters]
+        merged: Dict[tuple, ClusterInfo] = {}
+        for asset, found in asset_clusters.items():
+            for cluster in found:
+                ids = tuple(e.id for e in cluster.events)
+                if any(covering.issuperset(ids) for covering in covered):
+                    continue
+                key = (cluster.window_start, ids)
+                if key in merged:
+                    existing = merged[key]
+                    merged[key] = replace(
+                        existing,
+                        assets_affected=existing.assets_affected + [asset],
+                        compound_risk=max(existing.compound_risk, cluster.compound_risk),
+                    )
+                else:
+                    merged[key] = cluster
+        return list(merged.values())
+
     def _check_clustering(
         self,
-        clusters: List[ClusterInfo],
+        clusters: Sequence[ClusterInfo],
         current_time: datetime,
     ) -> List[Alert]:
         alerts: List[Alert] = []
@@ -162,6 +244,7 @@ class AlertManager:
             if cluster_key in self._alerted_clusters:
                 continue
 
+            asset_prefix = f"{', '.join(cluster.assets_affected)} " if cluster.asset else ""
             event_titles = ", ".join(e.title for e in cluster.events[:3])
             if len(cluster.events) > 3:
                 event_titles += f" (+{len(cluster.events) - 3} more)"
@@ -169,7 +252,7 @@ class AlertManager:
             alerts.append(
                 Alert(
                     alert_type=AlertType.CLUSTERING_DETECTED,
-                    title=f"Event Cluster Detected ({len(cluster.events)} events)",
+                    title=f"{asset_prefix}Event Cluster Detected ({len(cluster.events)} events)",
                     message=f"Multiple events between {cluster.window_start.strftime('%H:%M')} - {cluster.window_end.strftime('%H:%M')}: {event_titles}. Compound risk: {cluster.compound_risk}",
                     severity=cluster.compound_risk,
                     timestamp=current_time,
@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from edrr.models.config import Config
 from edrr.models.events import Event, RiskWindow
@@ -22,6 +22,7 @@ class CalendarView:
     ) -> None:
         self.config = config or Config()
         self.risk_aggregator = risk_aggregator or RiskAggregator(self.config)
+        self._rendered: Dict[str, Tuple[Tuple[int, datetime], str]] = {}
 
     def _get_risk_label(self, score: int) -> str:
         for (low, high), label in self.RISK_LABELS.items():
@@ -41,17 +42,10 @@ class CalendarView:
             return "ALL"
         return ", ".join(assets)
 
-    def _get_events_for_date(
-        self,
-        date: datetime,
-        events: List[Event],
-    ) -> List[Event]:
+    def _get_events_for_date(self, date: datetime) -> List[Event]:
         start_of_day = date.replace(hour=0, minute=0, second=0, microsecond=0)
         end_of_day = date.replace(hour=23, minute=59, second=59, microsecond=999999)
-        return [
-            e for e in events
-            if start_of_day <= e.scheduled_time <= end_of_day
-        ]
+        return self.risk_aggregator.event_index.between(start_of_day, end_of_day)
 
     def _format_event_line(self, event: Event, score: int) -> str:
         label = self._get_risk_label(score)
@@ -71,10 +65,32 @@ class CalendarView:
         self,
         current_time: Optional[datetime] = None,
     ) -> str:
-        current_time = current_time or datetime.now()
-        events = self.risk_aggregator.events
-        today_events = self._get_events_for_date(current_time, events)
-        today_events.sort(key=lambda e: e.scheduled_time)
+        return self._render_for_snapshot("today", current_time, self._render_today)
+
+    def generate_week(
+        self,
+        current_time: Optional[datetime] = None,
+    ) -> str:
+        return self._render_for_snapshot("week", current_time, self._render_week)
+
+    def _render_for_snapshot(
+        self,
+        view: str,
+        current_time: Optional[datetime],
+        render: Callable[[datetime], str],
+    ) -> str:
+        # Render against the shared snapshot time and reuse the text until it changes.
+        snapshot = self.risk_aggregator.get_snapshot(current_time)
+        cached = self._rendered.get(view)
+        if cached is not None and cached[0] == snapshot.key:
+            return cached[1]
+
+        text = render(snapshot.as_of)
+        self._rendered[view] = (snapshot.key, text)
+        return text
+
+    def _render_today(self, current_time: datetime) -> str:
+        today_events = self._get_events_for_date(current_time)
 
         lines: List[str] = []
         date_str = current_time.strftime("%B %d, %Y")
@@ -83,8 +99,8 @@ class CalendarView:
         if not today_events:
             lines.append("└── No events scheduled")
         else:
-            for i, event in enumerate(today_events):
-                score = self._calculate_event_score(event, current_time)
+            scores = self.risk_aggregator.score_events(today_events, current_time)
+            for i, (event, score) in enumerate(zip(today_events, scores)):
                 line = self._format_event_line(event, score)
                 if i == len(today_events) - 1:
                     line = line.replace("├──", "└──")
@@ -92,13 +108,7 @@ class CalendarView:
 
         return "\n".join(lines)
 
-    def generate_week(
-        self,
-        current_time: Optional[datetime] = None,
-    ) -> str:
-        current_time = current_time or datetime.now()
-        events = self.risk_aggregator.events
-
+    def _render_week(self, current_time: datetime) -> str:
         lines: List[str] = []
         high_risk_windows = 0
         blackout_windows: List[str] = []
@@ -106,8 +116,7 @@ class CalendarView:
 
         for day_offset in range(7):
             date = current_time + timedelta(days=day_offset)
-            day_events = self._get_events_for_date(date, events)
-            day_events.sort(key=lambda e: e.scheduled_time)
+            day_events = self._get_events_for_date(date)
 
             if day_offset == 0:
                 day_label = "TODAY"
@@ -122,8 +131,8 @@ class CalendarView:
             if not day_events:
                 lines.append("└── No events scheduled")
             else:
-                for i, event in enumerate(day_events):
-                    score = self._calculate_event_score(event, date)
+                scores = self.risk_aggregator.score_events(day_events, date)
+                for i, (event, score) in enumerate(zip(day_events, scores)):
                     line = self._format_event_line(event, score)
                     if i == len(day_events) - 1:
                         line = line.replace("├──", "└──")
@@ -162,16 +171,3 @@ class CalendarView:
             lines.append("- Assets with elevated week risk: None")
 
         return "\n".join(lines)
-
-    def _calculate_event_score(
-        self,
-        event: Event,
-        reference_time: datetime,
-    ) -> int:
-        max_score = 0
-        for asset in event.affected_assets:
-            score = self.risk_aggregator.impact_scorer.calculate_score(
-                event, asset, reference_time
-            )
-            max_score = max(max_score, score)
-        return max_score
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Mapping, Optional
 
 from edrr.models.events import AssetRisk, Event
 from edrr.models.config import Config
@@ -43,7 +43,7 @@ class RecommendationEngine:
         return "UNKNOWN", "Unable to determine recommendation."
 
     def get_all_recommendations(
-        self, asset_risks: dict[str, AssetRisk]
+        self, asset_risks: Mapping[str, AssetRisk]
     ) -> dict[str, Recommendation]:
         return {
             asset: self.get_recommendation(risk)
@@ -2,10 +2,21 @@ from datetime import datetime, timedelta
 from typing import Callable, List, Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
+from edrr.analysis.breakpoints import BreakpointQueue
+from edrr.metrics import REGISTRY
 from edrr.models.config import Config
 from edrr.models.events import Event
+from edrr.storage.event_store import EventDiff
+
+
+JOB_SECONDS = REGISTRY.histogram(
+    "edrr_scheduler_job_seconds",
+    "Run time of scheduled jobs",
+    ["job"],
+)
 
 
 class Scheduler:
@@ -23,14 +34,35 @@ class Scheduler:
         self._on_risk_recalculate = on_risk_recalculate
         self._events: List[Event] = []
         self._risk_recalc_job_id = "risk_recalculate"
+        self._breakpoints = BreakpointQueue()
+        self._next_recalc: Optional[datetime] = None
+        # Wake this long after a breakpoint so the snapshot bucket read at
+        # wake-up starts strictly after it.
+        self._settle = timedelta(seconds=max(1, self.config.snapshot_bucket_seconds))
 
-    def set_events(self, events: List[Event]) -> None:
+    def set_events(self, events: List[Event], current_time: Optional[datetime] = None) -> None:
         self._events = events
+        self._breakpoints.set_events(events, current_time or datetime.now())
+        self._schedule_next_recalc()
+
+    def apply_event_diff(self, diff: EventDiff, events: List[Event]) -> None:
+        """Update the breakpoint queue from a store diff instead of rebuilding it."""
+        for event in diff.removed:
+            self._breakpoints.remove(event)
+        for event in diff.added + diff.changed:
+            self._breakpoints.add(event)
+        self._events = events
+        self._schedule_next_recalc()
+
+    @property
+    def next_recalc_time(self) -> Optional[datetime]:
+        """When the next risk recalculation is scheduled, if any."""
+        return self._next_recalc
 
     def start(self) -> None:
         if self._on_calendar_poll:
             self._scheduler.add_job(
-                self._on_calendar_poll,
+                _timed_job("calendar_poll", self._on_calendar_poll),
                 IntervalTrigger(hours=1),
                 id="calendar_poll",
                 replace_existing=True,
@@ -38,20 +70,14 @@ class Scheduler:
 
         if self._on_news_monitor:
             self._scheduler.add_job(
-                self._on_news_monitor,
+                _timed_job("news_monitor", self._on_news_monitor),
                 IntervalTrigger(minutes=5),
                 id="news_monitor",
                 replace_existing=True,
             )
 
-        if self._on_risk_recalculate:
-            self._scheduler.add_job(
-                self._check_and_recalculate_risk,
-                IntervalTrigger(minutes=1),
-                id=self._risk_recalc_job_id,
-                replace_existing=True,
-            )
-
+        self._next_recalc = None
+        self._schedule_next_recalc()
         self._scheduler.start()
 
     def stop(self) -> None:
@@ -61,20 +87,44 @@ class Scheduler:
     def is_running(self) -> bool:
         return self._scheduler.running
 
-    async def _check_and_recalculate_risk(self) -> None:
+    def _schedule_next_recalc(self) -> None:
+        """Point the one-shot recalculation job at the next score breakpoint."""
         if not self._on_risk_recalculate:
             return
 
-        now = datetime.now()
-        threshold = timedelta(hours=2)
+        next_time = self._breakpoints.next_time()
+        run_at = next_time + self._settle if next_time is not None else None
+        if run_at == self._next_recalc:
+            return
 
-        has_imminent_event = any(
-            timedelta(0) <= (event.scheduled_time - now) <= threshold
-            for event in self._events
+        self._next_recalc = run_at
+        if run_at is None:
+            if self._scheduler.get_job(self._risk_recalc_job_id):
+                self._scheduler.remove_job(self._risk_recalc_job_id)
+            return
+        self._scheduler.add_job(
+            _timed_job(self._risk_recalc_job_id, self._recalculate_due_assets),
+            DateTrigger(run_date=run_at),
+            id=self._risk_recalc_job_id,
+            replace_existing=True,
+            misfire_grace_time=None,
         )
 
-        if has_imminent_event:
-            await self._on_risk_recalculate()
+    async def _recalculate_due_assets(self, current_time: Optional[datetime] = None) -> None:
+        """Recompute risk for the assets whose events just crossed a breakpoint.
+
+        Scores only change at breakpoints, so nothing runs between them. When
+        a danger window opens, every check runs so its entry alert fires now
+        rather than on the next poll.
+        """
+        current_time = current_time or datetime.now()
+        self._next_recalc = None
+        assets, window_opened = self._breakpoints.pop_due(current_time - self._settle)
+        try:
+            if assets and self._on_risk_recalculate:
+                await self._on_risk_recalculate(None if window_opened else assets)
+        finally:
+            self._schedule_next_recalc()
 
     async def trigger_calendar_poll(self) -> None:
         if self._on_calendar_poll:
@@ -87,3 +137,13 @@ class Scheduler:
     async def trigger_risk_recalculate(self) -> None:
         if self._on_risk_recalculate:
             await self._on_risk_recalculate()
+
+
+def _timed_job(name: str, job: Callable) -> Callable:
+    timer = JOB_SECONDS.labels(name)
+
+    async def run() -> None:
+        with timer.time():
+            await job()
+
+    return run
@@ -1,12 +1,31 @@
+import hashlib
 from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
 from typing import List
 
 from edrr.models.events import Event
 
 
+def next_day_at(now: datetime, hour: int, minute: int = 0) -> datetime:
+    """Get tomorrow's date at a fixed wall-clock time.
+
+    Scheduled sources anchor their events to a fixed release time so that the
+    same event keeps the same scheduled time (and therefore the same id)
+    across polls.
+    """
+    return (now + timedelta(days=1)).replace(
+        hour=hour, minute=minute, second=0, microsecond=0
+    )
+
+
 class EventSource(ABC):
     """Abstract base class for all event sources."""
 
+    # Incremental sources only return events that are new since the previous
+    # fetch, so their results are merged into what is already known instead of
+    # replacing it.
+    incremental: bool = False
+
     @abstractmethod
     async def fetch_events(self) -> List[Event]:
         """Fetch events from this source.
@@ -24,3 +43,21 @@ class EventSource(ABC):
             A string identifying this source.
         """
         pass
+
+    def make_event_id(self, prefix: str, title: str, scheduled_time: datetime) -> str:
+        """Build a stable event id derived from the event's content.
+
+        The same (source, title, scheduled time) always yields the same id, so
+        refetching a source does not make known events look new.
+
+        Args:
+            prefix: Short id prefix for the source (e.g. "econ").
+            title: Event title.
+            scheduled_time: When the event is scheduled.
+
+        Returns:
+            An id of the form "<prefix>-<12 hex chars>".
+        """
+        key = f"{self.get_source_name()}|{title}|{scheduled_time.isoformat()}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+        return f"{prefix}-{digest}"
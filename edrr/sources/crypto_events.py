@@ -1,9 +1,8 @@
 from datetime import datetime, timedelta
 from typing import List, Tuple
-import uuid
 
 from edrr.models.events import Event, EventCategory, EventTier
-from edrr.sources.base import EventSource
+from edrr.sources.base import EventSource, next_day_at
 
 
 class CryptoEventsSource(EventSource):
@@ -26,6 +25,7 @@ class CryptoEventsSource(EventSource):
 
     AFFECTED_ASSETS = ["BTC", "ETH"]
     REGULATORY_AFFECTED_ASSETS = ["BTC", "ETH", "SPY", "QQQ"]
+    EVENT_TIME = (12, 0)
 
     async def fetch_events(self) -> List[Event]:
         """Fetch crypto-specific events including protocol upgrades, token unlocks, and regulatory events.
@@ -35,14 +35,15 @@ class CryptoEventsSource(EventSource):
         """
         events: List[Event] = []
         now = datetime.now()
+        scheduled_time = next_day_at(now, *self.EVENT_TIME)
 
         for name, impact_hours, category in self.CRYPTO_EVENTS:
             event = Event(
-                id=f"crypto-{uuid.uuid4().hex[:8]}",
+                id=self.make_event_id("crypto", name, scheduled_time),
                 title=name,
                 category=category,
                 tier=EventTier.TIER_4,
-                scheduled_time=now + timedelta(days=1),
+                scheduled_time=scheduled_time,
                 impact_window=timedelta(hours=impact_hours),
                 affected_assets=self.AFFECTED_ASSETS.copy(),
             )
@@ -50,11 +51,11 @@ class CryptoEventsSource(EventSource):
 
         for name, impact_hours, category in self.REGULATORY_EVENTS:
             event = Event(
-                id=f"reg-{uuid.uuid4().hex[:8]}",
+                id=self.make_event_id("reg", name, scheduled_time),
                 title=name,
                 category=category,
                 tier=EventTier.TIER_4,
-                scheduled_time=now + timedelta(days=1),
+                scheduled_time=scheduled_time,
                 impact_window=timedelta(hours=impact_hours),
                 affected_assets=self.REGULATORY_AFFECTED_ASSETS.copy(),
             )
@@ -1,9 +1,8 @@
 from datetime import datetime, timedelta
 from typing import List
-import uuid
 
 from edrr.models.events import Event, EventCategory, EventTier
-from edrr.sources.base import EventSource
+from edrr.sources.base import EventSource, next_day_at
 
 
 class EarningsCalendarSource(EventSource):
@@ -20,6 +19,7 @@ class EarningsCalendarSource(EventSource):
     ]
 
     IMPACT_HOURS = 14
+    REPORT_TIME = (16, 0)  # After the close
 
     async def fetch_events(self) -> List[Event]:
         """Fetch scheduled mega-cap earnings events.
@@ -30,18 +30,20 @@ class EarningsCalendarSource(EventSource):
         """
         events: List[Event] = []
         now = datetime.now()
+        scheduled_time = next_day_at(now, *self.REPORT_TIME)
 
         for ticker in self.HIGH_IMPACT_TICKERS:
             affected_assets = ["SPY", "QQQ"]
             if ticker["symbol"] in ("NVDA", "TSLA"):
                 affected_assets.append("BTC")
 
+            title = f"{ticker['symbol']} Earnings - {ticker['name']}"
             event = Event(
-                id=f"earn-{ticker['symbol'].lower()}-{uuid.uuid4().hex[:8]}",
-                title=f"{ticker['symbol']} Earnings - {ticker['name']}",
+                id=self.make_event_id(f"earn-{ticker['symbol'].lower()}", title, scheduled_time),
+                title=title,
                 category=EventCategory.EARNINGS,
                 tier=EventTier.TIER_1,
-                scheduled_time=now + timedelta(days=1),
+                scheduled_time=scheduled_time,
                 impact_window=timedelta(hours=self.IMPACT_HOURS),
                 affected_assets=affected_assets,
             )
@@ -1,9 +1,8 @@
 from datetime import datetime, timedelta
 from typing import List, Tuple
-import uuid
 
 from edrr.models.events import Event, EventCategory, EventTier
-from edrr.sources.base import EventSource
+from edrr.sources.base import EventSource, next_day_at
 
 
 class EconomicCalendarSource(EventSource):
@@ -21,6 +20,7 @@ class EconomicCalendarSource(EventSource):
     ]
 
     AFFECTED_ASSETS = ["SPY", "QQQ", "BTC", "GOLD"]
+    RELEASE_TIME = (8, 30)
 
     async def fetch_events(self) -> List[Event]:
         """Fetch scheduled economic calendar events.
@@ -30,14 +30,15 @@ class EconomicCalendarSource(EventSource):
         """
         events: List[Event] = []
         now = datetime.now()
+        scheduled_time = next_day_at(now, *self.RELEASE_TIME)
 
         for name, impact_hours in self.ECONOMIC_EVENTS:
             event = Event(
-                id=f"econ-{uuid.uuid4().hex[:8]}",
+                id=self.make_event_id("econ", name, scheduled_time),
                 title=name,
                 category=EventCategory.ECONOMIC,
                 tier=EventTier.TIER_1,
-                scheduled_time=now + timedelta(days=1),
+                scheduled_time=scheduled_time,
                 impact_window=timedelta(hours=impact_hours),
                 affected_assets=self.AFFECTED_ASSETS.copy(),
             )
@@ -1,9 +1,8 @@
 from datetime import datetime, timedelta
 from typing import List, Tuple
-import uuid
 
 from edrr.models.events import Event, EventCategory, EventTier
-from edrr.sources.base import EventSource
+from edrr.sources.base import EventSource, next_day_at
 
 
 class FedCalendarSource(EventSource):
@@ -22,6 +21,7 @@ class FedCalendarSource(EventSource):
     ]
 
     AFFECTED_ASSETS = ["SPY", "QQQ", "BTC", "GOLD"]
+    SPEECH_TIME = (13, 0)
 
     async def fetch_events(self) -> List[Event]:
         """Fetch Federal Reserve speaker events.
@@ -31,14 +31,16 @@ class FedCalendarSource(EventSource):
         """
         events: List[Event] = []
         now = datetime.now()
+        scheduled_time = next_day_at(now, *self.SPEECH_TIME)
 
         for name, impact_hours in self.FED_SPEAKERS:
+            title = f"{name} Speech"
             event = Event(
-                id=f"fed-{uuid.uuid4().hex[:8]}",
-                title=f"{name} Speech",
+                id=self.make_event_id("fed", title, scheduled_time),
+                title=title,
                 category=EventCategory.FED_SPEAKER,
                 tier=EventTier.TIER_2,
-                scheduled_time=now + timedelta(days=1),
+                scheduled_time=scheduled_time,
                 impact_window=timedelta(hours=impact_hours),
                 affected_assets=self.AFFECTED_ASSETS.copy(),
             )
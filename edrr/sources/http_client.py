@@ -0,0 +1,112 @@
+import json
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+
+class ResponseTooLargeError(aiohttp.ClientError):
+    """Raised when a response body exceeds the configured size limit."""
+
+
+class HTTPClient:
+    """Pooled HTTP client shared by all HTTP-backed event sources.
+
+    Holds a single aiohttp session with keep-alive connections so polls reuse
+    DNS lookups and TCP/TLS connections instead of opening a new session each
+    time. The session is created lazily inside the running event loop.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_connections_per_host: int = 10,
+        timeout_seconds: float = 10.0,
+        max_response_bytes: int = 5 * 1024 * 1024,
+        keepalive_timeout: float = 60.0,
+        dns_cache_ttl: int = 300,
+    ) -> None:
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout_seconds = timeout_seconds
+        self.max_response_bytes = max_response_bytes
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def closed(self) -> bool:
+        return self._session is None or self._session.closed
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """Get the shared session, creating it on first use.
+
+        Returns:
+            The pooled aiohttp session.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds),
+            )
+        return self._session
+
+    async def get_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Any]:
+        """GET a URL and decode its JSON body.
+
+        Args:
+            url: URL to fetch.
+            params: Optional query parameters.
+
+        Returns:
+            Decoded JSON body, or None for a non-200 response.
+
+        Raises:
+            ResponseTooLargeError: If the body exceeds max_response_bytes.
+            aiohttp.ClientError: On connection or protocol errors.
+        """
+        session = self.get_session()
+        async with session.get(url, params=params) as response:
+            if response.status != 200:
+                return None
+            body = await self._read_limited(response)
+        try:
+            return json.loads(body)
+        except ValueError as e:
+            raise aiohttp.ContentTypeError(
+                response.request_info,
+                response.history,
+                message=f"Invalid JSON body: {e}",
+            ) from e
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _read_limited(self, response: aiohttp.ClientResponse) -> bytes:
+        limit = self.max_response_bytes
+        if response.content_length is not None and response.content_length > limit:
+            raise ResponseTooLargeError(
+                f"Response of {response.content_length} bytes exceeds limit of {limit}"
+            )
+
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+            size += len(chunk)
+            if size > limit:
+                raise ResponseTooLargeError(f"Response exceeds limit of {limit} bytes")
+            chunks.append(chunk)
+        return b"".join(chunks)
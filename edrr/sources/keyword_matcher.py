@@ -0,0 +1,98 @@
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Set
+
+
+@dataclass
+class KeywordMatch:
+    counts: Dict[str, int] = field(default_factory=dict)  # group -> number of hits
+    keywords: List[str] = field(default_factory=list)
+
+    def __contains__(self, group: object) -> bool:
+        return group in self.counts
+
+    def hits(self, group: str) -> int:
+        return self.counts.get(group, 0)
+
+    @property
+    def total_hits(self) -> int:
+        return len(self.keywords)
+
+
+class KeywordMatcher:
+    """Matches groups of keywords against text in a single regex pass.
+
+    All keywords are compiled into one alternation anchored on word
+    boundaries, so "sec" does not match "second" and "war" does not match
+    "software". Multi-word keywords tolerate any whitespace between words and
+    a trailing plural "s"/"es" is accepted.
+    """
+
+    # Texts in a batch are joined with a character that is neither a word
+    # character nor whitespace, so no match can span two texts.
+    SEPARATOR = "\x00"
+
+    def __init__(self, groups: Mapping[str, Iterable[str]]) -> None:
+        self._groups_by_keyword: Dict[str, Set[str]] = {}
+        for group, keywords in groups.items():
+            for keyword in keywords:
+                normalized = self._normalize(keyword)
+                self._groups_by_keyword.setdefault(normalized, set()).add(group)
+
+        # Longest first so "trade war" wins over "war" at the same position.
+        ordered = sorted(self._groups_by_keyword, key=len, reverse=True)
+        alternation = "|".join(
+            r"\s+".join(re.escape(word) for word in keyword.split())
+            for keyword in ordered
+        )
+        self._pattern = re.compile(rf"\b({alternation})(?:e?s)?\b", re.IGNORECASE)
+
+    def match(self, text: str) -> KeywordMatch:
+        """Find every keyword group present in a text.
+
+        Args:
+            text: Text to scan.
+
+        Returns:
+            KeywordMatch with per-group hit counts and the matched keywords.
+        """
+        result = KeywordMatch()
+        for m in self._pattern.finditer(text):
+            self._record(result, m.group(1))
+        return result
+
+    def match_many(self, texts: List[str]) -> List[KeywordMatch]:
+        """Match a batch of texts with a single scan over their concatenation.
+
+        Args:
+            texts: Texts to scan.
+
+        Returns:
+            One KeywordMatch per input text, in the same order.
+        """
+        results = [KeywordMatch() for _ in texts]
+        if not texts:
+            return results
+
+        starts: List[int] = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + len(self.SEPARATOR)
+
+        joined = self.SEPARATOR.join(text.replace(self.SEPARATOR, " ") for text in texts)
+        for m in self._pattern.finditer(joined):
+            index = bisect_right(starts, m.start()) - 1
+            self._record(results[index], m.group(1))
+        return results
+
+    def _record(self, result: KeywordMatch, matched: str) -> None:
+        keyword = self._normalize(matched)
+        result.keywords.append(keyword)
+        for group in self._groups_by_keyword.get(keyword, ()):
+            result.counts[group] = result.counts.get(group, 0) + 1
+
+    @staticmethod
+    def _normalize(keyword: str) -> str:
+        return " ".join(keyword.lower().split())
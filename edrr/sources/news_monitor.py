@@ -1,11 +1,20 @@
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-import uuid
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 
 import aiohttp
 
 from edrr.models.events import Event, EventCategory, EventTier
 from edrr.sources.base import EventSource
+from edrr.sources.http_client import HTTPClient
+from edrr.sources.keyword_matcher import KeywordMatch, KeywordMatcher
+
+if TYPE_CHECKING:
+    from edrr.analysis.llm_client import LLMClient
 
 
 EMERGING_KEYWORDS = {
@@ -14,7 +23,7 @@ EMERGING_KEYWORDS = {
         "conflict", "nuclear", "missile", "attack", "terrorism", "coup",
     ],
     "presidential": [
-        "president", "executive order", "white house", "oval office",
+        "president", "presidential", "executive order", "white house", "oval office",
         "presidential address", "state of the union", "emergency declaration",
     ],
     "regulatory": [
@@ -28,8 +37,53 @@ IMPACT_HOURS_BY_CATEGORY = {
     EventCategory.REGULATORY: 12,
 }
 
+ASSET_HINT_KEYWORDS = {
+    "crypto": ["crypto", "cryptocurrency", "cryptocurrencies", "bitcoin", "digital asset"],
+    "gold": ["gold", "precious metal"],
+}
+
+NEWS_MATCHER = KeywordMatcher({**EMERGING_KEYWORDS, **ASSET_HINT_KEYWORDS})
+
 DEFAULT_IMPACT_HOURS = 6
 
+DEFAULT_MAX_SEEN_ARTICLES = 5000
+
+# An article is clear-cut for the keyword classifier when one category has at
+# least this many keyword hits and no other category matched at all.
+CLEAR_CATEGORY_HITS = 2
+
+MIN_LLM_CONFIDENCE = 0.5
+KNOWN_ASSETS = ("SPY", "QQQ", "BTC", "GOLD")
+
+ACCEPT = "accept"
+REJECT = "reject"
+AMBIGUOUS = "ambiguous"
+
+
+@dataclass
+class CascadeStats:
+    articles: int = 0
+    keyword_accepted: int = 0
+    keyword_rejected: int = 0
+    ambiguous: int = 0
+    llm_classified: int = 0
+    llm_fallbacks: int = 0  # Ambiguous articles decided by keywords because the LLM failed
+    keyword_seconds: float = 0.0
+    llm_seconds: float = 0.0
+    llm_calls: int = 0  # LLM requests sent for escalations, including batch splits and retries
+
+    @property
+    def llm_fraction(self) -> float:
+        return self.llm_classified / self.articles if self.articles else 0.0
+
+    @property
+    def keyword_seconds_per_article(self) -> float:
+        return self.keyword_seconds / self.articles if self.articles else 0.0
+
+    @property
+    def llm_seconds_per_call(self) -> float:
+        return self.llm_seconds / self.llm_calls if self.llm_calls else 0.0
+
 
 class NewsMonitorSource(EventSource):
     """Event source that monitors news feeds for emerging Tier 3 events.
@@ -38,27 +92,67 @@ class NewsMonitorSource(EventSource):
     - Geopolitical events (conflicts, sanctions, trade wars)
     - Unscheduled presidential announcements
     - Regulatory actions and investigations
+    
+    Polling is incremental: only articles published at or after the newest
+    one seen so far are requested, and a bounded set of article fingerprints
+    skips stories that were already processed on an earlier poll.
+    
+    Classification is a cascade: keyword matching decides clear-cut articles,
+    and only ambiguous ones (a single weak hit or conflicting categories) are
+    sent to the LLM, in batches, when an LLM client is configured.
     """
 
-    def __init__(self, api_key: Optional[str] = None, api_url: Optional[str] = None):
+    incremental = True
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_url: Optional[str] = None,
+        http_client: Optional[HTTPClient] = None,
+        max_seen_articles: int = DEFAULT_MAX_SEEN_ARTICLES,
+        llm_client: Optional["LLMClient"] = None,
+    ):
         self.api_key = api_key
         self.api_url = api_url or "https://newsapi.org/v2/top-headlines"
+        self.http_client = http_client or HTTPClient()
+        self.max_seen_articles = max_seen_articles
+        self._watermark: Optional[datetime] = None
+        self._seen_fingerprints: "OrderedDict[str, None]" = OrderedDict()
+        self.llm_client = llm_client
+        self.cascade_stats = CascadeStats()
 
     async def fetch_events(self) -> List[Event]:
         """Fetch emerging events from news API feeds.
         
         Returns:
-            List of Event objects for detected emerging events.
+            List of Event objects for articles not seen on an earlier poll.
         """
-        events: List[Event] = []
-        
         articles = await self._poll_news_api()
         
+        newest = self._watermark
+        candidates: List[Dict[str, Any]] = []
+        fingerprints: Dict[str, None] = {}
         for article in articles:
-            event = self._classify_article(article)
-            if event:
-                events.append(event)
+            published_at = self._parse_published_at(article.get("publishedAt"))
+            if published_at and self._watermark and published_at < self._watermark:
+                continue
+            
+            fingerprint = self._fingerprint(article)
+            if fingerprint in self._seen_fingerprints or fingerprint in fingerprints:
+                continue
+            fingerprints[fingerprint] = None
+            
+            if published_at and (newest is None or published_at > newest):
+                newest = published_at
+            
+            candidates.append(article)
         
+        events = [event for event in await self.classify_with_cascade(candidates) if event]
+        # Only mark articles seen once classified: if the fetch is cancelled at
+        # its deadline while the LLM is slow, the next poll picks them up again.
+        for fingerprint in fingerprints:
+            self._remember(fingerprint)
+        self._watermark = newest
         return events
 
     def get_source_name(self) -> str:
@@ -73,56 +167,214 @@ class NewsMonitorSource(EventSource):
         if not self.api_key:
             return []
         
-        params = {
+        params = self._build_params()
+        
+        try:
+            data = await self.http_client.get_json(self.api_url, params=params)
+        except aiohttp.ClientError:
+            return []
+        
+        if not isinstance(data, dict):
+            return []
+        return data.get("articles", [])
+
+    def _build_params(self) -> Dict[str, Any]:
+        params: Dict[str, Any] = {
             "apiKey": self.api_key,
             "category": "business",
             "country": "us",
             "pageSize": 50,
         }
+        if self._watermark:
+            params["from"] = self._watermark.strftime("%Y-%m-%dT%H:%M:%S")
+        return params
+
+    def _fingerprint(self, article: Dict[str, Any]) -> str:
+        """Identify an article by URL, falling back to its normalized title."""
+        url = article.get("url")
+        if url:
+            key = f"url:{url}"
+        else:
+            title = re.sub(r"\W+", " ", (article.get("title") or "").lower()).strip()
+            key = f"title:{title}"
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def _remember(self, fingerprint: str) -> None:
+        self._seen_fingerprints[fingerprint] = None
+        while len(self._seen_fingerprints) > self.max_seen_articles:
+            self._seen_fingerprints.popitem(last=False)
+
+    def _parse_published_at(self, published_at: Optional[str]) -> Optional[datetime]:
+        """Parse a publishedAt timestamp into an aware UTC datetime."""
+        if not published_at:
+            return None
+        try:
+            parsed = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
+        except (ValueError, AttributeError):
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.astimezone(timezone.utc)
+
+    def classify_articles(self, articles: List[Dict[str, Any]]) -> List[Optional[Event]]:
+        """Classify a page of articles with one keyword pass over all of them.
+        
+        Args:
+            articles: Article dictionaries from the news API.
+            
+        Returns:
+            One entry per article: an Event if market-moving, None otherwise.
+        """
+        matches = NEWS_MATCHER.match_many([self._article_text(a) for a in articles])
+        return [
+            self._classify_article(article, match)
+            for article, match in zip(articles, matches)
+        ]
+
+    async def classify_with_cascade(self, articles: List[Dict[str, Any]]) -> List[Optional[Event]]:
+        """Classify articles with keywords, escalating only ambiguous ones to the LLM.
+        
+        Without a configured LLM client every article is decided by keywords,
+        exactly as classify_articles does.
+        
+        Returns:
+            One entry per article: an Event if market-moving, None otherwise.
+        """
+        stats = self.cascade_stats
+        started = time.perf_counter()
+        matches = NEWS_MATCHER.match_many([self._article_text(a) for a in articles])
+        llm_client = self.llm_client
+        use_llm = llm_client is not None and llm_client.client is not None
+        
+        results: List[Optional[Event]] = []
+        escalated: List[int] = []
+        for i, (article, match) in enumerate(zip(articles, matches)):
+            verdict = self._keyword_verdict(match)
+            if verdict == REJECT:
+                stats.keyword_rejected += 1
+                results.append(None)
+            elif verdict == AMBIGUOUS and use_llm:
+                stats.ambiguous += 1
+                escalated.append(i)
+                results.append(None)
+            else:
+                if verdict == AMBIGUOUS:
+                    stats.ambiguous += 1
+                stats.keyword_accepted += 1
+                results.append(self._classify_article(article, match))
+        stats.articles += len(articles)
+        stats.keyword_seconds += time.perf_counter() - started
+        
+        if escalated and llm_client is not None:
+            started = time.perf_counter()
+            requests_before = llm_client.metrics.requests
+            classifications = await llm_client.classify_news_batch([
+                (articles[i].get("title") or "", articles[i].get("description") or "")
+                for i in escalated
+            ])
+            stats.llm_calls += llm_client.metrics.requests - requests_before
+            stats.llm_seconds += time.perf_counter() - started
+            
+            for i, classification in zip(escalated, classifications):
+                if classification is None:
+                    stats.llm_fallbacks += 1
+                    results[i] = self._classify_article(articles[i], matches[i])
+                else:
+                    stats.llm_classified += 1
+                    results[i] = self._event_from_classification(articles[i], classification)
+        
+        return results
+
+    def _keyword_verdict(self, match: KeywordMatch) -> str:
+        """Decide whether keyword matching alone can classify an article."""
+        geopolitical = match.hits("geopolitical") + match.hits("presidential")
+        regulatory = match.hits("regulatory")
+        if not geopolitical and not regulatory:
+            return REJECT
+        if geopolitical and regulatory:
+            return AMBIGUOUS
+        if max(geopolitical, regulatory) < CLEAR_CATEGORY_HITS:
+            return AMBIGUOUS
+        return ACCEPT
+
+    def _event_from_classification(
+        self,
+        article: Dict[str, Any],
+        classification: Dict[str, Any],
+    ) -> Optional[Event]:
+        """Build an Event from an LLM classification, or None if not market-moving."""
+        if not classification.get("is_market_moving"):
+            return None
+        if classification.get("confidence", 0.0) < MIN_LLM_CONFIDENCE:
+            return None
+        
+        category = classification.get("category")
+        if not isinstance(category, EventCategory):
+            return None
+        tier = classification.get("tier")
+        if not isinstance(tier, EventTier):
+            tier = EventTier.TIER_3
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.api_url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data.get("articles", [])
-                    return []
-        except aiohttp.ClientError:
-            return []
+            impact_hours = min(48.0, max(1.0, float(classification.get("impact_hours", DEFAULT_IMPACT_HOURS))))
+        except (TypeError, ValueError):
+            impact_hours = DEFAULT_IMPACT_HOURS
+        assets = [a for a in KNOWN_ASSETS if a in (classification.get("affected_assets") or [])]
+        
+        scheduled_time = self._scheduled_time(article)
+        title_text = article.get("title", "Unknown News Event")
+        return Event(
+            id=self.make_event_id("news", title_text, scheduled_time),
+            title=title_text,
+            category=category,
+            tier=tier,
+            scheduled_time=scheduled_time,
+            impact_window=timedelta(hours=impact_hours),
+            affected_assets=assets or ["SPY", "QQQ"],
+        )
 
-    def _classify_article(self, article: Dict[str, Any]) -> Optional[Event]:
+    def _scheduled_time(self, article: Dict[str, Any]) -> datetime:
+        published_at = self._parse_published_at(article.get("publishedAt"))
+        if published_at:
+            # Other sources use naive local times; match them so scoring can compare.
+            return published_at.astimezone().replace(tzinfo=None)
+        return datetime.now()
+
+    def _article_text(self, article: Dict[str, Any]) -> str:
+        title = article.get("title") or ""
+        description = article.get("description") or ""
+        return f"{title} {description}"
+
+    def _classify_article(
+        self,
+        article: Dict[str, Any],
+        match: Optional[KeywordMatch] = None,
+    ) -> Optional[Event]:
         """Classify a news article and create an Event if relevant.
         
         Args:
             article: Article dictionary from news API.
+            match: Precomputed keyword match for the article, if available.
             
         Returns:
             Event object if article is classified as market-moving, None otherwise.
         """
-        title = article.get("title", "").lower()
-        description = article.get("description", "").lower() if article.get("description") else ""
-        content = f"{title} {description}"
+        if match is None:
+            match = NEWS_MATCHER.match(self._article_text(article))
         
-        category = self._detect_category(content)
+        category = self._detect_category(match)
         if not category:
             return None
         
         impact_hours = IMPACT_HOURS_BY_CATEGORY.get(category, DEFAULT_IMPACT_HOURS)
         
-        published_at = article.get("publishedAt")
-        if published_at:
-            try:
-                scheduled_time = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
-            except (ValueError, AttributeError):
-                scheduled_time = datetime.utcnow()
-        else:
-            scheduled_time = datetime.utcnow()
-        
-        affected_assets = self._determine_affected_assets(category, content)
+        scheduled_time = self._scheduled_time(article)
+        affected_assets = self._determine_affected_assets(category, match)
+        title_text = article.get("title", "Unknown News Event")
         
         return Event(
-            id=f"news-{uuid.uuid4().hex[:8]}",
-            title=article.get("title", "Unknown News Event"),
+            id=self.make_event_id("news", title_text, scheduled_time),
+            title=title_text,
             category=category,
             tier=EventTier.TIER_3,
             scheduled_time=scheduled_time,
@@ -130,35 +382,29 @@ class NewsMonitorSource(EventSource):
             affected_assets=affected_assets,
         )
 
-    def _detect_category(self, content: str) -> Optional[EventCategory]:
-        """Detect the event category based on content keywords.
+    def _detect_category(self, match: KeywordMatch) -> Optional[EventCategory]:
+        """Detect the event category from matched keywords.
         
         Args:
-            content: Combined title and description text.
+            match: Keyword match for the article's title and description.
             
         Returns:
             EventCategory if detected, None otherwise.
         """
-        for keyword in EMERGING_KEYWORDS["geopolitical"]:
-            if keyword in content:
-                return EventCategory.GEOPOLITICAL
-        
-        for keyword in EMERGING_KEYWORDS["presidential"]:
-            if keyword in content:
-                return EventCategory.GEOPOLITICAL
+        if "geopolitical" in match or "presidential" in match:
+            return EventCategory.GEOPOLITICAL
         
-        for keyword in EMERGING_KEYWORDS["regulatory"]:
-            if keyword in content:
-                return EventCategory.REGULATORY
+        if "regulatory" in match:
+            return EventCategory.REGULATORY
         
         return None
 
-    def _determine_affected_assets(self, category: EventCategory, content: str) -> List[str]:
+    def _determine_affected_assets(self, category: EventCategory, match: KeywordMatch) -> List[str]:
         """Determine which assets are affected by this event.
         
         Args:
             category: The event category.
-            content: Combined title and description text.
+            match: Keyword match for the article's title and description.
             
         Returns:
             List of affected asset symbols.
@@ -169,16 +415,14 @@ class NewsMonitorSource(EventSource):
             assets.extend(["BTC", "GOLD"])
         
         if category == EventCategory.REGULATORY:
-            if "crypto" in content or "bitcoin" in content or "digital asset" in content:
+            if "crypto" in match:
                 assets.append("BTC")
             assets.append("GOLD")
         
-        if "gold" in content or "precious metal" in content:
-            if "GOLD" not in assets:
-                assets.append("GOLD")
+        if "gold" in match and "GOLD" not in assets:
+            assets.append("GOLD")
         
-        if "bitcoin" in content or "crypto" in content:
-            if "BTC" not in assets:
-                assets.append("BTC")
+        if "crypto" in match and "BTC" not in assets:
+            assets.append("BTC")
         
-        return list(set(assets))
+        return assets
@@ -0,0 +1 @@
+"""Event storage for EDRR"""
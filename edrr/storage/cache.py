@@ -0,0 +1,187 @@
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+from redis import asyncio as redis_asyncio
+from redis.exceptions import RedisError
+
+from edrr.models.config import Config
+from edrr.models.events import Event
+from edrr.models.serialization import event_from_dict, event_to_dict
+
+
+logger = logging.getLogger(__name__)
+
+
+def source_key(source_name: str) -> str:
+    return f"source:{source_name}"
+
+
+class Cache(ABC):
+    """Small async key/value interface shared by EDRR processes.
+
+    Values are strings (JSON documents); expiry is handled by the backend.
+    """
+
+    shared: bool = False  # True when other processes see the same entries
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl_seconds: Optional[float] = None) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def get_json(self, key: str) -> Optional[Any]:
+        raw = await self.get(key)
+        if raw is None:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+    async def set_json(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        await self.set(key, json.dumps(value, separators=(",", ":")), ttl_seconds)
+
+    async def get_source_events(self, source_name: str) -> Optional[List[Event]]:
+        """Return a source's last cached fetch result, or None if absent or expired."""
+        data = await self.get_json(source_key(source_name))
+        if not isinstance(data, list):
+            return None
+        try:
+            return [event_from_dict(item) for item in data]
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    async def set_source_events(
+        self,
+        source_name: str,
+        events: List[Event],
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        await self.set_json(
+            source_key(source_name),
+            [event_to_dict(event) for event in events],
+            ttl_seconds,
+        )
+
+
+class MemoryCache(Cache):
+    """In-process cache with per-key expiry."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Tuple[str, Optional[float]]] = {}
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: str, ttl_seconds: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds else None
+        self._entries[key] = (value, expires_at)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+
+class RedisCache(Cache):
+    """Redis-backed cache that degrades to an in-process cache.
+
+    When Redis is unreachable, reads and writes go to a MemoryCache and Redis
+    is retried after `retry_seconds`, so an outage costs one failed round
+    trip per retry period instead of one per call.
+    """
+
+    shared = True
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        prefix: str = "edrr:",
+        client: Optional[Any] = None,
+        socket_timeout: float = 1.0,
+        retry_seconds: float = 30.0,
+    ) -> None:
+        self.prefix = prefix
+        self.retry_seconds = retry_seconds
+        self.client = client or redis_asyncio.Redis(
+            host=host,
+            port=port,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_timeout,
+            decode_responses=True,
+        )
+        self.fallback = MemoryCache()
+        self._down_until = 0.0
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self._down_until
+
+    def _mark_down(self, error: Exception) -> None:
+        if self.available:
+            logger.warning(
+                "Redis unavailable (%s: %s); using in-process cache", type(error).__name__, error
+            )
+        self._down_until = time.monotonic() + self.retry_seconds
+
+    async def get(self, key: str) -> Optional[str]:
+        if self.available:
+            try:
+                value = await self.client.get(self.prefix + key)
+                if isinstance(value, bytes):
+                    value = value.decode("utf-8")
+                return value
+            except (RedisError, OSError) as e:
+                self._mark_down(e)
+        return await self.fallback.get(key)
+
+    async def set(self, key: str, value: str, ttl_seconds: Optional[float] = None) -> None:
+        await self.fallback.set(key, value, ttl_seconds)
+        if not self.available:
+            return
+        try:
+            px = int(ttl_seconds * 1000) if ttl_seconds else None
+            await self.client.set(self.prefix + key, value, px=px)
+        except (RedisError, OSError) as e:
+            self._mark_down(e)
+
+    async def delete(self, key: str) -> None:
+        await self.fallback.delete(key)
+        if not self.available:
+            return
+        try:
+            await self.client.delete(self.prefix + key)
+        except (RedisError, OSError) as e:
+            self._mark_down(e)
+
+    async def close(self) -> None:
+        try:
+            await self.client.aclose()
+        except (RedisError, OSError):
+            pass
+
+
+def create_cache(config: Config) -> Cache:
+    """Use Redis when a host is configured, otherwise an in-process cache."""
+    if config.redis_host:
+        return RedisCache(host=config.redis_host, port=config.redis_port or 6379)
+    return MemoryCache()
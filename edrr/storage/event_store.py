@@ -0,0 +1,143 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from edrr.models.events import Event
+
+
+@dataclass
+class EventDiff:
+    added: List[Event] = field(default_factory=list)
+    changed: List[Event] = field(default_factory=list)
+    removed: List[Event] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not (self.added or self.changed or self.removed)
+
+    def extend(self, other: "EventDiff") -> None:
+        self.added.extend(other.added)
+        self.changed.extend(other.changed)
+        self.removed.extend(other.removed)
+
+
+class EventStore:
+    """In-memory event store keyed by event id, tracked per source.
+
+    Each fetch is compared against what the source returned last time so
+    downstream consumers can work on the delta instead of the full event list.
+    """
+
+    def __init__(self) -> None:
+        self._events: Dict[str, Event] = {}
+        self._source_ids: Dict[str, Dict[str, None]] = {}
+        self._cached_events: Optional[List[Event]] = None
+        self.version = 0
+
+    def replace_source(self, source: str, events: Iterable[Event]) -> EventDiff:
+        """Replace everything known for a source with a fresh fetch.
+
+        Args:
+            source: Name of the source the events came from.
+            events: The complete current result of the source.
+
+        Returns:
+            EventDiff describing added, changed and removed events.
+        """
+        incoming = {event.id: event for event in events}
+        previous_ids = self._source_ids.get(source, {})
+        removed = [self._events[event_id] for event_id in previous_ids if event_id not in incoming]
+
+        diff = self._upsert(source, incoming.values())
+        for event in removed:
+            self._remove(source, event.id)
+        diff.removed.extend(removed)
+
+        self._bump(diff)
+        return diff
+
+    def merge_source(self, source: str, events: Iterable[Event]) -> EventDiff:
+        """Add or update events for a source without removing earlier ones.
+
+        Args:
+            source: Name of the source the events came from.
+            events: Events to merge in.
+
+        Returns:
+            EventDiff describing added and changed events.
+        """
+        incoming = {event.id: event for event in events}
+        diff = self._upsert(source, incoming.values())
+        self._bump(diff)
+        return diff
+
+    def remove(self, event_ids: Iterable[str]) -> EventDiff:
+        """Remove events by id regardless of source."""
+        diff = EventDiff()
+        for event_id in event_ids:
+            event = self._events.get(event_id)
+            if event is None:
+                continue
+            for source, ids in self._source_ids.items():
+                if event_id in ids:
+                    self._remove(source, event_id)
+                    break
+            diff.removed.append(event)
+        self._bump(diff)
+        return diff
+
+    def prune_expired(self, source: str, current_time: datetime) -> EventDiff:
+        """Remove a source's events whose impact window has already ended.
+
+        Only needed for incremental sources; full-refresh sources drop stale
+        events themselves on the next replace.
+        """
+        expired = [
+            event.id for event in self.get_source_events(source)
+            if event.scheduled_time + event.impact_window < current_time
+        ]
+        return self.remove(expired)
+
+    def get_events(self) -> List[Event]:
+        if self._cached_events is None:
+            self._cached_events = [
+                self._events[event_id]
+                for ids in self._source_ids.values()
+                for event_id in ids
+            ]
+        return self._cached_events
+
+    def get_source_events(self, source: str) -> List[Event]:
+        return [self._events[event_id] for event_id in self._source_ids.get(source, {})]
+
+    def get(self, event_id: str) -> Optional[Event]:
+        return self._events.get(event_id)
+
+    def __contains__(self, event_id: object) -> bool:
+        return event_id in self._events
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def _upsert(self, source: str, events: Iterable[Event]) -> EventDiff:
+        diff = EventDiff()
+        source_ids = self._source_ids.setdefault(source, {})
+        for event in events:
+            existing = self._events.get(event.id)
+            if existing is None:
+                diff.added.append(event)
+            elif existing != event:
+                diff.changed.append(event)
+            else:
+                continue
+            self._events[event.id] = event
+            source_ids[event.id] = None
+        return diff
+
+    def _remove(self, source: str, event_id: str) -> None:
+        self._events.pop(event_id, None)
+        self._source_ids.get(source, {}).pop(event_id, None)
+
+    def _bump(self, diff: EventDiff) -> None:
+        if not diff.is_empty():
+            self.version += 1
+            self._cached_events = None
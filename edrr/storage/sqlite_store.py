@@ -0,0 +1,208 @@
+import json
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from edrr.models.events import Event, EventCategory, EventTier
+from edrr.storage.event_store import EventDiff
+
+
+TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"  # Fixed width, so text order is time order
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    title TEXT NOT NULL,
+    category TEXT NOT NULL,
+    tier INTEGER NOT NULL,
+    scheduled_time TEXT NOT NULL,
+    impact_seconds REAL NOT NULL,
+    impact_end TEXT NOT NULL,
+    affected_assets TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_scheduled_time ON events(scheduled_time);
+CREATE INDEX IF NOT EXISTS idx_events_category ON events(category, scheduled_time);
+CREATE INDEX IF NOT EXISTS idx_events_impact_end ON events(impact_end);
+CREATE INDEX IF NOT EXISTS idx_events_source ON events(source);
+
+CREATE TABLE IF NOT EXISTS event_assets (
+    asset TEXT NOT NULL,
+    event_id TEXT NOT NULL REFERENCES events(id) ON DELETE CASCADE,
+    PRIMARY KEY (asset, event_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_event_assets_event ON event_assets(event_id);
+
+CREATE TABLE IF NOT EXISTS source_fetches (
+    source TEXT PRIMARY KEY,
+    fetched_at TEXT NOT NULL
+);
+"""
+
+EVENT_COLUMNS = (
+    "e.source, e.id, e.title, e.category, e.tier, "
+    "e.scheduled_time, e.impact_seconds, e.affected_assets"
+)
+
+
+def _format_time(value: datetime) -> str:
+    return value.strftime(TIME_FORMAT)
+
+
+def _parse_time(value: str) -> datetime:
+    return datetime.strptime(value, TIME_FORMAT)
+
+
+class SQLiteEventStore:
+    """On-disk copy of the event store for warm restarts.
+
+    Events are written through after every fetch and loaded back in one bulk
+    read at startup, so outputs can be served before any source responds.
+    Range, category and asset lookups and expiry pruning are index-backed.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def apply_diff(
+        self,
+        source: str,
+        diff: EventDiff,
+        fetched_at: Optional[datetime] = None,
+    ) -> None:
+        """Persist one source's EventDiff and record when it was fetched.
+
+        Args:
+            source: Name of the source the diff belongs to.
+            diff: Diff returned by the in-memory EventStore.
+            fetched_at: Fetch time to record; skipped when None.
+        """
+        with self._conn:
+            self._delete([event.id for event in diff.removed])
+            self._upsert(source, diff.added + diff.changed)
+            if fetched_at is not None:
+                self._conn.execute(
+                    "INSERT INTO source_fetches (source, fetched_at) VALUES (?, ?) "
+                    "ON CONFLICT(source) DO UPDATE SET fetched_at = excluded.fetched_at",
+                    (source, _format_time(fetched_at)),
+                )
+
+    def load(self) -> Dict[str, List[Event]]:
+        """Read every stored event, grouped by source, in one query."""
+        by_source: Dict[str, List[Event]] = {}
+        rows = self._conn.execute(f"SELECT {EVENT_COLUMNS} FROM events e ORDER BY e.rowid")
+        for row in rows:
+            by_source.setdefault(row[0], []).append(self._row_to_event(row))
+        return by_source
+
+    def query(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        category: Optional[EventCategory] = None,
+        asset: Optional[str] = None,
+    ) -> List[Event]:
+        """Return events scheduled in [start, end], optionally filtered."""
+        clauses: List[str] = []
+        params: List[object] = []
+        if start is not None:
+            clauses.append("e.scheduled_time >= ?")
+            params.append(_format_time(start))
+        if end is not None:
+            clauses.append("e.scheduled_time <= ?")
+            params.append(_format_time(end))
+        if category is not None:
+            clauses.append("e.category = ?")
+            params.append(category.value)
+
+        sql = f"SELECT {EVENT_COLUMNS} FROM events e"
+        if asset is not None:
+            sql += " JOIN event_assets a ON a.event_id = e.id AND a.asset = ?"
+            params.insert(0, asset)
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY e.scheduled_time"
+        return [self._row_to_event(row) for row in self._conn.execute(sql, params)]
+
+    def prune_expired(self, current_time: datetime) -> int:
+        """Delete events whose impact window ended before current_time.
+
+        Returns:
+            Number of events deleted.
+        """
+        with self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM events WHERE impact_end < ?",
+                (_format_time(current_time),),
+            )
+        return cursor.rowcount
+
+    def last_fetched(self) -> Dict[str, datetime]:
+        rows = self._conn.execute("SELECT source, fetched_at FROM source_fetches")
+        return {source: _parse_time(fetched_at) for source, fetched_at in rows}
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    def _upsert(self, source: str, events: List[Event]) -> None:
+        if not events:
+            return
+        self._conn.executemany(
+            "INSERT INTO events (id, source, title, category, tier, scheduled_time, "
+            "impact_seconds, impact_end, affected_assets) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET source = excluded.source, title = excluded.title, "
+            "category = excluded.category, tier = excluded.tier, "
+            "scheduled_time = excluded.scheduled_time, impact_seconds = excluded.impact_seconds, "
+            "impact_end = excluded.impact_end, affected_assets = excluded.affected_assets",
+            [
+                (
+                    event.id,
+                    source,
+                    event.title,
+                    event.category.value,
+                    event.tier.value,
+                    _format_time(event.scheduled_time),
+                    event.impact_window.total_seconds(),
+                    _format_time(event.scheduled_time + event.impact_window),
+                    json.dumps(list(event.affected_assets)),
+                )
+                for event in events
+            ],
+        )
+        self._conn.executemany(
+            "DELETE FROM event_assets WHERE event_id = ?",
+            [(event.id,) for event in events],
+        )
+        self._conn.executemany(
+            "INSERT INTO event_assets (asset, event_id) VALUES (?, ?)",
+            [
+                (asset, event.id)
+                for event in events
+                for asset in dict.fromkeys(event.affected_assets)
+            ],
+        )
+
+    def _delete(self, event_ids: List[str]) -> None:
+        if event_ids:
+            self._conn.executemany("DELETE FROM events WHERE id = ?", [(i,) for i in event_ids])
+
+    def _row_to_event(self, row: tuple) -> Event:
+        _, event_id, title, category, tier, scheduled_time, impact_seconds, assets = row
+        return Event(
+            id=event_id,
+            title=title,
+            category=EventCategory(category),
+            tier=EventTier(tier),
+            scheduled_time=_parse_time(scheduled_time),
+            impact_window=timedelta(seconds=impact_seconds),
+            affected_assets=json.loads(assets),
+        )
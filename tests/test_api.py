@@ -0,0 +1,224 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from aiohttp.test_utils import TestClient, TestServer
+
+from edrr.analysis.risk_aggregator import RiskAggregator
+from edrr.api.endpoints import EDRRApi
+from edrr.api.response_cache import CachedResponse, ResponseCache, etag_matches, make_etag
+from edrr.models.config import Config
+from edrr.models.events import Event, EventCategory, EventTier
+
+
+def _create_event(event_id: str, hours_ahead: float = 2) -> Event:
+    return Event(
+        id=event_id,
+        title=f"Event {event_id}",
+        category=EventCategory.ECONOMIC,
+        tier=EventTier.TIER_1,
+        scheduled_time=datetime.now() + timedelta(hours=hours_ahead),
+        impact_window=timedelta(hours=2),
+        affected_assets=["SPY", "QQQ"],
+    )
+
+
+def _run_with_client(api: EDRRApi, scenario):
+    async def runner():
+        client = TestClient(TestServer(api.create_app()))
+        await client.start_server()
+        try:
+            return await scenario(client)
+        finally:
+            await client.close()
+
+    return asyncio.run(runner())
+
+
+class TestEtags:
+    def test_make_etag_is_strong_and_stable(self):
+        etag = make_etag(b"{}")
+        assert etag.startswith('"') and etag.endswith('"')
+        assert make_etag(b"{}") == etag
+        assert make_etag(b"[]") != etag
+
+    def test_etag_matches(self):
+        etag = make_etag(b"{}")
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", {etag}', etag)
+        assert etag_matches(f"W/{etag}", etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('"other"', etag)
+        assert not etag_matches(None, etag)
+
+
+class TestResponseCache:
+    def test_new_generation_drops_entries(self):
+        cache = ResponseCache()
+        first = (1, datetime(2025, 1, 15, 12))
+        response = CachedResponse(status=200, body=b"{}", etag=make_etag(b"{}"))
+        assert cache.get(first, ("risk", None)) is None
+        cache.set(first, ("risk", None), response)
+        assert cache.get(first, ("risk", None)) is response
+        assert cache.get((2, first[1]), ("risk", None)) is None
+        assert len(cache) == 0
+        assert (cache.hits, cache.misses) == (1, 2)
+
+
+class TestCachedEndpoints:
+    def setup_method(self):
+        # A day-long bucket keeps every request in a test in one generation.
+        self.config = Config(snapshot_bucket_seconds=86400)
+        self.aggregator = RiskAggregator(self.config)
+        self.aggregator.set_events([_create_event("a")])
+        self.api = EDRRApi(self.aggregator, self.config)
+
+    def test_conditional_get(self):
+        async def scenario(client):
+            first = await client.get("/risk")
+            body = await first.json()
+            etag = first.headers["ETag"]
+            second = await client.get("/risk", headers={"If-None-Match": etag})
+            return first, body, second, await second.read()
+
+        first, body, second, second_body = _run_with_client(self.api, scenario)
+        assert first.status == 200
+        assert body["SPY"]["score"] > 1
+        assert "max-age=" in first.headers["Cache-Control"]
+        assert second.status == 304
+        assert second.headers["ETag"] == first.headers["ETag"]
+        assert second_body == b""
+
+    def test_repeat_requests_hit_cache(self):
+        calls = []
+        get_snapshot = self.aggregator.get_snapshot
+
+        def counting_get_snapshot(current_time=None):
+            calls.append(current_time)
+            return get_snapshot(current_time)
+
+        self.aggregator.get_snapshot = counting_get_snapshot
+
+        async def scenario(client):
+            for _ in range(5):
+                response = await client.get("/risk/spy")
+                assert response.status == 200
+            assert len(calls) == 1
+            await client.get("/recommendation/SPY")
+            await client.get("/calendar/today")
+            await client.get("/calendar?view=today")
+
+        _run_with_client(self.api, scenario)
+        assert self.api.response_cache.hits == 5
+        assert self.api.response_cache.misses == 3
+
+    def test_event_change_invalidates(self):
+        async def scenario(client):
+            first = await client.get("/risk/SPY")
+            self.aggregator.set_events([_create_event("a"), _create_event("b", 0.5)])
+            second = await client.get(
+                "/risk/SPY",
+                headers={"If-None-Match": first.headers["ETag"]},
+            )
+            return first, second, await second.json()
+
+        first, second, body = _run_with_client(self.api, scenario)
+        assert second.status == 200
+        assert second.headers["ETag"] != first.headers["ETag"]
+        assert body["next_event"]["id"] == "b"
+
+    def test_unknown_asset(self):
+        async def scenario(client):
+            response = await client.get("/risk/XYZ")
+            return response, await response.json()
+
+        response, body = _run_with_client(self.api, scenario)
+        assert response.status == 404
+        assert "ETag" not in response.headers
+        assert body == {"error": "Unknown asset: XYZ"}
+
+
+class TestRiskTimeline:
+    def setup_method(self):
+        self.aggregator = RiskAggregator(Config(timeline_max_points=100))
+        self.aggregator.set_events([_create_event("a", 3)])
+        self.api = EDRRApi(self.aggregator, self.aggregator.config)
+
+    def _post(self, body):
+        async def scenario(client):
+            response = await client.post("/risk/timeline", json=body)
+            return response.status, await response.json()
+
+        return _run_with_client(self.api, scenario)
+
+    def test_range(self):
+        start = datetime.now().replace(microsecond=0)
+        status, body = self._post({
+            "assets": ["spy", "BTC"],
+            "start": start.isoformat(),
+            "end": (start + timedelta(hours=6)).isoformat(),
+            "step_minutes": 15,
+        })
+        assert status == 200
+        assert len(body["timestamps"]) == 25
+        assert set(body["scores"]) == {"SPY", "BTC"}
+        expected = self.aggregator.get_risk_timeline(
+            [datetime.fromisoformat(t) for t in body["timestamps"]], ["SPY"]
+        )
+        assert body["scores"]["SPY"] == expected["SPY"]
+        assert max(body["scores"]["SPY"]) > max(body["scores"]["BTC"])
+
+    def test_explicit_timestamps(self):
+        now = datetime.now()
+        stamps = [(now + timedelta(hours=h)).isoformat() for h in (10, 0, 4)]
+        status, body = self._post({"timestamps": stamps})
+        assert status == 200
+        assert body["timestamps"] == stamps
+        assert set(body["scores"]) == set(self.aggregator.DEFAULT_ASSETS)
+
+    def test_invalid_requests(self):
+        now = datetime.now().isoformat()
+        assert self._post({"start": now, "step_minutes": 15})[1] == {"error": "Missing field: end"}
+        assert self._post({"timestamps": ["soon"]})[0] == 400
+        assert self._post({"timestamps": [now], "assets": ["XYZ"]})[0] == 400
+        assert self._post({"start": now, "end": now, "step_minutes": 0})[0] == 400
+        status, body = self._post({"timestamps": [now] * 101})
+        assert status == 400
+        assert "at most 100" in body["error"]
+
+
+class TestEmbeddedApi:
+    def test_serves_live_engine_state(self):
+        from aiohttp import ClientSession
+
+        from edrr.api.endpoints import start_server
+        from edrr.engine import RiskRadarEngine
+        from edrr.storage.cache import MemoryCache
+
+        engine = RiskRadarEngine(Config(), cache=MemoryCache())
+        engine._sources = []
+
+        async def scenario():
+            runner = await start_server(engine.create_api(), "127.0.0.1", 0)
+            host, port = runner.addresses[0][:2]
+            url = f"http://{host}:{port}"
+            try:
+                async with ClientSession() as session:
+                    async with session.get(f"{url}/health") as response:
+                        before = (await response.json())["events_loaded"]
+                    engine._apply_event_diff(
+                        engine.event_store.replace_source("test", [_create_event("a")])
+                    )
+                    async with session.get(f"{url}/risk/SPY") as response:
+                        risk = await response.json()
+                    async with session.get(f"{url}/health") as response:
+                        after = (await response.json())["events_loaded"]
+            finally:
+                await runner.cleanup()
+                await engine.stop()
+            return before, risk, after
+
+        before, risk, after = asyncio.run(scenario())
+        assert before == 0
+        assert after == 1
+        assert risk["next_event"]["id"] == "a"
+        assert risk["score"] == engine.get_status()["SPY"].score
@@ -0,0 +1,28 @@
+from benchmarks.run import BENCHMARKS, run_suite
+from benchmarks.synthetic import DEFAULT_START, generate_events
+from edrr.models.events import EventCategory
+
+
+class TestSyntheticEvents:
+    def test_generation_is_deterministic(self):
+        assert generate_events(200, seed=7) == generate_events(200, seed=7)
+        assert generate_events(200, seed=7) != generate_events(200, seed=8)
+
+    def test_respects_assets_and_categories(self):
+        events = generate_events(
+            300,
+            assets=["BTC", "ETH"],
+            categories=[EventCategory.CRYPTO],
+        )
+        assert len({e.id for e in events}) == 300
+        assert all(e.category == EventCategory.CRYPTO for e in events)
+        assert all(set(e.affected_assets) <= {"BTC", "ETH"} for e in events)
+        assert min(e.scheduled_time for e in events) >= DEFAULT_START.replace(day=14)
+
+
+class TestBenchmarkSuite:
+    def test_runs_every_benchmark(self):
+        results = run_suite([50], repeats=1)
+        assert [r.benchmark for r in results] == list(BENCHMARKS)
+        assert all(r.events == 50 and r.best_seconds >= 0 for r in results)
+        assert all(r.peak_memory_bytes >= 0 for r in results)
@@ -0,0 +1,153 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from edrr.engine import RiskRadarEngine
+from edrr.models.config import Config
+from edrr.models.events import Event, EventCategory, EventTier
+from edrr.models.serialization import event_from_dict, event_to_dict
+from edrr.storage.cache import MemoryCache, RedisCache, create_cache
+from tests.test_engine import FakeSource, _create_event
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+requires_fakeredis = pytest.mark.skipif(fakeredis is None, reason="fakeredis is not installed")
+
+
+def _redis_cache(server=None) -> RedisCache:
+    server = server or fakeredis.FakeServer()
+    return RedisCache(client=fakeredis.aioredis.FakeRedis(server=server, decode_responses=True))
+
+
+class BrokenRedis:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get(self, key):
+        self.calls += 1
+        raise RedisConnectionError("connection refused")
+
+    async def set(self, key, value, px=None):
+        self.calls += 1
+        raise RedisConnectionError("connection refused")
+
+    async def delete(self, key):
+        self.calls += 1
+        raise RedisConnectionError("connection refused")
+
+    async def aclose(self):
+        pass
+
+
+class TestEventSerialization:
+    def test_round_trip(self):
+        event = Event(
+            id="e1",
+            title="CPI Release",
+            category=EventCategory.ECONOMIC,
+            tier=EventTier.TIER_1,
+            scheduled_time=datetime(2025, 1, 15, 8, 30),
+            impact_window=timedelta(hours=4),
+            affected_assets=["SPY", "GOLD"],
+        )
+        assert event_from_dict(event_to_dict(event)) == event
+
+
+class TestMemoryCache:
+    def test_set_get_delete(self):
+        async def scenario():
+            cache = MemoryCache()
+            await cache.set("k", "v")
+            assert await cache.get("k") == "v"
+            await cache.delete("k")
+            assert await cache.get("k") is None
+
+        asyncio.run(scenario())
+
+    def test_entries_expire(self):
+        async def scenario():
+            cache = MemoryCache()
+            await cache.set("k", "v", ttl_seconds=0.01)
+            await asyncio.sleep(0.02)
+            return await cache.get("k")
+
+        assert asyncio.run(scenario()) is None
+
+    def test_create_cache_without_redis_host(self):
+        assert isinstance(create_cache(Config(redis_host=None)), MemoryCache)
+        assert isinstance(create_cache(Config(redis_host="localhost")), RedisCache)
+
+
+@requires_fakeredis
+class TestRedisCache:
+    def test_source_events_shared_between_clients(self):
+        server = fakeredis.FakeServer()
+        events = [_create_event("a"), _create_event("b")]
+
+        async def scenario():
+            await _redis_cache(server).set_source_events("econ", events, ttl_seconds=60)
+            return await _redis_cache(server).get_source_events("econ")
+
+        assert asyncio.run(scenario()) == events
+
+    def test_ttl_applied(self):
+        async def scenario():
+            cache = _redis_cache()
+            await cache.set("k", "v", ttl_seconds=30)
+            return await cache.client.pttl("edrr:k")
+
+        assert 0 < asyncio.run(scenario()) <= 30000
+
+    def test_falls_back_to_memory_when_redis_down(self, caplog):
+        broken = BrokenRedis()
+        cache = RedisCache(client=broken, retry_seconds=60)
+
+        async def scenario():
+            await cache.set("k", "v")
+            first = await cache.get("k")
+            second = await cache.get("k")
+            return first, second
+
+        assert asyncio.run(scenario()) == ("v", "v")
+        assert not cache.available
+        assert broken.calls == 1
+        assert caplog.text.count("Redis unavailable") == 1
+
+
+@requires_fakeredis
+class TestEngineCache:
+    def test_second_engine_reuses_shared_fetch(self):
+        server = fakeredis.FakeServer()
+        first_source = FakeSource("econ", [_create_event("a")])
+        second_source = FakeSource("econ", [_create_event("stale")])
+
+        first = RiskRadarEngine(Config(), cache=_redis_cache(server))
+        first._sources = [first_source]
+        second = RiskRadarEngine(Config(), cache=_redis_cache(server))
+        second._sources = [second_source]
+
+        asyncio.run(first._fetch_all_events())
+        asyncio.run(second._fetch_all_events())
+
+        assert second_source.calls == 0
+        assert [e.id for e in second.get_events()] == ["a"]
+        assert second.get_source_stats()["econ"].status == "cached"
+
+    def test_incremental_sources_bypass_cache(self):
+        server = fakeredis.FakeServer()
+        engine = RiskRadarEngine(Config(), cache=_redis_cache(server))
+        source = FakeSource("news", [_create_event("a")])
+        source.incremental = True
+        engine._sources = [source]
+
+        asyncio.run(engine._fetch_all_events())
+        asyncio.run(engine._fetch_all_events())
+
+        assert source.calls == 2
+        assert asyncio.run(engine.cache.get_source_events("news")) is None
+
@@ -0,0 +1,167 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from edrr.engine import RiskRadarEngine
+from edrr.models.config import Config
+from edrr.models.events import Event, EventCategory, EventTier
+from edrr.sources.base import EventSource
+
+
+class FakeSource(EventSource):
+    def __init__(
+        self,
+        name: str,
+        events: Optional[List[Event]] = None,
+        delay: float = 0.0,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self.name = name
+        self.events = events or []
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    async def fetch_events(self) -> List[Event]:
+        self.calls += 1
+        self.started_at = time.monotonic()
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            if self.error:
+                raise self.error
+            return list(self.events)
+        finally:
+            self.finished_at = time.monotonic()
+
+    def get_source_name(self) -> str:
+        return self.name
+
+
+def _create_event(event_id: str, hours_ahead: float = 2) -> Event:
+    return Event(
+        id=event_id,
+        title=f"Event {event_id}",
+        category=EventCategory.ECONOMIC,
+        tier=EventTier.TIER_1,
+        scheduled_time=datetime.now() + timedelta(hours=hours_ahead),
+        impact_window=timedelta(hours=2),
+        affected_assets=["SPY", "QQQ"],
+    )
+
+
+class TestConcurrentFetch:
+    def setup_method(self):
+        self.config = Config(source_timeout_seconds=0.2)
+        self.engine = RiskRadarEngine(self.config)
+
+    def test_sources_fetched_concurrently(self):
+        sources = [
+            FakeSource(f"slow-{i}", [_create_event(f"e{i}")], delay=0.1)
+            for i in range(5)
+        ]
+        self.engine._sources = sources
+        asyncio.run(self.engine._fetch_all_events())
+
+        assert len(self.engine.get_events()) == 5
+        # Every source started before any finished, so they overlapped.
+        assert max(s.started_at for s in sources) < min(s.finished_at for s in sources)
+
+    def test_timeout_keeps_last_good_result(self):
+        source = FakeSource("flaky", [_create_event("a")])
+        self.engine._sources = [source, FakeSource("steady", [_create_event("b")])]
+        asyncio.run(self.engine._fetch_all_events())
+
+        source.delay = 1.0
+        source.events = [_create_event("c")]
+        asyncio.run(self.engine._fetch_all_events())
+
+        ids = {e.id for e in self.engine.get_events()}
+        assert ids == {"a", "b"}
+        assert self.engine.get_source_stats()["flaky"].status == "timeout"
+        assert self.engine.get_source_stats()["steady"].status == "ok"
+
+    def test_error_keeps_last_good_result(self):
+        source = FakeSource("broken", [_create_event("a")])
+        self.engine._sources = [source]
+        asyncio.run(self.engine._fetch_all_events())
+
+        source.error = RuntimeError("upstream down")
+        asyncio.run(self.engine._fetch_all_events())
+
+        stats = self.engine.get_source_stats()["broken"]
+        assert [e.id for e in self.engine.get_events()] == ["a"]
+        assert stats.status == "error"
+        assert "upstream down" in stats.error
+
+    def test_failed_source_without_history_contributes_nothing(self):
+        self.engine._sources = [
+            FakeSource("broken", error=RuntimeError("boom")),
+            FakeSource("steady", [_create_event("b")]),
+        ]
+        asyncio.run(self.engine._fetch_all_events())
+        assert [e.id for e in self.engine.get_events()] == ["b"]
+
+    def test_source_timings_recorded(self):
+        self.engine._sources = [
+            FakeSource("fast", [_create_event("a")]),
+            FakeSource("slow", [_create_event("b")], delay=0.05),
+        ]
+        asyncio.run(self.engine._fetch_all_events())
+
+        stats = self.engine.get_source_stats()
+        assert stats["slow"].elapsed_seconds >= 0.05
+        assert stats["fast"].elapsed_seconds < stats["slow"].elapsed_seconds
+        assert stats["fast"].event_count == 1
+
+    def test_default_source_timeout(self):
+        assert Config().source_timeout_seconds == 10.0
+
+
+class TestEventDiffing:
+    def setup_method(self):
+        self.engine = RiskRadarEngine(Config())
+
+    def test_refetch_does_not_realert_known_events(self):
+        self.engine._sources = [FakeSource("econ", [_create_event("a", hours_ahead=30)])]
+        asyncio.run(self.engine._fetch_all_events())
+        first = self.engine.alert_manager.check_thresholds()
+
+        diff = asyncio.run(self.engine._fetch_all_events())
+        second = self.engine.alert_manager.check_thresholds()
+
+        assert any(a.title.startswith("New Tier 1 Event") for a in first)
+        assert not any(a.title.startswith("New Tier 1 Event") for a in second)
+        assert diff.is_empty()
+
+    def test_removed_events_pruned_from_alert_state(self):
+        source = FakeSource("econ", [_create_event("a", hours_ahead=30)])
+        self.engine._sources = [source]
+        asyncio.run(self.engine._fetch_all_events())
+        self.engine.alert_manager.check_thresholds()
+        assert "a" in self.engine.alert_manager._known_events
+
+        source.events = []
+        diff = asyncio.run(self.engine._fetch_all_events())
+        assert [e.id for e in diff.removed] == ["a"]
+        assert "a" not in self.engine.alert_manager._known_events
+        assert self.engine.get_events() == []
+
+
+class TestIncrementalSources:
+    def setup_method(self):
+        self.engine = RiskRadarEngine(Config())
+
+    def test_incremental_results_merged_and_expired_pruned(self):
+        source = FakeSource("news", [_create_event("a"), _create_event("old", hours_ahead=-10)])
+        source.incremental = True
+        self.engine._sources = [source]
+        asyncio.run(self.engine._fetch_all_events())
+        assert [e.id for e in self.engine.get_events()] == ["a"]
+
+        source.events = [_create_event("b")]
+        asyncio.run(self.engine._fetch_all_events())
+        assert {e.id for e in self.engine.get_events()} == {"a", "b"}
@@ -0,0 +1,106 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from edrr.models.events import Event, EventCategory, EventTier
+from edrr.sources.economic_calendar import EconomicCalendarSource
+from edrr.sources.earnings_calendar import EarningsCalendarSource
+from edrr.sources.news_monitor import NewsMonitorSource
+from edrr.storage.event_store import EventDiff, EventStore
+
+
+def _create_event(event_id: str, tier: EventTier = EventTier.TIER_1) -> Event:
+    return Event(
+        id=event_id,
+        title=f"Event {event_id}",
+        category=EventCategory.ECONOMIC,
+        tier=tier,
+        scheduled_time=datetime(2025, 1, 15, 12, 0, 0),
+        impact_window=timedelta(hours=2),
+        affected_assets=["SPY"],
+    )
+
+
+class TestStableEventIds:
+    def test_refetch_keeps_ids(self):
+        source = EconomicCalendarSource()
+        first = asyncio.run(source.fetch_events())
+        second = asyncio.run(source.fetch_events())
+        assert [e.id for e in first] == [e.id for e in second]
+
+    def test_ids_unique_within_source(self):
+        events = asyncio.run(EarningsCalendarSource().fetch_events())
+        assert len({e.id for e in events}) == len(events)
+
+    def test_id_depends_on_scheduled_time(self):
+        source = EconomicCalendarSource()
+        base = datetime(2025, 1, 15, 8, 30)
+        assert source.make_event_id("econ", "CPI Release", base) != source.make_event_id(
+            "econ", "CPI Release", base + timedelta(days=1)
+        )
+
+    def test_id_depends_on_source(self):
+        when = datetime(2025, 1, 15, 8, 30)
+        econ_id = EconomicCalendarSource().make_event_id("x", "Same Title", when)
+        news_id = NewsMonitorSource().make_event_id("x", "Same Title", when)
+        assert econ_id != news_id
+
+
+class TestEventStore:
+    def setup_method(self):
+        self.store = EventStore()
+
+    def test_initial_fetch_all_added(self):
+        diff = self.store.replace_source("econ", [_create_event("a"), _create_event("b")])
+        assert [e.id for e in diff.added] == ["a", "b"]
+        assert diff.changed == []
+        assert diff.removed == []
+        assert len(self.store) == 2
+
+    def test_identical_refetch_is_empty_diff(self):
+        self.store.replace_source("econ", [_create_event("a")])
+        version = self.store.version
+        diff = self.store.replace_source("econ", [_create_event("a")])
+        assert diff.is_empty()
+        assert self.store.version == version
+
+    def test_changed_and_removed(self):
+        self.store.replace_source("econ", [_create_event("a"), _create_event("b")])
+        diff = self.store.replace_source(
+            "econ", [_create_event("a", tier=EventTier.TIER_2), _create_event("c")]
+        )
+        assert [e.id for e in diff.added] == ["c"]
+        assert [e.id for e in diff.changed] == ["a"]
+        assert [e.id for e in diff.removed] == ["b"]
+        assert self.store.get("a").tier == EventTier.TIER_2
+        assert "b" not in self.store
+
+    def test_sources_are_independent(self):
+        self.store.replace_source("econ", [_create_event("a")])
+        self.store.replace_source("fed", [_create_event("b")])
+        diff = self.store.replace_source("fed", [])
+        assert [e.id for e in diff.removed] == ["b"]
+        assert [e.id for e in self.store.get_events()] == ["a"]
+
+    def test_merge_does_not_remove(self):
+        self.store.merge_source("news", [_create_event("a")])
+        diff = self.store.merge_source("news", [_create_event("b")])
+        assert [e.id for e in diff.added] == ["b"]
+        assert {e.id for e in self.store.get_events()} == {"a", "b"}
+
+    def test_remove_by_id(self):
+        self.store.replace_source("econ", [_create_event("a"), _create_event("b")])
+        diff = self.store.remove(["a", "missing"])
+        assert [e.id for e in diff.removed] == ["a"]
+        assert [e.id for e in self.store.get_source_events("econ")] == ["b"]
+
+    def test_version_bumps_on_change(self):
+        self.store.replace_source("econ", [_create_event("a")])
+        version = self.store.version
+        self.store.merge_source("econ", [_create_event("b")])
+        assert self.store.version == version + 1
+
+    def test_diff_extend(self):
+        diff = EventDiff(added=[_create_event("a")])
+        diff.extend(EventDiff(removed=[_create_event("b")]))
+        assert not diff.is_empty()
+        assert len(diff.added) == 1 and len(diff.removed) == 1
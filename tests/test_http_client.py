@@ -0,0 +1,178 @@
+import asyncio
+import pytest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from edrr.engine import RiskRadarEngine
+from edrr.models.config import Config
+from edrr.sources.http_client import HTTPClient, ResponseTooLargeError
+from edrr.sources.news_monitor import NewsMonitorSource
+
+
+ARTICLES = [
+    {
+        "title": "Sanctions announced against major exporter",
+        "description": "New trade war fears",
+        "publishedAt": "2025-01-15T12:00:00Z",
+    },
+]
+
+
+def _create_app(state: dict) -> web.Application:
+    async def articles(request: web.Request) -> web.Response:
+        state["peers"].add(request.transport.get_extra_info("peername"))
+        state["params"].append(dict(request.query))
+        return web.json_response({"status": "ok", "articles": ARTICLES})
+
+    async def large(request: web.Request) -> web.Response:
+        return web.Response(body=b"x" * 4096, content_type="application/json")
+
+    async def streamed(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse()
+        await response.prepare(request)
+        for _ in range(8):
+            await response.write(b"x" * 1024)
+        await response.write_eof()
+        return response
+
+    async def missing(request: web.Request) -> web.Response:
+        return web.json_response({"error": "nope"}, status=404)
+
+    app = web.Application()
+    app.router.add_get("/articles", articles)
+    app.router.add_get("/large", large)
+    app.router.add_get("/streamed", streamed)
+    app.router.add_get("/missing", missing)
+    return app
+
+
+def _run_with_server(scenario):
+    state = {"peers": set(), "params": []}
+
+    async def runner():
+        server = TestServer(_create_app(state))
+        await server.start_server()
+        try:
+            return await scenario(server, state)
+        finally:
+            await server.close()
+
+    return asyncio.run(runner())
+
+
+class TestHTTPClient:
+    def test_get_json(self):
+        async def scenario(server, state):
+            client = HTTPClient()
+            try:
+                return await client.get_json(str(server.make_url("/articles")), {"q": "x"})
+            finally:
+                await client.close()
+
+        data = _run_with_server(scenario)
+        assert data["articles"] == ARTICLES
+
+    def test_connections_are_reused(self):
+        async def scenario(server, state):
+            client = HTTPClient()
+            try:
+                for _ in range(5):
+                    await client.get_json(str(server.make_url("/articles")))
+            finally:
+                await client.close()
+            return state
+
+        state = _run_with_server(scenario)
+        assert len(state["peers"]) == 1
+
+    def test_non_200_returns_none(self):
+        async def scenario(server, state):
+            client = HTTPClient()
+            try:
+                return await client.get_json(str(server.make_url("/missing")))
+            finally:
+                await client.close()
+
+        assert _run_with_server(scenario) is None
+
+    def test_content_length_limit(self):
+        async def scenario(server, state):
+            client = HTTPClient(max_response_bytes=1024)
+            try:
+                with pytest.raises(ResponseTooLargeError):
+                    await client.get_json(str(server.make_url("/large")))
+            finally:
+                await client.close()
+
+        _run_with_server(scenario)
+
+    def test_streamed_body_limit(self):
+        async def scenario(server, state):
+            client = HTTPClient(max_response_bytes=2048)
+            try:
+                with pytest.raises(ResponseTooLargeError):
+                    await client.get_json(str(server.make_url("/streamed")))
+            finally:
+                await client.close()
+
+        _run_with_server(scenario)
+
+    def test_close(self):
+        async def scenario(server, state):
+            client = HTTPClient()
+            await client.get_json(str(server.make_url("/articles")))
+            assert not client.closed
+            await client.close()
+            return client
+
+        assert _run_with_server(scenario).closed
+
+
+class TestNewsMonitorSharedSession:
+    def test_uses_injected_client(self):
+        async def scenario(server, state):
+            client = HTTPClient()
+            source = NewsMonitorSource(
+                api_key="test-key",
+                api_url=str(server.make_url("/articles")),
+                http_client=client,
+            )
+            try:
+                events = await source.fetch_events()
+                await source.fetch_events()
+            finally:
+                await client.close()
+            return events, state
+
+        events, state = _run_with_server(scenario)
+        assert len(events) == 1
+        assert len(state["peers"]) == 1
+        assert state["params"][0]["apiKey"] == "test-key"
+
+    def test_client_error_returns_no_articles(self):
+        async def scenario(server, state):
+            client = HTTPClient(max_response_bytes=16)
+            source = NewsMonitorSource(
+                api_key="test-key",
+                api_url=str(server.make_url("/articles")),
+                http_client=client,
+            )
+            try:
+                return await source.fetch_events()
+            finally:
+                await client.close()
+
+        assert _run_with_server(scenario) == []
+
+    def test_engine_shares_and_closes_client(self):
+        engine = RiskRadarEngine(Config())
+        news_source = engine._sources[3]
+        assert news_source.http_client is engine.http_client
+
+        async def scenario():
+            engine.http_client.get_session()
+            await engine.stop()
+
+        asyncio.run(scenario())
+        assert engine.http_client.closed
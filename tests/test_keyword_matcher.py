@@ -0,0 +1,92 @@
+from edrr.models.events import EventCategory
+from edrr.sources.keyword_matcher import KeywordMatcher
+from edrr.sources.news_monitor import NEWS_MATCHER, NewsMonitorSource
+
+
+class TestKeywordMatcher:
+    def setup_method(self):
+        self.matcher = KeywordMatcher({
+            "geo": ["war", "trade war", "sanctions"],
+            "reg": ["sec", "federal reserve"],
+            "both": ["war"],
+        })
+
+    def test_word_boundaries(self):
+        assert self.matcher.match("a second look at software").counts == {}
+
+    def test_plural_suffix(self):
+        assert self.matcher.match("Trade wars escalate").hits("geo") == 1
+
+    def test_multi_word_whitespace(self):
+        match = self.matcher.match("The Federal\n  Reserve meets")
+        assert match.keywords == ["federal reserve"]
+        assert "reg" in match
+
+    def test_longest_keyword_wins(self):
+        match = self.matcher.match("a new trade war")
+        assert match.keywords == ["trade war"]
+
+    def test_all_groups_reported(self):
+        match = self.matcher.match("war and SEC probe")
+        assert match.counts == {"geo": 1, "both": 1, "reg": 1}
+        assert match.total_hits == 2
+
+    def test_match_many_matches_individual(self):
+        texts = ["war news", "", "sec filing", "nothing here", "trade", "war"]
+        batch = self.matcher.match_many(texts)
+        assert [m.counts for m in batch] == [self.matcher.match(t).counts for t in texts]
+
+    def test_match_many_does_not_span_texts(self):
+        batch = self.matcher.match_many(["rising trade", "war chest"])
+        assert batch[0].keywords == []
+        assert batch[1].keywords == ["war"]
+
+    def test_match_many_empty(self):
+        assert self.matcher.match_many([]) == []
+
+
+class TestNewsClassification:
+    def setup_method(self):
+        self.source = NewsMonitorSource()
+
+    def _classify(self, title: str, description: str = ""):
+        return self.source._classify_article({"title": title, "description": description})
+
+    def test_substring_false_positives_ignored(self):
+        assert self._classify("Software stocks rally for a second day") is None
+
+    def test_geopolitical(self):
+        event = self._classify("Missile strike reported", "Gold climbs")
+        assert event.category == EventCategory.GEOPOLITICAL
+        assert set(event.affected_assets) == {"SPY", "QQQ", "BTC", "GOLD"}
+
+    def test_presidential_is_geopolitical(self):
+        event = self._classify("Presidential address tonight")
+        assert event.category == EventCategory.GEOPOLITICAL
+
+    def test_regulatory_with_crypto(self):
+        event = self._classify("SEC opens investigation", "into a bitcoin exchange")
+        assert event.category == EventCategory.REGULATORY
+        assert set(event.affected_assets) == {"SPY", "QQQ", "BTC", "GOLD"}
+
+    def test_regulatory_without_crypto(self):
+        event = self._classify("Antitrust lawsuit filed against retailer")
+        assert event.category == EventCategory.REGULATORY
+        assert "BTC" not in event.affected_assets
+
+    def test_batch_matches_single(self):
+        articles = [
+            {"title": "Tariffs announced", "description": None},
+            {"title": "Earnings beat", "description": "Strong quarter"},
+            {"title": "Treasury sanctions crypto mixer", "description": ""},
+        ]
+        batch = self.source.classify_articles(articles)
+        single = [self.source._classify_article(a) for a in articles]
+        assert [e and (e.category, e.affected_assets) for e in batch] == [
+            e and (e.category, e.affected_assets) for e in single
+        ]
+        assert batch[1] is None
+
+    def test_shared_matcher_groups(self):
+        match = NEWS_MATCHER.match("crypto and precious metals")
+        assert "crypto" in match and "gold" in match
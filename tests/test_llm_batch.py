@@ -0,0 +1,127 @@
+import asyncio
+import json
+import re
+import time
+from types import SimpleNamespace
+from typing import List, Optional, Set
+
+from edrr.analysis.llm_cache import LLMResponseCache
+from edrr.analysis.llm_client import LLMClient
+from edrr.analysis.rate_limit import RateLimiter
+from edrr.models.events import EventCategory, EventTier
+
+
+class FakeBatchMessages:
+    """Answers batch prompts with one classification per "[i] Headline:" item."""
+
+    def __init__(self, delay: float = 0.0, garble_sizes: Optional[Set[int]] = None) -> None:
+        self.delay = delay
+        self.garble_sizes = garble_sizes or set()
+        self.batch_sizes: List[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def create(self, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            prompt = kwargs["messages"][0]["content"]
+            headlines = re.findall(r"\[(\d+)\] Headline: (.*)", prompt)
+            self.batch_sizes.append(len(headlines))
+            if len(headlines) in self.garble_sizes:
+                text = "Sure! Here are the classifications: [..."
+            else:
+                text = json.dumps([
+                    {
+                        "index": int(index),
+                        "is_market_moving": "war" in headline,
+                        "category": "geopolitical" if "war" in headline else "earnings",
+                        "tier": 3,
+                        "affected_assets": ["SPY"],
+                        "impact_hours": 6,
+                        "confidence": 0.9,
+                    }
+                    for index, headline in reversed(headlines)
+                ])
+            return SimpleNamespace(content=[SimpleNamespace(text=text)])
+        finally:
+            self.in_flight -= 1
+
+
+def _client(messages: FakeBatchMessages, **kwargs) -> LLMClient:
+    kwargs.setdefault("requests_per_second", None)
+    client = LLMClient(cache=LLMResponseCache(), **kwargs)
+    client.client = SimpleNamespace(messages=messages)
+    client.retry_delay = 0
+    return client
+
+
+def _articles(count: int):
+    return [(f"Headline {i} {'war' if i % 3 == 0 else 'beat'}", "body") for i in range(count)]
+
+
+class TestBatchClassification:
+    def test_packs_articles_into_batches(self):
+        messages = FakeBatchMessages()
+        results = asyncio.run(_client(messages, batch_size=20).classify_news_batch(_articles(50)))
+
+        assert sorted(messages.batch_sizes) == [10, 20, 20]
+        assert len(results) == 50
+        assert [r["is_market_moving"] for r in results] == [i % 3 == 0 for i in range(50)]
+        assert results[0]["category"] == EventCategory.GEOPOLITICAL
+        assert results[1]["tier"] == EventTier.TIER_3
+
+    def test_unparseable_batch_splits(self):
+        messages = FakeBatchMessages(garble_sizes={8})
+        results = asyncio.run(_client(messages, batch_size=8).classify_news_batch(_articles(8)))
+
+        assert messages.batch_sizes == [8, 4, 4]
+        assert [r["confidence"] for r in results] == [0.9] * 8
+
+    def test_unparseable_single_article_is_none(self):
+        messages = FakeBatchMessages(garble_sizes={2, 1})
+        results = asyncio.run(_client(messages, batch_size=2).classify_news_batch(_articles(2)))
+
+        assert messages.batch_sizes == [2, 1, 1]
+        assert results == [None, None]
+
+    def test_concurrency_bounded_by_semaphore(self):
+        messages = FakeBatchMessages(delay=0.02)
+        client = _client(messages, batch_size=1, max_concurrency=3)
+        asyncio.run(client.classify_news_batch(_articles(12)))
+
+        assert messages.max_in_flight == 3
+
+    def test_request_rate_limited(self):
+        messages = FakeBatchMessages()
+        client = _client(messages, batch_size=1, max_concurrency=1, requests_per_second=50)
+
+        started = time.monotonic()
+        asyncio.run(client.classify_news_batch(_articles(6)))
+        assert time.monotonic() - started >= 0.09
+
+
+class TestRateLimiter:
+    def test_burst_then_steady_rate(self):
+        async def scenario():
+            limiter = RateLimiter(100, burst=5)
+            started = time.monotonic()
+            for _ in range(5):
+                await limiter.acquire()
+            burst = time.monotonic() - started
+            for _ in range(5):
+                await limiter.acquire()
+            return burst, time.monotonic() - started
+
+        burst, total = asyncio.run(scenario())
+        assert burst < 0.02
+        assert total >= 0.045
+
+    def test_unlimited(self):
+        async def scenario():
+            limiter = RateLimiter(None)
+            await asyncio.wait_for(asyncio.gather(*(limiter.acquire() for _ in range(1000))), 1)
+
+        asyncio.run(scenario())
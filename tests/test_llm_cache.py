@@ -0,0 +1,118 @@
+import asyncio
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import List, Optional
+
+from edrr.analysis.llm_cache import LLMResponseCache
+from edrr.analysis.llm_client import LLMClient
+from edrr.models.events import Event, EventCategory, EventTier
+
+
+class FakeMessages:
+    def __init__(self, responses: Optional[List[str]] = None) -> None:
+        self.responses = responses or []
+        self.calls: List[dict] = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        text = self.responses.pop(0) if self.responses else json.dumps({"impact_score": 7})
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+def _client(cache: LLMResponseCache, responses: Optional[List[str]] = None) -> LLMClient:
+    client = LLMClient(cache=cache)
+    client.client = SimpleNamespace(messages=FakeMessages(responses))
+    client.retry_delay = 0
+    return client
+
+
+def _event() -> Event:
+    return Event(
+        id="fomc",
+        title="FOMC Rate Decision",
+        category=EventCategory.ECONOMIC,
+        tier=EventTier.TIER_1,
+        scheduled_time=datetime(2025, 1, 29, 14, 0),
+        impact_window=timedelta(hours=4),
+        affected_assets=["SPY", "QQQ", "BTC", "GOLD"],
+    )
+
+
+class TestLLMResponseCache:
+    def test_key_covers_all_inputs(self):
+        base = LLMResponseCache.make_key("m", "sys", "prompt", 0.3)
+        assert base == LLMResponseCache.make_key("m", "sys", "prompt", 0.3)
+        assert base != LLMResponseCache.make_key("m2", "sys", "prompt", 0.3)
+        assert base != LLMResponseCache.make_key("m", "sys2", "prompt", 0.3)
+        assert base != LLMResponseCache.make_key("m", "sys", "prompt2", 0.3)
+        assert base != LLMResponseCache.make_key("m", "sys", "prompt", 0.0)
+
+    def test_lru_eviction(self):
+        cache = LLMResponseCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+
+    def test_ttl_expiry(self):
+        cache = LLMResponseCache(ttl_seconds=0.01)
+        cache.set("a", "1")
+        assert cache.get("a") == "1"
+
+        asyncio.run(asyncio.sleep(0.02))
+        assert cache.get("a") is None
+        assert cache.stats.misses == 1
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        path = str(tmp_path / "llm.db")
+        first = LLMResponseCache(path=path)
+        first.set("a", "1")
+        first.close()
+
+        second = LLMResponseCache(path=path)
+        assert second.get("a") == "1"
+        assert second.get("a") == "1"
+        assert (second.stats.disk_hits, second.stats.memory_hits) == (1, 1)
+
+    def test_prune_expired_from_disk(self, tmp_path):
+        cache = LLMResponseCache(ttl_seconds=0.01, path=str(tmp_path / "llm.db"))
+        cache.set("a", "1")
+        asyncio.run(asyncio.sleep(0.02))
+
+        assert cache.prune_expired() == 1
+        assert len(cache) == 0
+
+
+class TestLLMClientCaching:
+    def test_repeat_analysis_served_from_cache(self):
+        client = _client(LLMResponseCache())
+
+        first = asyncio.run(client.analyze_event(_event()))
+        second = asyncio.run(client.analyze_event(_event()))
+
+        assert first == second == {"impact_score": 7}
+        assert len(client.client.messages.calls) == 1
+        assert client.cache.stats.hits == 1
+
+    def test_cache_shared_across_clients_on_disk(self, tmp_path):
+        path = str(tmp_path / "llm.db")
+        asyncio.run(_client(LLMResponseCache(path=path)).analyze_event(_event()))
+
+        restarted = _client(LLMResponseCache(path=path))
+        asyncio.run(restarted.analyze_event(_event()))
+        assert restarted.client.messages.calls == []
+
+    def test_unparseable_responses_not_cached(self):
+        client = _client(LLMResponseCache(), responses=["not json", '{"impact_score": 5}'])
+
+        fallback = asyncio.run(client.analyze_event(_event()))
+        retried = asyncio.run(client.analyze_event(_event()))
+
+        assert fallback["key_risks"] == ["Unable to parse LLM response"]
+        assert retried == {"impact_score": 5}
+        assert len(client.client.messages.calls) == 2
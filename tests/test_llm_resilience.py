@@ -0,0 +1,166 @@
+import asyncio
+import random
+import time
+from types import SimpleNamespace
+from typing import List, Optional
+
+from edrr.analysis.circuit_breaker import CircuitBreaker
+from edrr.analysis.llm_cache import LLMResponseCache
+from edrr.analysis.llm_client import LLMClient
+from edrr.analysis.rate_limit import RateLimiter
+from edrr.models.events import EventCategory
+
+
+class FakeStatusError(Exception):
+    def __init__(self, status_code: int, retry_after: Optional[str] = None) -> None:
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        headers = {"retry-after": retry_after} if retry_after else {}
+        self.response = SimpleNamespace(headers=headers)
+
+
+class ScriptedMessages:
+    """Raises or answers according to a script, then answers with valid JSON."""
+
+    def __init__(self, script: Optional[List[Optional[Exception]]] = None) -> None:
+        self.script = script or []
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        outcome = self.script.pop(0) if self.script else None
+        if outcome is not None:
+            raise outcome
+        text = '{"is_market_moving": true, "category": "crypto", "tier": 4}'
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+def _client(messages: ScriptedMessages, **kwargs) -> LLMClient:
+    kwargs.setdefault("requests_per_second", None)
+    client = LLMClient(cache=LLMResponseCache(max_entries=0), **kwargs)
+    client.client = SimpleNamespace(messages=messages)
+    client.retry_delay = 0.001
+    return client
+
+
+class TestBackoff:
+    def test_exponential_with_full_jitter(self):
+        client = _client(ScriptedMessages())
+        client.retry_delay = 1.0
+        client.max_retry_delay = 5.0
+        random.seed(1)
+
+        for attempt, ceiling in enumerate([1.0, 2.0, 4.0, 5.0, 5.0]):
+            delays = [client._backoff_delay(attempt) for _ in range(50)]
+            assert all(0 <= d <= ceiling for d in delays)
+            assert len(set(delays)) > 1
+
+    def test_retry_after_is_a_floor(self):
+        client = _client(ScriptedMessages())
+        assert client._backoff_delay(0, retry_after=3.0) >= 3.0
+
+
+class TestRetries:
+    def test_transient_errors_retried(self):
+        messages = ScriptedMessages([FakeStatusError(500), FakeStatusError(503)])
+        client = _client(messages)
+        result = asyncio.run(client.classify_news("Bitcoin ETF approved", ""))
+
+        assert result["category"] == EventCategory.CRYPTO
+        assert messages.calls == 3
+        metrics = client.get_metrics()
+        assert (metrics["requests"], metrics["failures"], metrics["retries"]) == (3, 2, 2)
+
+    def test_client_errors_not_retried(self):
+        messages = ScriptedMessages([FakeStatusError(400)])
+        client = _client(messages)
+        try:
+            asyncio.run(client._call_with_retry("prompt"))
+        except FakeStatusError:
+            pass
+        assert messages.calls == 1
+
+    def test_client_errors_do_not_open_circuit(self):
+        messages = ScriptedMessages([FakeStatusError(400)] * 5)
+        client = _client(messages, breaker_failure_threshold=3)
+        for _ in range(5):
+            try:
+                asyncio.run(client._call_with_retry("prompt"))
+            except FakeStatusError:
+                pass
+
+        assert client.breaker.state == CircuitBreaker.CLOSED
+        assert client.breaker.consecutive_failures == 0
+        assert asyncio.run(client._call_with_retry("prompt"))
+
+    def test_rate_limit_slows_shared_limiter(self):
+        messages = ScriptedMessages([FakeStatusError(429), FakeStatusError(529)])
+        client = _client(messages, requests_per_second=8.0)
+        asyncio.run(client.classify_news("headline", ""))
+
+        assert client.metrics.rate_limited == 2
+        assert client.rate_limiter.rate_per_second < 8.0
+
+
+class TestAdaptiveRateLimiter:
+    def test_penalize_and_recover(self):
+        limiter = RateLimiter(4.0, min_rate_per_second=0.5, recovery_step=1.0)
+        for _ in range(5):
+            limiter.penalize()
+        assert limiter.rate_per_second == 0.5
+
+        for _ in range(10):
+            limiter.reward()
+        assert limiter.rate_per_second == 4.0
+
+    def test_retry_after_pauses_callers(self):
+        async def scenario():
+            limiter = RateLimiter(None)
+            limiter.penalize(retry_after=0.05)
+            started = time.monotonic()
+            await limiter.acquire()
+            return time.monotonic() - started
+
+        assert asyncio.run(scenario()) >= 0.04
+
+
+class TestCircuitBreaker:
+    def test_opens_then_half_opens(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_seconds=0.02)
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+
+        time.sleep(0.03)
+        assert breaker.allow()
+        assert not breaker.allow()  # One trial at a time
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_trial_reopens(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.times_opened == 2
+
+    def test_open_circuit_fails_fast_to_fallback(self):
+        messages = ScriptedMessages([FakeStatusError(503)] * 3)
+        client = _client(messages, breaker_failure_threshold=3, breaker_reset_seconds=60)
+        try:
+            asyncio.run(client.classify_news("headline", ""))
+        except FakeStatusError:
+            pass
+
+        started = time.monotonic()
+        result = asyncio.run(client.classify_news("headline", ""))
+
+        assert result["confidence"] == 0.0
+        assert messages.calls == 3
+        assert time.monotonic() - started < 0.01
+        assert client.get_metrics()["breaker_state"] == "open"
+        assert client.metrics.short_circuited == 1
@@ -0,0 +1,177 @@
+import asyncio
+import gc
+import json
+import pytest
+from datetime import datetime, timedelta
+
+from aiohttp.test_utils import TestClient, TestServer
+
+from edrr.analysis.risk_aggregator import RiskAggregator
+from edrr.api.endpoints import EDRRApi
+from edrr.metrics import MetricsRegistry, REGISTRY
+from edrr.models.events import Event, EventCategory, EventTier
+
+
+def _create_event(event_id: str, hours_ahead: float = 2) -> Event:
+    return Event(
+        id=event_id,
+        title=f"Event {event_id}",
+        category=EventCategory.ECONOMIC,
+        tier=EventTier.TIER_1,
+        scheduled_time=datetime.now() + timedelta(hours=hours_ahead),
+        impact_window=timedelta(hours=2),
+        affected_assets=["SPY", "QQQ"],
+    )
+
+
+def _sample(text: str, prefix: str) -> float:
+    for line in text.splitlines():
+        if line.startswith(prefix + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{prefix} not in output")
+
+
+class TestMetricsRegistry:
+    def setup_method(self):
+        self.registry = MetricsRegistry()
+
+    def test_histogram_exposition(self):
+        histogram = self.registry.histogram("stage_seconds", "Stage latency", ["stage"], buckets=[0.1, 1])
+        child = histogram.labels(stage="score")
+        for value in (0.05, 0.5, 0.5, 3):
+            child.observe(value)
+
+        lines = self.registry.render().splitlines()
+        assert lines[:2] == ["# HELP stage_seconds Stage latency", "# TYPE stage_seconds histogram"]
+        assert lines[2:] == [
+            'stage_seconds_bucket{stage="score",le="0.1"} 1',
+            'stage_seconds_bucket{stage="score",le="1"} 3',
+            'stage_seconds_bucket{stage="score",le="+Inf"} 4',
+            'stage_seconds_sum{stage="score"} 4.05',
+            'stage_seconds_count{stage="score"} 4',
+        ]
+
+    def test_timed_decorator(self):
+        child = self.registry.histogram("calls_seconds", "Calls").labels()
+
+        @child.timed
+        def work(x):
+            return x * 2
+
+        assert work(4) == 8
+        assert child.count == 1
+
+    def test_counter_and_gauges(self):
+        self.registry.counter("alerts", "Alerts", ["alert_type"]).labels("danger").inc()
+        gauge = self.registry.gauge("entries", "Entries", ["cache"])
+        gauge.labels("llm").set_function(lambda: 12)
+        gauge.labels("broken").set_function(lambda: 1 / 0)
+        gauge.labels("plain").set(3)
+
+        text = self.registry.render()
+        assert 'alerts_total{alert_type="danger"} 1' in text
+        assert 'entries{cache="llm"} 12' in text
+        assert 'entries{cache="plain"} 3' in text
+        assert "broken" not in text
+
+    def test_tracked_gauge_sums_live_owners(self):
+        class Owner:
+            def __init__(self, size):
+                self.size = size
+
+        child = self.registry.gauge("sizes", "Sizes").labels()
+        first, second = Owner(2), Owner(3)
+        child.track(first, lambda owner: owner.size)
+        child.track(second, lambda owner: owner.size)
+        assert child.get() == 5
+
+        del first
+        gc.collect()
+        assert child.get() == 3
+
+    def test_label_values_escaped(self):
+        self.registry.gauge("g", "G", ["name"]).labels('a"b\\c').set(1)
+        assert 'g{name="a\\"b\\\\c"} 1' in self.registry.render()
+
+    def test_render_merges_remote_dumps(self):
+        histogram = self.registry.histogram("req_seconds", "Requests", ["route"], buckets=[1])
+        histogram.labels("/risk").observe(0.5)
+        self.registry.counter("unused", "Never incremented")
+
+        worker = MetricsRegistry()
+        worker.histogram("req_seconds", "Requests", ["route"], buckets=[1]).labels("/risk").observe(2)
+        worker.counter("unused", "Never incremented")
+        dump = json.loads(json.dumps(worker.dump(["req_seconds", "unused"])))
+        assert list(dump) == ["req_seconds"]
+
+        lines = self.registry.render([({"worker": "0"}, dump)]).splitlines()
+        assert lines.count("# TYPE req_seconds histogram") == 1
+        assert 'req_seconds_count{route="/risk"} 1' in lines
+        assert 'req_seconds_bucket{route="/risk",worker="0",le="1"} 0' in lines
+        assert 'req_seconds_sum{route="/risk",worker="0"} 2' in lines
+
+    def test_reregistration(self):
+        first = self.registry.histogram("h", "H", ["a"])
+        assert self.registry.histogram("h", "H", ["a"]) is first
+        with pytest.raises(ValueError):
+            self.registry.gauge("h", "H", ["a"])
+        with pytest.raises(ValueError):
+            first.labels("x", "y")
+
+
+class TestMetricsEndpoint:
+    def test_reports_routes_and_stages(self):
+        aggregator = RiskAggregator()
+        aggregator.set_events([_create_event("a")])
+        api = EDRRApi(aggregator)
+
+        async def scenario():
+            client = TestClient(TestServer(api.create_app()))
+            await client.start_server()
+            try:
+                for asset in ("SPY", "BTC"):
+                    await client.get(f"/risk/{asset}")
+                await client.get("/risk/XYZ")
+                response = await client.get("/metrics")
+                return response.headers["Content-Type"], await response.text()
+            finally:
+                await client.close()
+
+        content_type, text = asyncio.run(scenario())
+        assert content_type.startswith("text/plain; version=0.0.4")
+        route = 'edrr_api_request_seconds_count{method="GET",route="/risk/{asset}",status="200"}'
+        assert _sample(text, route) >= 2
+        assert _sample(text, route.replace("200", "404")) >= 1
+        assert _sample(text, 'edrr_scoring_seconds_count{stage="get_current_risk"}') >= 1
+        assert 'edrr_cache_entries{cache="api_responses"}' in text
+        assert "edrr_stream_subscribers 0" in text
+
+    def test_default_registry_is_shared(self):
+        assert REGISTRY.get("edrr_scoring_seconds") is not None
+        assert REGISTRY.get("edrr_api_request_seconds") is not None
+
+    def test_engine_records_fetches_and_gauges(self):
+        from edrr.engine import RiskRadarEngine
+        from edrr.sources.base import EventSource
+        from edrr.storage.cache import MemoryCache
+
+        class StaticSource(EventSource):
+            async def fetch_events(self):
+                return [_create_event("metrics-a")]
+
+            def get_source_name(self):
+                return "metrics-static"
+
+        gc.collect()  # Gauges sum over live engines; drop other tests' engines
+        engine = RiskRadarEngine(cache=MemoryCache())
+        engine._sources = [StaticSource()]
+        histogram = REGISTRY.get("edrr_source_fetch_seconds")
+        before = histogram.labels("metrics-static", "ok").count
+        events_before = _sample(REGISTRY.render(), "edrr_events_loaded")
+        asyncio.run(engine._fetch_all_events())
+
+        assert histogram.labels("metrics-static", "ok").count == before + 1
+        text = REGISTRY.render()
+        assert _sample(text, "edrr_events_loaded") == events_before + 1
+        assert 'edrr_alert_dedup_entries{kind="known_events"}' in text
+        assert 'edrr_cache_entries{cache="llm_responses"}' in text
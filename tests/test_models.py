@@ -8,6 +8,7 @@ from edrr.models.events import (
     EventCategory,
     EventTier,
 )
+from edrr.models.assets import ASSET_REGISTRY, AssetRegistry
 from edrr.models.config import (
     Config,
     RiskThresholds,
@@ -86,6 +87,54 @@ class TestEvent:
             assert event.category == category
 
 
+class TestCompactEvent:
+    def _event(self, assets):
+        return Event(
+            id="e1",
+            title="CPI",
+            category=EventCategory.ECONOMIC,
+            tier=EventTier.TIER_1,
+            scheduled_time=datetime(2025, 1, 15, 8, 30),
+            impact_window=timedelta(hours=2),
+            affected_assets=assets,
+        )
+
+    def test_slotted(self):
+        event = self._event(["SPY"])
+        assert not hasattr(event, "__dict__")
+        with pytest.raises(AttributeError):
+            event.unknown = 1
+
+    def test_assets_stored_as_mask(self):
+        event = self._event(["GOLD", "SPY", "SPY"])
+        assert event.asset_mask == ASSET_REGISTRY.mask(["SPY", "GOLD"])
+        assert event.affected_assets == ["GOLD", "SPY", "SPY"]
+        assert event.affects("GOLD")
+        assert not event.affects("BTC")
+        assert not event.affects("NOT-AN-ASSET")
+        assert "NOT-AN-ASSET" not in ASSET_REGISTRY
+
+    def test_assign_affected_assets(self):
+        event = self._event(["SPY"])
+        event.affected_assets = ["BTC"]
+        assert event.affected_assets == ["BTC"]
+        assert event == self._event(["BTC"])
+
+    def test_affected_assets_keep_caller_order(self):
+        event = self._event(["GOLD", "SPY"])
+        assert event.affected_assets == ["GOLD", "SPY"]
+        event.affected_assets = ["BTC", "QQQ"]
+        assert event.affected_assets == ["BTC", "QQQ"]
+        assert event.asset_mask == ASSET_REGISTRY.mask(["QQQ", "BTC"])
+
+    def test_registry_grows_for_new_symbols(self):
+        registry = AssetRegistry(["SPY"])
+        mask = registry.mask(["ETH", "SPY", "SOL"])
+        assert registry.symbols(mask) == ("SPY", "ETH", "SOL")
+        assert registry.lookup("ETH") == 2
+        assert len(registry) == 3
+
+
 class TestRiskWindow:
     def test_risk_window_creation(self):
         now = datetime.now()
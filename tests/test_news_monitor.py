@@ -0,0 +1,224 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+from edrr.models.events import EventCategory, EventTier
+from edrr.sources.news_monitor import NewsMonitorSource
+from tests.test_llm_batch import FakeBatchMessages, _client
+
+
+def _article(title: str, published_at: str, url: str = "") -> Dict[str, Any]:
+    return {
+        "title": title,
+        "description": "",
+        "publishedAt": published_at,
+        "url": url,
+    }
+
+
+class FakeNewsSource(NewsMonitorSource):
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(api_key="test-key", **kwargs)
+        self.pages: List[List[Dict[str, Any]]] = []
+        self.params: List[Dict[str, Any]] = []
+
+    async def _poll_news_api(self) -> List[Dict[str, Any]]:
+        self.params.append(self._build_params())
+        return self.pages.pop(0) if self.pages else []
+
+
+class TestIncrementalPolling:
+    def setup_method(self):
+        self.source = FakeNewsSource()
+
+    def test_repeated_articles_skipped(self):
+        page = [
+            _article("Sanctions imposed on exporter", "2025-01-15T12:00:00Z", "https://x/1"),
+            _article("Military drills near border", "2025-01-15T12:05:00Z", "https://x/2"),
+        ]
+        self.source.pages = [page, list(page)]
+        first = asyncio.run(self.source.fetch_events())
+        second = asyncio.run(self.source.fetch_events())
+        assert len(first) == 2
+        assert second == []
+
+    def test_watermark_sent_as_from_param(self):
+        self.source.pages = [
+            [_article("Sanctions imposed on exporter", "2025-01-15T12:00:00Z", "https://x/1")],
+        ]
+        asyncio.run(self.source.fetch_events())
+        asyncio.run(self.source.fetch_events())
+        assert "from" not in self.source.params[0]
+        assert self.source.params[1]["from"] == "2025-01-15T12:00:00"
+
+    def test_articles_older_than_watermark_skipped(self):
+        self.source.pages = [
+            [_article("Sanctions imposed on exporter", "2025-01-15T12:00:00Z", "https://x/1")],
+            [
+                _article("Old military story", "2025-01-15T11:00:00Z", "https://x/old"),
+                _article("New tariff announced", "2025-01-15T13:00:00Z", "https://x/new"),
+            ],
+        ]
+        asyncio.run(self.source.fetch_events())
+        events = asyncio.run(self.source.fetch_events())
+        assert [e.title for e in events] == ["New tariff announced"]
+
+    def test_title_fingerprint_without_url(self):
+        self.source.pages = [
+            [_article("Sanctions imposed on exporter!", "2025-01-15T12:00:00Z")],
+            [_article("sanctions imposed  on exporter", "2025-01-15T12:00:00Z")],
+        ]
+        asyncio.run(self.source.fetch_events())
+        assert asyncio.run(self.source.fetch_events()) == []
+
+    def test_unclassified_articles_still_remembered(self):
+        self.source.pages = [
+            [_article("Quarterly sales beat estimates", "2025-01-15T12:00:00Z", "https://x/1")],
+        ]
+        assert asyncio.run(self.source.fetch_events()) == []
+        assert len(self.source._seen_fingerprints) == 1
+
+    def test_fingerprint_set_is_bounded(self):
+        source = FakeNewsSource(max_seen_articles=3)
+        source.pages = [[
+            _article(f"Sanctions round {i}", "2025-01-15T12:00:00Z", f"https://x/{i}")
+            for i in range(10)
+        ]]
+        asyncio.run(source.fetch_events())
+        assert len(source._seen_fingerprints) == 3
+
+
+class TestPublishedAtParsing:
+    def setup_method(self):
+        self.source = NewsMonitorSource()
+
+    def test_parse_utc(self):
+        parsed = self.source._parse_published_at("2025-01-15T12:00:00Z")
+        assert parsed == datetime(2025, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+    def test_parse_invalid(self):
+        assert self.source._parse_published_at("not a date") is None
+        assert self.source._parse_published_at(None) is None
+
+    def test_event_time_is_naive_local(self):
+        event = self.source._classify_article(
+            _article("Sanctions imposed on exporter", "2025-01-15T12:00:00Z")
+        )
+        expected = datetime(2025, 1, 15, 12, 0, tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
+        assert event.scheduled_time.tzinfo is None
+        assert event.scheduled_time == expected
+        assert event.category == EventCategory.GEOPOLITICAL
+
+
+class FakeLLMClient:
+    def __init__(self, classification: Optional[Dict[str, Any]], delay: float = 0.0) -> None:
+        self.client = object()
+        self.batch_size = 20
+        self.classification = classification  # None answers as a failed request
+        self.delay = delay
+        self.batches: List[List[Any]] = []
+        self.metrics = SimpleNamespace(requests=0)
+
+    async def classify_news_batch(self, articles):
+        self.batches.append(list(articles))
+        self.metrics.requests += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.classification is None:
+            return [None for _ in articles]
+        return [dict(self.classification) for _ in articles]
+
+
+class TestClassificationCascade:
+    def setup_method(self):
+        self.llm = FakeLLMClient({
+            "is_market_moving": True,
+            "category": EventCategory.CRYPTO,
+            "tier": EventTier.TIER_4,
+            "affected_assets": ["BTC", "ETH"],
+            "impact_hours": 3,
+            "confidence": 0.8,
+        })
+        self.source = FakeNewsSource(llm_client=self.llm)
+
+    def _classify(self, titles: List[str]):
+        articles = [_article(t, "2025-01-15T12:00:00Z") for t in titles]
+        return asyncio.run(self.source.classify_with_cascade(articles))
+
+    def test_only_ambiguous_articles_reach_llm(self):
+        results = self._classify([
+            "Military conflict escalates as sanctions widen",  # clear geopolitical
+            "Quarterly sales beat estimates",                  # no signal
+            "SEC comments on market structure",                # single weak hit
+            "White House backs new SEC regulation",            # conflicting categories
+        ])
+
+        assert [h for h, _ in self.llm.batches[0]] == [
+            "SEC comments on market structure",
+            "White House backs new SEC regulation",
+        ]
+        assert results[0].category == EventCategory.GEOPOLITICAL
+        assert results[1] is None
+        assert results[2].category == EventCategory.CRYPTO
+        assert results[2].tier == EventTier.TIER_4
+        assert results[2].affected_assets == ["BTC"]
+        assert results[2].impact_window == timedelta(hours=3)
+
+        stats = self.source.cascade_stats
+        assert (stats.keyword_accepted, stats.keyword_rejected, stats.llm_classified) == (1, 1, 2)
+        assert stats.llm_fraction == 0.5
+        assert stats.llm_calls == 1
+        assert stats.keyword_seconds > 0 and stats.llm_seconds > 0
+
+    def test_llm_negative_drops_article(self):
+        self.llm.classification = {"is_market_moving": False, "confidence": 0.9}
+        assert self._classify(["SEC comments on market structure"]) == [None]
+
+    def test_llm_failure_falls_back_to_keywords(self):
+        self.llm.classification = None
+        results = self._classify(["SEC comments on market structure"])
+
+        assert results[0].category == EventCategory.REGULATORY
+        assert self.source.cascade_stats.llm_fallbacks == 1
+
+    def test_zero_confidence_answer_is_not_a_failure(self):
+        self.llm.classification = {"is_market_moving": True, "confidence": 0.0}
+        assert self._classify(["SEC comments on market structure"]) == [None]
+        assert self.source.cascade_stats.llm_fallbacks == 0
+        assert self.source.cascade_stats.llm_classified == 1
+
+    def test_classification_timeout_keeps_articles_for_next_poll(self):
+        self.llm.delay = 1.0
+        page = [_article("SEC comments on market structure", "2025-01-15T12:00:00Z", "https://x/1")]
+        self.source.pages = [page, list(page)]
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(asyncio.wait_for(self.source.fetch_events(), 0.05))
+        assert "from" not in self.source.params[0]
+
+        self.llm.delay = 0.0
+        events = asyncio.run(self.source.fetch_events())
+        assert "from" not in self.source.params[1]
+        assert [e.title for e in events] == ["SEC comments on market structure"]
+
+    def test_llm_calls_count_every_request(self):
+        messages = FakeBatchMessages(garble_sizes={2})
+        source = FakeNewsSource(llm_client=_client(messages, batch_size=2))
+        articles = [
+            _article("SEC comments on market structure", "2025-01-15T12:00:00Z"),
+            _article("White House backs new SEC regulation", "2025-01-15T12:00:00Z"),
+        ]
+        asyncio.run(source.classify_with_cascade(articles))
+
+        assert messages.batch_sizes == [2, 1, 1]
+        assert source.cascade_stats.llm_calls == 3
+
+    def test_without_llm_keywords_decide_everything(self):
+        source = FakeNewsSource()
+        articles = [_article("SEC comments on market structure", "2025-01-15T12:00:00Z")]
+        results = asyncio.run(source.classify_with_cascade(articles))
+
+        assert results[0].category == EventCategory.REGULATORY
+        assert source.cascade_stats.llm_fraction == 0.0
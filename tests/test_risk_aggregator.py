@@ -0,0 +1,413 @@
+import pytest
+from datetime import datetime, timedelta
+
+from benchmarks.synthetic import generate_events
+from edrr.analysis.asset_index import AssetEventIndex
+from edrr.analysis.event_index import EventIndex
+from edrr.analysis.risk_aggregator import RiskAggregator
+from edrr.models.config import Config, RiskThresholds
+from edrr.models.events import Event, EventCategory, EventTier
+from edrr.outputs.calendar_view import CalendarView
+from edrr.storage.event_store import EventStore
+
+
+BASE_TIME = datetime(2025, 1, 15, 12, 0, 0)
+
+
+def _create_event(
+    event_id: str,
+    hours_ahead: float,
+    tier: EventTier = EventTier.TIER_1,
+    category: EventCategory = EventCategory.ECONOMIC,
+    assets=None,
+) -> Event:
+    return Event(
+        id=event_id,
+        title=f"Event {event_id}",
+        category=category,
+        tier=tier,
+        scheduled_time=BASE_TIME + timedelta(hours=hours_ahead),
+        impact_window=timedelta(hours=2),
+        affected_assets=assets if assets is not None else ["SPY", "QQQ", "BTC", "GOLD"],
+    )
+
+
+class TestEventIndex:
+    def setup_method(self):
+        self.events = [
+            _create_event("c", 5),
+            _create_event("a", 1),
+            _create_event("b", 3),
+            _create_event("b2", 3),
+        ]
+        self.index = EventIndex(self.events)
+
+    def test_sorted(self):
+        assert [e.id for e in self.index] == ["a", "b", "b2", "c"]
+
+    def test_between_inclusive(self):
+        result = self.index.between(BASE_TIME + timedelta(hours=1), BASE_TIME + timedelta(hours=3))
+        assert [e.id for e in result] == ["a", "b", "b2"]
+
+    def test_between_exclusive_end(self):
+        result = self.index.between(
+            BASE_TIME + timedelta(hours=1),
+            BASE_TIME + timedelta(hours=3),
+            include_end=False,
+        )
+        assert [e.id for e in result] == ["a"]
+
+    def test_empty_range(self):
+        assert self.index.between(BASE_TIME + timedelta(hours=6), BASE_TIME + timedelta(hours=9)) == []
+        assert self.index.count_between(BASE_TIME, BASE_TIME + timedelta(hours=3)) == 3
+
+    def test_empty_index(self):
+        assert len(EventIndex()) == 0
+        assert EventIndex().between(BASE_TIME, BASE_TIME) == []
+
+
+class TestRangeQueries:
+    def setup_method(self):
+        # Zero thresholds so every event in range produces a window.
+        config = Config(risk_thresholds=RiskThresholds(low=0, elevated=0, high=0, danger=0))
+        self.aggregator = RiskAggregator(config)
+        self.events = [
+            _create_event(f"e{i}", hours, tier)
+            for i, (hours, tier) in enumerate([
+                (-3, EventTier.TIER_1),
+                (0.5, EventTier.TIER_1),
+                (1, EventTier.TIER_2),
+                (6, EventTier.TIER_3),
+                (30, EventTier.TIER_1),
+                (31, EventTier.TIER_1),
+                (100, EventTier.TIER_1),
+                (200, EventTier.TIER_4),
+                (400, EventTier.TIER_1),
+                (401, EventTier.TIER_1),
+                (402, EventTier.TIER_1),
+            ])
+        ]
+        self.aggregator.set_events(self.events)
+
+    def test_clusters_only_use_lookahead_window(self):
+        clusters = self.aggregator.detect_clustering(BASE_TIME)
+        assert [[e.id for e in c.events] for c in clusters] == [["e1", "e2"]]
+
+    def test_intraday_windows(self):
+        windows = self.aggregator._get_intraday_windows(BASE_TIME)
+        assert [w.events[0].id for w in windows] == ["e1", "e2", "e3"]
+
+    def test_high_risk_weeks_match_linear_scan(self):
+        weeks = self.aggregator._get_high_risk_weeks(BASE_TIME)
+        for window in weeks:
+            expected = [
+                e.id for e in sorted(self.events, key=lambda e: e.scheduled_time)
+                if window.start_time <= e.scheduled_time < window.end_time
+            ]
+            assert [e.id for e in window.events] == expected
+        assert weeks
+
+    def test_calendar_events_for_date(self):
+        calendar = CalendarView(self.aggregator)
+        day_events = calendar._get_events_for_date(BASE_TIME)
+        assert [e.id for e in day_events] == ["e0", "e1", "e2", "e3"]
+
+
+class TestVectorizedCurrentRisk:
+    def setup_method(self):
+        self.aggregator = RiskAggregator()
+        self.events = [
+            _create_event("past", -3),
+            _create_event("soon-btc", 0.5, EventTier.TIER_4, EventCategory.CRYPTO, ["BTC"]),
+            _create_event("spy-1", 2, EventTier.TIER_2, EventCategory.FED_SPEAKER, ["SPY"]),
+            _create_event("spy-2", 2, EventTier.TIER_1, EventCategory.EARNINGS, ["SPY", "QQQ"]),
+            _create_event("late", 50, EventTier.TIER_1),
+        ]
+        self.aggregator.set_events(self.events)
+
+    def _reference(self, asset):
+        scorer = self.aggregator.impact_scorer
+        affected = [e for e in self.events if asset in e.affected_assets]
+        max_score = max((scorer.calculate_score(e, asset, BASE_TIME) for e in affected), default=0)
+        upcoming = [e for e in affected if e.scheduled_time > BASE_TIME]
+        next_event = min(upcoming, key=lambda e: e.scheduled_time) if upcoming else None
+        return max_score, next_event
+
+    def test_matches_per_event_loop(self):
+        risks = self.aggregator.get_current_risk(BASE_TIME)
+        for asset, risk in risks.items():
+            max_score, next_event = self._reference(asset)
+            assert risk.score == max_score
+            assert risk.next_event is next_event
+
+    def test_ties_keep_first_event(self):
+        risks = self.aggregator.get_current_risk(BASE_TIME)
+        assert risks["SPY"].next_event.id == "spy-1"
+
+    def test_no_events(self):
+        risks = RiskAggregator().get_current_risk(BASE_TIME)
+        assert all(r.score == 0 and r.next_event is None for r in risks.values())
+
+    def test_score_events(self):
+        scores = self.aggregator.score_events(self.events, BASE_TIME)
+        scorer = self.aggregator.impact_scorer
+        expected = [
+            max(scorer.calculate_score(e, a, BASE_TIME) for a in e.affected_assets)
+            for e in self.events
+        ]
+        assert scores == expected
+
+
+def _brute_force_risk(aggregator, events, asset, current_time):
+    scorer = aggregator.impact_scorer
+    affected = [e for e in events if asset in e.affected_assets]
+    max_score = max((scorer.calculate_score(e, asset, current_time) for e in affected), default=0)
+    upcoming = [e for e in affected if e.scheduled_time > current_time]
+    next_time = min((e.scheduled_time for e in upcoming), default=None)
+    return max_score, next_time
+
+
+class TestAssetEventIndex:
+    def setup_method(self):
+        self.events = generate_events(
+            400, assets=["SPY", "QQQ", "BTC", "GOLD", "ETH"], seed=3, start=BASE_TIME
+        )
+        self.aggregator = RiskAggregator()
+        self.aggregator.set_events(self.events)
+
+    def test_matches_brute_force_over_time(self):
+        assets = ["SPY", "QQQ", "BTC", "GOLD", "ETH"]
+        for hours in [-30, -1, 0, 0.5, 3, 11.9, 23.99, 24, 72, 24 * 40]:
+            now = BASE_TIME + timedelta(hours=hours)
+            risks = self.aggregator.get_current_risk(now, assets=assets)
+            for asset in assets:
+                max_score, next_time = _brute_force_risk(self.aggregator, self.events, asset, now)
+                assert risks[asset].score == max_score, (hours, asset)
+                next_event = risks[asset].next_event
+                assert (next_event.scheduled_time if next_event else None) == next_time
+
+    def test_only_horizon_events_scored(self):
+        scorer = self.aggregator.impact_scorer
+        scored_times = []
+        original = scorer.score_matrix
+
+        def recording_score_matrix(times, *args):
+            scored_times.extend(times.astype(datetime))
+            return original(times, *args)
+
+        scorer.score_matrix = recording_score_matrix
+        self.aggregator.asset_index.max_score("SPY", BASE_TIME)
+
+        horizon_start = BASE_TIME - max(e.impact_window for e in self.events)
+        assert scored_times
+        assert len(scored_times) < len(self.aggregator.asset_index.events_for("SPY"))
+        assert all(horizon_start <= t < BASE_TIME + timedelta(hours=24) for t in scored_times)
+
+    def test_expired_events_floor_at_one(self):
+        index = AssetEventIndex(self.aggregator.impact_scorer, [_create_event("old", -10, assets=["SPY"])])
+        assert index.max_score("SPY", BASE_TIME) == 1
+        assert index.next_event("SPY", BASE_TIME) is None
+        assert index.max_score("QQQ", BASE_TIME) == 0
+
+    def test_incremental_updates_match_rebuild(self):
+        store = EventStore()
+        incremental = RiskAggregator()
+        first, second = self.events[:250], self.events[150:]
+        moved = Event(
+            id=second[0].id,
+            title="moved",
+            category=second[0].category,
+            tier=EventTier.TIER_1,
+            scheduled_time=BASE_TIME + timedelta(hours=1),
+            impact_window=timedelta(hours=3),
+            affected_assets=["BTC"],
+        )
+
+        for batch in [first, second, [moved] + second[1:]]:
+            diff = store.replace_source("synthetic", batch)
+            incremental.apply_event_diff(diff, store.get_events())
+
+        rebuilt = RiskAggregator()
+        rebuilt.set_events(store.get_events())
+        for hours in [-2, 0, 5, 30]:
+            now = BASE_TIME + timedelta(hours=hours)
+            assert incremental.get_current_risk(now) == rebuilt.get_current_risk(now)
+            assert incremental.detect_clustering(now) == rebuilt.detect_clustering(now)
+        assert len(incremental.asset_index) == len(store)
+        assert incremental.asset_index.events_for("BTC")[0].scheduled_time <= moved.scheduled_time
+
+    def test_timeline_matches_current_risk(self):
+        times = [BASE_TIME + timedelta(minutes=37 * i) for i in range(-60, 200)]
+        times.reverse()
+        assets = ["SPY", "BTC", "ETH"]
+        timeline = self.aggregator.get_risk_timeline(times, assets)
+        for i, now in enumerate(times):
+            risks = self.aggregator.get_current_risk(now, assets)
+            for asset in assets:
+                assert timeline[asset][i] == risks[asset].score, (now, asset)
+
+    def test_timeline_chunking(self, monkeypatch):
+        import edrr.analysis.asset_index as asset_index
+
+        times = [BASE_TIME + timedelta(minutes=15 * i) for i in range(300)]
+        expected = self.aggregator.get_risk_timeline(times)
+        monkeypatch.setattr(asset_index, "TIMELINE_CHUNK_CELLS", 7)
+        monkeypatch.setattr(asset_index, "TIMELINE_CHUNK_SPAN", timedelta(hours=1))
+        assert self.aggregator.get_risk_timeline(times) == expected
+
+    def test_timeline_empty(self):
+        assert self.aggregator.get_risk_timeline([], ["SPY"]) == {"SPY": []}
+        assert RiskAggregator().get_risk_timeline([BASE_TIME], ["SPY"]) == {"SPY": [0]}
+
+
+class TestRiskSnapshot:
+    def setup_method(self):
+        self.aggregator = RiskAggregator()
+        self.aggregator.set_events([
+            _create_event("a", 0.5),
+            _create_event("b", 1),
+            _create_event("c", 30, EventTier.TIER_2),
+        ])
+
+    def test_reused_within_bucket(self):
+        first = self.aggregator.get_snapshot(BASE_TIME)
+        second = self.aggregator.get_snapshot(BASE_TIME + timedelta(milliseconds=500))
+        assert first is second
+        assert first.as_of == BASE_TIME
+
+    def test_new_bucket_recomputes(self):
+        first = self.aggregator.get_snapshot(BASE_TIME)
+        second = self.aggregator.get_snapshot(BASE_TIME + timedelta(seconds=1))
+        assert first is not second
+
+    def test_new_event_version_recomputes(self):
+        first = self.aggregator.get_snapshot(BASE_TIME)
+        self.aggregator.set_events(self.aggregator.events[:1])
+        second = self.aggregator.get_snapshot(BASE_TIME)
+        assert second.version == first.version + 1
+        assert second.event_count == 1
+
+    def test_contents_match_direct_calls(self):
+        snapshot = self.aggregator.get_snapshot(BASE_TIME)
+        assert dict(snapshot.asset_risks) == self.aggregator.get_current_risk(BASE_TIME)
+        assert list(snapshot.clusters) == self.aggregator.detect_clustering(BASE_TIME)
+        zones = self.aggregator.get_danger_zones(BASE_TIME)
+        assert {k: list(v) for k, v in snapshot.danger_zones.items()} == zones
+        assert snapshot.next_events["SPY"].id == "a"
+
+    def test_immutable(self):
+        snapshot = self.aggregator.get_snapshot(BASE_TIME)
+        with pytest.raises(TypeError):
+            snapshot.asset_risks["SPY"] = None
+        with pytest.raises(AttributeError):
+            snapshot.version = 99
+
+    def test_danger_zones_scored_at_tick_time(self):
+        # Intraday windows used datetime.now() for scoring; a 2025 tick must
+        # score against the tick, not the wall clock.
+        windows = self.aggregator.get_snapshot(BASE_TIME).danger_zones["intraday"]
+        assert [w.level for w in windows] == [10, 10]
+
+    def test_configurable_bucket(self):
+        aggregator = RiskAggregator(Config(snapshot_bucket_seconds=60))
+        snapshot = aggregator.get_snapshot(BASE_TIME + timedelta(seconds=45))
+        assert snapshot.as_of == BASE_TIME
+        assert aggregator.get_snapshot(BASE_TIME + timedelta(seconds=59)) is snapshot
+
+    def test_calendar_rendered_once_per_snapshot(self):
+        calendar = CalendarView(self.aggregator)
+        first = calendar.generate_week(BASE_TIME)
+        assert calendar.generate_week(BASE_TIME + timedelta(milliseconds=200)) is first
+        assert "Event a" in calendar.generate_today(BASE_TIME)
+
+
+def _reference_clusters(events, current_time, lookahead_hours=24, window_hours=2):
+    """The original quadratic cluster scan, kept as an oracle."""
+    end_time = current_time + timedelta(hours=lookahead_hours)
+    relevant = sorted(
+        [e for e in events if current_time <= e.scheduled_time <= end_time],
+        key=lambda e: e.scheduled_time,
+    )
+    clusters = []
+    checked = set()
+    for event in relevant:
+        if event.id in checked:
+            continue
+        window_end = event.scheduled_time + timedelta(hours=window_hours)
+        in_window = [e for e in relevant if event.scheduled_time <= e.scheduled_time <= window_end]
+        if len(in_window) >= 2:
+            checked.update(e.id for e in in_window)
+            clusters.append([e.id for e in in_window])
+    return clusters
+
+
+class TestClusterDetection:
+    def setup_method(self):
+        self.aggregator = RiskAggregator()
+
+    def test_matches_quadratic_scan(self):
+        import random
+
+        rng = random.Random(7)
+        events = [
+            _create_event(f"e{i}", rng.uniform(-5, 30), assets=rng.sample(["SPY", "QQQ", "BTC", "GOLD"], 2))
+            for i in range(400)
+        ]
+        events.append(_create_event("dup-time", 10))
+        events.append(_create_event("dup-time-2", 10))
+        self.aggregator.set_events(events)
+
+        for lookahead, window in [(24, 2), (12, 1), (30, 0.25)]:
+            found = self.aggregator.detect_clustering(BASE_TIME, lookahead, window)
+            assert [[e.id for e in c.events] for c in found] == _reference_clusters(
+                events, BASE_TIME, lookahead, window
+            )
+
+    def test_per_asset_clusters(self):
+        self.aggregator.set_events([
+            _create_event("spy", 1, assets=["SPY"]),
+            _create_event("btc-1", 2.5, EventTier.TIER_4, EventCategory.CRYPTO, ["BTC"]),
+            _create_event("btc-2", 4, EventTier.TIER_4, EventCategory.CRYPTO, ["BTC"]),
+        ])
+        combined = self.aggregator.detect_clustering(BASE_TIME)
+        per_asset = self.aggregator.detect_asset_clustering(BASE_TIME)
+
+        assert [[e.id for e in c.events] for c in combined] == [["spy", "btc-1"]]
+        assert [[e.id for e in c.events] for c in per_asset["BTC"]] == [["btc-1", "btc-2"]]
+        assert per_asset["BTC"][0].asset == "BTC"
+        assert per_asset["BTC"][0].assets_affected == ["BTC"]
+        assert per_asset["SPY"] == []
+        assert self.aggregator.detect_clustering(BASE_TIME, asset="BTC")[0].events == per_asset["BTC"][0].events
+
+    def test_per_asset_compound_risk_uses_asset_scores(self):
+        self.aggregator.set_events([
+            _create_event("c1", 30, EventTier.TIER_4, EventCategory.CRYPTO, ["BTC", "GOLD"]),
+            _create_event("c2", 31, EventTier.TIER_4, EventCategory.CRYPTO, ["BTC", "GOLD"]),
+        ])
+        per_asset = self.aggregator.detect_asset_clustering(BASE_TIME, lookhead_hours=48)
+        gold = per_asset["GOLD"][0]
+        btc = per_asset["BTC"][0]
+        assert gold.compound_risk < btc.compound_risk
+
+    def test_config_window(self):
+        aggregator = RiskAggregator(Config(cluster_window_hours=1, cluster_lookahead_hours=48))
+        aggregator.set_events([_create_event("a", 30), _create_event("b", 31.5)])
+        assert aggregator.detect_clustering(BASE_TIME) == []
+        assert len(aggregator.detect_clustering(BASE_TIME, window_hours=2)) == 1
+
+    def test_asset_only_cluster_alerts(self):
+        from edrr.outputs.alerts import AlertManager, AlertType
+
+        self.aggregator.set_events([
+            _create_event("spy", 1, assets=["SPY"]),
+            _create_event("btc-1", 2.5, EventTier.TIER_4, EventCategory.CRYPTO, ["BTC", "ETH"]),
+            _create_event("btc-2", 4, EventTier.TIER_4, EventCategory.CRYPTO, ["BTC", "ETH"]),
+        ])
+        manager = AlertManager(self.aggregator)
+        alerts = [
+            a for a in manager.check_thresholds(BASE_TIME)
+            if a.alert_type == AlertType.CLUSTERING_DETECTED
+        ]
+        assert len(alerts) == 2
+        assert alerts[1].title.startswith("BTC Event Cluster")
+        assert manager.check_thresholds(BASE_TIME) == []
@@ -0,0 +1,173 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import List, Sequence
+
+from edrr.analysis.breakpoints import BreakpointQueue, event_breakpoints
+from edrr.analysis.impact_scorer import ImpactScorer
+from edrr.models.events import Event, EventCategory, EventTier
+from edrr.scheduler import Scheduler
+from edrr.storage.event_store import EventDiff
+
+
+BASE_TIME = datetime(2025, 1, 15, 12, 0)
+
+
+def _create_event(
+    event_id: str,
+    hours_ahead: float,
+    assets: Sequence[str] = ("SPY",),
+) -> Event:
+    return Event(
+        id=event_id,
+        title=f"Event {event_id}",
+        category=EventCategory.ECONOMIC,
+        tier=EventTier.TIER_1,
+        scheduled_time=BASE_TIME + timedelta(hours=hours_ahead),
+        affected_assets=list(assets),
+        impact_window=timedelta(hours=2),
+    )
+
+
+class TestEventBreakpoints:
+    def test_breakpoints(self):
+        event = _create_event("a", 30)
+        assert event_breakpoints(event) == [
+            BASE_TIME + timedelta(hours=6),
+            BASE_TIME + timedelta(hours=18),
+            BASE_TIME + timedelta(hours=26),
+            BASE_TIME + timedelta(hours=29),
+            BASE_TIME + timedelta(hours=32),
+        ]
+
+    def test_score_constant_between_breakpoints(self):
+        scorer = ImpactScorer()
+        event = _create_event("a", 30)
+        times = [BASE_TIME] + event_breakpoints(event) + [BASE_TIME + timedelta(days=3)]
+        for start, end in zip(times, times[1:]):
+            probes = [start + (end - start) * i / 10 for i in range(1, 11)]
+            scores = {scorer.calculate_score(event, "SPY", t) for t in probes}
+            assert len(scores) == 1
+
+
+class TestBreakpointQueue:
+    def setup_method(self):
+        self.queue = BreakpointQueue()
+
+    def test_skips_past_breakpoints(self):
+        self.queue.set_events([_create_event("a", 2)], BASE_TIME)
+        assert self.queue.next_time() == BASE_TIME + timedelta(hours=1)
+        assert len(self.queue) == 3
+
+    def test_pop_due_returns_affected_assets(self):
+        self.queue.set_events(
+            [_create_event("a", 2, ["SPY"]), _create_event("b", 5, ["BTC", "GOLD"])],
+            BASE_TIME,
+        )
+        assert self.queue.pop_due(BASE_TIME + timedelta(minutes=30)) == ([], False)
+        assert self.queue.pop_due(BASE_TIME + timedelta(hours=1)) == (["SPY", "BTC", "GOLD"], False)
+        assert self.queue.next_time() == BASE_TIME + timedelta(hours=1, minutes=30)
+
+    def test_pop_due_reports_opened_danger_window(self):
+        self.queue.set_events([_create_event("a", 2, ["SPY"])], BASE_TIME)
+        self.queue.pop_due(BASE_TIME + timedelta(hours=1))
+        assert self.queue.pop_due(BASE_TIME + timedelta(hours=1, minutes=30)) == (["SPY"], True)
+        assert self.queue.next_time() == BASE_TIME + timedelta(hours=4)
+
+    def test_removed_events_are_skipped(self):
+        event = _create_event("a", 2)
+        self.queue.set_events([event, _create_event("b", 10, ["BTC"])], BASE_TIME)
+        self.queue.remove(event)
+        assert self.queue.next_time() == BASE_TIME + timedelta(hours=6)
+        assert self.queue.pop_due(BASE_TIME + timedelta(hours=6)) == (["BTC"], False)
+
+    def test_add_replaces_same_id(self):
+        self.queue.set_events([_create_event("a", 2)], BASE_TIME)
+        self.queue.add(_create_event("a", 50, ["GOLD"]))
+        assert self.queue.next_time() == BASE_TIME + timedelta(hours=26)
+        assert self.queue.pop_due(BASE_TIME + timedelta(hours=26)) == (["GOLD"], False)
+
+    def test_add_after_pop_ignores_elapsed_breakpoints(self):
+        self.queue.set_events([], BASE_TIME)
+        self.queue.pop_due(BASE_TIME + timedelta(hours=3))
+        self.queue.add(_create_event("a", 2))
+        assert self.queue.next_time() == BASE_TIME + timedelta(hours=4)
+
+    def test_empty(self):
+        assert self.queue.next_time() is None
+        assert self.queue.pop_due(BASE_TIME) == ([], False)
+
+
+class TestBreakpointScheduling:
+    def setup_method(self):
+        self.calls: List[List[str]] = []
+
+        async def on_risk_recalculate(assets=None):
+            self.calls.append(assets)
+
+        self.scheduler = Scheduler(on_risk_recalculate=on_risk_recalculate)
+
+    def test_schedules_just_after_next_breakpoint(self):
+        self.scheduler.set_events([_create_event("a", 2)], BASE_TIME)
+        assert self.scheduler.next_recalc_time == BASE_TIME + timedelta(hours=1, seconds=1)
+
+    def test_no_job_without_breakpoints(self):
+        self.scheduler.set_events([_create_event("a", -5)], BASE_TIME)
+        assert self.scheduler.next_recalc_time is None
+
+    def test_recalculates_only_affected_assets(self):
+        self.scheduler.set_events(
+            [_create_event("a", 2, ["SPY"]), _create_event("b", 30, ["BTC"])],
+            BASE_TIME,
+        )
+        wake = BASE_TIME + timedelta(hours=1, seconds=1)
+        asyncio.run(self.scheduler._recalculate_due_assets(wake))
+        assert self.calls == [["SPY"]]
+        assert self.scheduler.next_recalc_time == BASE_TIME + timedelta(hours=1, minutes=30, seconds=1)
+
+    def test_danger_window_start_runs_full_check(self):
+        self.scheduler.set_events([_create_event("a", 2, ["SPY"])], BASE_TIME)
+        asyncio.run(self.scheduler._recalculate_due_assets(BASE_TIME + timedelta(hours=1, seconds=1)))
+        asyncio.run(self.scheduler._recalculate_due_assets(BASE_TIME + timedelta(hours=1, minutes=30, seconds=1)))
+        assert self.calls == [["SPY"], None]
+        assert self.scheduler.next_recalc_time == BASE_TIME + timedelta(hours=4, seconds=1)
+
+    def test_far_breakpoints_are_caught(self):
+        self.scheduler.set_events([_create_event("a", 30, ["BTC"])], BASE_TIME)
+        assert self.scheduler.next_recalc_time == BASE_TIME + timedelta(hours=6, seconds=1)
+
+    def test_diff_reschedules(self):
+        self.scheduler.set_events([_create_event("a", 30)], BASE_TIME)
+        added = _create_event("b", 3, ["GOLD"])
+        self.scheduler.apply_event_diff(EventDiff(added=[added]), [added])
+        assert self.scheduler.next_recalc_time == BASE_TIME + timedelta(hours=2, seconds=1)
+
+    def test_asset_threshold_check(self):
+        from edrr.analysis.risk_aggregator import RiskAggregator
+        from edrr.outputs.alerts import AlertManager, AlertType
+
+        aggregator = RiskAggregator()
+        aggregator.set_events([
+            _create_event("spy", 30, ["SPY"]),
+            _create_event("btc", 30, ["BTC"]),
+        ])
+        manager = AlertManager(aggregator)
+        manager.check_thresholds(BASE_TIME)
+
+        alerts = manager.check_asset_thresholds(["SPY"], BASE_TIME + timedelta(hours=27))
+        crossings = [a for a in alerts if a.alert_type == AlertType.THRESHOLD_CROSSING]
+        assert crossings
+        assert all(a.assets == ["SPY"] for a in crossings)
+        assert manager.check_asset_thresholds(["SPY"], BASE_TIME + timedelta(hours=27)) == []
+
+    def test_danger_zone_entry_alert_at_window_start(self):
+        from edrr.analysis.risk_aggregator import RiskAggregator
+        from edrr.outputs.alerts import AlertManager, AlertType
+
+        aggregator = RiskAggregator()
+        aggregator.set_events([_create_event("a", 2, ["SPY"])])
+        manager = AlertManager(aggregator)
+        manager.check_thresholds(BASE_TIME)
+
+        wake = BASE_TIME + timedelta(hours=1, minutes=30) + self.scheduler._settle
+        alerts = manager.check_thresholds(wake)
+        assert [a.alert_type for a in alerts] == [AlertType.DANGER_ZONE_ENTRY]
@@ -307,3 +307,66 @@ class TestScoreCalculation:
         score = self.scorer.calculate_score(event, "SPY")
         assert isinstance(score, int)
         assert 1 <= score <= 10
+
+
+class TestBatchScoring:
+    def setup_method(self):
+        self.scorer = ImpactScorer()
+        self.base_time = datetime(2025, 1, 15, 12, 0, 0)
+        self.assets = ["SPY", "QQQ", "BTC", "GOLD", "ETH"]
+
+    def _events(self):
+        offsets = [
+            timedelta(hours=h) for h in (-10, -4, -2, -0.5, 0, 0.5, 1, 2, 4, 8, 12, 18, 24, 36)
+        ] + [timedelta(hours=1, microseconds=1), timedelta(hours=-4, microseconds=-1)]
+        events = []
+        for tier in EventTier:
+            for category in EventCategory:
+                for offset in offsets:
+                    events.append(Event(
+                        id=f"{tier.value}-{category.value}-{offset}",
+                        title="Test",
+                        category=category,
+                        tier=tier,
+                        scheduled_time=self.base_time + offset,
+                        impact_window=timedelta(hours=4),
+                        affected_assets=["SPY"],
+                    ))
+        return events
+
+    def test_matches_calculate_score(self):
+        events = self._events()
+        matrix = self.scorer.score_events(events, self.assets, self.base_time)
+        assert matrix.shape == (len(events), len(self.assets))
+        for i, event in enumerate(events):
+            for j, asset in enumerate(self.assets):
+                assert matrix[i, j] == self.scorer.calculate_score(event, asset, self.base_time)
+
+    def test_rounding_matches_clamp_score(self):
+        custom_config = Config()
+        custom_config.asset_correlations["SPY"]["economic"] = 0.5625
+        scorer = ImpactScorer(custom_config)
+        event = Event(
+            id="half",
+            title="Half",
+            category=EventCategory.ECONOMIC,
+            tier=EventTier.TIER_1,
+            scheduled_time=self.base_time + timedelta(hours=36),
+            impact_window=timedelta(hours=4),
+        )
+        # 8.0 * 1.0 * 0.5625 == 4.5 rounds half to even like round().
+        matrix = scorer.score_events([event], ["SPY"], self.base_time)
+        assert matrix[0, 0] == scorer.calculate_score(event, "SPY", self.base_time) == 4
+
+    def test_custom_multipliers(self):
+        custom_config = Config()
+        custom_config.time_multipliers["under_1h"] = 3.0
+        scorer = ImpactScorer(custom_config)
+        events = self._events()
+        matrix = scorer.score_events(events, self.assets, self.base_time)
+        for i, event in enumerate(events):
+            assert matrix[i, 0] == scorer.calculate_score(event, "SPY", self.base_time)
+
+    def test_empty(self):
+        matrix = self.scorer.score_events([], self.assets, self.base_time)
+        assert matrix.shape == (0, len(self.assets))
@@ -0,0 +1,315 @@
+import asyncio
+import os
+import socket
+import tempfile
+import time
+import pytest
+from datetime import datetime, timedelta
+
+from aiohttp import ClientSession
+from aiohttp.test_utils import TestClient, TestServer
+
+from edrr.api.endpoints import EDRRApi
+from edrr.api.response_cache import CachedResponse, make_etag
+from edrr.api.shared_snapshot import (
+    _SEQUENCE,
+    _SEQUENCE_OFFSET,
+    SharedSnapshotReader,
+    SharedSnapshotWriter,
+    SnapshotBusyError,
+)
+from edrr.api.workers import ApiWorkerPool
+from edrr.engine import RiskRadarEngine
+from edrr.models.config import Config
+from edrr.models.events import Event, EventCategory, EventTier
+from edrr.storage.cache import MemoryCache
+
+
+def _create_event(event_id: str, hours_ahead: float = 2) -> Event:
+    return Event(
+        id=event_id,
+        title=f"Event {event_id}",
+        category=EventCategory.ECONOMIC,
+        tier=EventTier.TIER_1,
+        scheduled_time=datetime.now() + timedelta(hours=hours_ahead),
+        impact_window=timedelta(hours=2),
+        affected_assets=["SPY", "QQQ"],
+    )
+
+
+def _response(body: bytes, status: int = 200) -> CachedResponse:
+    return CachedResponse(status=status, body=body, etag=make_etag(body))
+
+
+class TestSharedSnapshot:
+    def setup_method(self):
+        fd, self.path = tempfile.mkstemp(suffix=".bin")
+        os.close(fd)
+        self.writer = SharedSnapshotWriter(self.path, capacity=256)
+        self.reader = SharedSnapshotReader(self.path)
+        self.as_of = datetime(2025, 1, 15, 12, 0, 0)
+
+    def teardown_method(self):
+        self.reader.close()
+        self.writer.close()
+        os.unlink(self.path)
+
+    def test_round_trip(self):
+        assert self.reader.get("risk") is None
+        assert self.reader.version == 0
+
+        risk = _response(b'{"SPY": 7}')
+        spy = _response(b'{"score": 7}')
+        version = self.writer.publish({("risk", None): risk, ("risk", "SPY"): spy}, self.as_of, 3)
+
+        assert version == 1
+        assert self.reader.get("risk") == risk
+        assert self.reader.get("risk", "SPY") == spy
+        assert self.reader.get("risk", "XYZ") is None
+        assert self.reader.version == 1
+        assert self.reader.as_of == self.as_of
+        assert self.reader.events_loaded == 3
+
+    def test_picks_up_new_versions_and_growth(self):
+        self.writer.publish({("risk", None): _response(b"{}")}, self.as_of, 0)
+        assert self.reader.get("risk").body == b"{}"
+
+        big = _response(b'{"x": "' + b"a" * 5000 + b'"}')
+        self.writer.publish({("risk", None): big}, self.as_of + timedelta(seconds=1), 1)
+        assert self.reader.get("risk") == big
+        assert self.reader.version == 2
+
+    def test_unchanged_publish_is_skipped(self):
+        risk = _response(b'{"v": 1}')
+        assert self.writer.publish({("risk", None): risk}, self.as_of, 1) == 1
+        assert self.writer.publish({("risk", None): risk}, self.as_of + timedelta(seconds=1), 1) == 1
+        assert self.writer.publish({("risk", None): risk}, self.as_of, 2) == 2
+
+    def test_unchanged_bodies_carry_over(self):
+        risk = _response(b'{"v": 1}')
+        self.writer.publish({("risk", None): risk, ("risk", "SPY"): _response(b"{}")}, self.as_of, 0)
+        first = self.reader.get("risk")
+        self.reader.get("risk", "SPY")
+
+        spy = _response(b'{"score": 3}')
+        self.writer.publish({("risk", None): risk, ("risk", "SPY"): spy}, self.as_of, 0)
+        assert self.reader.get("risk") is first
+        assert self.reader.get("risk", "SPY") == spy
+
+    def test_publish_in_progress_serves_previous_version(self):
+        first = _response(b'{"v": 1}')
+        self.writer.publish({("risk", None): first}, self.as_of, 0)
+        assert self.reader.get("risk") == first
+
+        # An odd sequence marks a write in progress; readers keep what they have.
+        _SEQUENCE.pack_into(self.writer._map, _SEQUENCE_OFFSET, 3)
+        assert self.reader.get("risk") == first
+        assert self.reader.version == 1
+
+    def test_read_overlapping_every_publish_raises(self):
+        self.writer.publish({("risk", None): _response(b'{"v": 1}')}, self.as_of, 0)
+        self.reader.refresh()
+
+        # A publish stuck in progress: the body can never be read consistently.
+        _SEQUENCE.pack_into(self.writer._map, _SEQUENCE_OFFSET, 3)
+        with pytest.raises(SnapshotBusyError):
+            self.reader.get("risk")
+
+    def test_rejects_foreign_file(self):
+        fd, path = tempfile.mkstemp()
+        os.write(fd, b"not a snapshot")
+        os.close(fd)
+        try:
+            SharedSnapshotReader(path)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("expected ValueError")
+        finally:
+            os.unlink(path)
+
+
+class TestWorkerApi:
+    def setup_method(self):
+        fd, self.path = tempfile.mkstemp(suffix=".bin")
+        os.close(fd)
+        self.config = Config(snapshot_bucket_seconds=86400)
+        self.engine = RiskRadarEngine(self.config, cache=MemoryCache())
+        self.engine._sources = []
+
+    def teardown_method(self):
+        asyncio.run(self.engine.stop())
+        os.unlink(self.path)
+
+    def _run(self, api, scenario):
+        async def runner():
+            client = TestClient(TestServer(api.create_app()))
+            await client.start_server()
+            try:
+                return await scenario(client)
+            finally:
+                await client.close()
+
+        return asyncio.run(runner())
+
+    def test_serves_engine_snapshot(self):
+        self.engine.share_snapshot(self.path)
+        self.engine._apply_event_diff(self.engine.event_store.replace_source("test", [_create_event("a")]))
+        live = self.engine.create_api()
+        worker = EDRRApi(config=self.config, snapshot_reader=SharedSnapshotReader(self.path))
+
+        async def fetch(client):
+            results = {}
+            for path in ("/risk/SPY", "/recommendation", "/calendar/week", "/health"):
+                response = await client.get(path)
+                results[path] = (response.status, await response.json(), response.headers.get("ETag"))
+            response = await client.get("/risk/SPY", headers={"If-None-Match": results["/risk/SPY"][2]})
+            results["304"] = response.status
+            results["unknown"] = (await client.get("/risk/XYZ")).status
+            results["stream"] = (await client.get("/stream")).status
+            results["metrics"] = (await client.get("/metrics")).status
+            return results
+
+        expected = self._run(live, fetch)
+        served = self._run(worker, fetch)
+        assert served["/risk/SPY"] == expected["/risk/SPY"]
+        assert served["/risk/SPY"][1]["next_event"]["id"] == "a"
+        assert served["/recommendation"] == expected["/recommendation"]
+        assert served["/calendar/week"] == expected["/calendar/week"]
+        assert served["/health"][1]["events_loaded"] == 1
+        assert served["304"] == 304
+        assert served["unknown"] == 404
+        assert served["stream"] == 404
+        assert served["metrics"] == 404
+
+    def test_engine_republishes_while_running(self):
+        engine = RiskRadarEngine(Config(), cache=MemoryCache())
+        engine._sources = []
+        writer = engine.share_snapshot(self.path)
+        reader = SharedSnapshotReader(self.path)
+        calls = []
+        render = engine._snapshot_api.render_responses
+
+        def counting_render(current_time=None):
+            calls.append(current_time)
+            return render(current_time)
+
+        engine._snapshot_api.render_responses = counting_render
+
+        async def scenario():
+            await engine.start()
+            started = writer.version
+            await asyncio.sleep(1.1)
+            published = writer.version
+            reader.refresh()
+            await engine.stop()
+            return started, published
+
+        started, published = asyncio.run(scenario())
+        # Nothing changed between ticks, so nothing was re-rendered or rewritten.
+        assert calls == []
+        assert published == started
+        assert reader.version == published
+        assert engine.snapshot_writer is None
+        reader.close()
+
+    def test_breakpoint_rerenders_snapshot(self):
+        engine = RiskRadarEngine(Config(), cache=MemoryCache())
+        writer = engine.share_snapshot(self.path)
+        calls = []
+        render = engine._snapshot_api.render_responses
+
+        def counting_render(current_time=None):
+            calls.append(current_time)
+            return render(current_time)
+
+        engine._snapshot_api.render_responses = counting_render
+        engine.publish_shared_snapshot()
+        assert calls == []
+
+        asyncio.run(engine._on_risk_recalculate(["SPY"]))
+        assert len(calls) == 1
+        writer.close()
+
+    def test_unpublished_snapshot(self):
+        SharedSnapshotWriter(self.path).close()
+        worker = EDRRApi(config=self.config, snapshot_reader=SharedSnapshotReader(self.path))
+
+        async def fetch(client):
+            response = await client.get("/risk")
+            return response.status, await response.json()
+
+        assert self._run(worker, fetch) == (503, {"error": "Risk snapshot not published yet"})
+
+    def test_busy_snapshot_answers_retry_later(self):
+        writer = SharedSnapshotWriter(self.path)
+        writer.publish({("risk", None): _response(b"{}")}, datetime.now(), 0)
+        reader = SharedSnapshotReader(self.path)
+        reader.refresh()
+        _SEQUENCE.pack_into(writer._map, _SEQUENCE_OFFSET, 3)
+        worker = EDRRApi(config=self.config, snapshot_reader=reader)
+
+        async def fetch(client):
+            response = await client.get("/risk")
+            return response.status, response.headers.get("Retry-After"), await response.json()
+
+        try:
+            assert self._run(worker, fetch) == (503, "1", {"error": "Risk snapshot is being updated"})
+        finally:
+            reader.close()
+            writer.close()
+
+
+class TestApiWorkerPool:
+    def test_workers_share_port(self):
+        fd, path = tempfile.mkstemp(suffix=".bin")
+        os.close(fd)
+        writer = SharedSnapshotWriter(path)
+        body = b'{"SPY": {"score": 5}}'
+        writer.publish({("risk", None): _response(body)}, datetime.now(), 1)
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        pool = ApiWorkerPool(path, 2, "127.0.0.1", port, metrics_export_seconds=0.1)
+
+        async def fetch():
+            deadline = time.monotonic() + 30
+            async with ClientSession() as session:
+                while True:
+                    try:
+                        async with session.get(f"http://127.0.0.1:{port}/risk") as response:
+                            result = response.status, await response.read()
+                            break
+                    except OSError:
+                        if time.monotonic() > deadline:
+                            raise
+                        await asyncio.sleep(0.1)
+
+                runner = await pool.start_metrics_server("127.0.0.1", 0)
+                metrics_port = runner.addresses[0][1]
+                route = 'edrr_api_request_seconds_count{method="GET",route="/risk",status="200",worker="'
+                try:
+                    while True:
+                        async with session.get(f"http://127.0.0.1:{metrics_port}/metrics") as response:
+                            text = await response.text()
+                        if route in text or time.monotonic() > deadline:
+                            break
+                        await asyncio.sleep(0.1)
+                finally:
+                    await runner.cleanup()
+            return result, text, route
+
+        pool.start()
+        try:
+            assert pool.alive_count() == 2
+            result, text, route = asyncio.run(fetch())
+            assert result == (200, body)
+            assert route in text
+            assert "# TYPE edrr_scoring_seconds histogram" in text
+            assert text.count("# TYPE edrr_api_request_seconds histogram") == 1
+        finally:
+            pool.stop()
+            writer.close()
+            os.unlink(path)
+        assert pool.alive_count() == 0
+        assert not os.path.exists(pool.metrics_path(0))
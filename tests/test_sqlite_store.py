@@ -0,0 +1,150 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from edrr.engine import RiskRadarEngine
+from edrr.models.config import Config
+from edrr.models.events import Event, EventCategory, EventTier
+from edrr.storage.event_store import EventStore
+from edrr.storage.sqlite_store import SQLiteEventStore
+from tests.test_engine import FakeSource, _create_event
+
+
+BASE_TIME = datetime(2025, 1, 15, 12, 0, 0)
+
+
+def _event(
+    event_id: str,
+    hours_ahead: float,
+    category: EventCategory = EventCategory.ECONOMIC,
+    assets=None,
+) -> Event:
+    return Event(
+        id=event_id,
+        title=f"Event {event_id}",
+        category=category,
+        tier=EventTier.TIER_1,
+        scheduled_time=BASE_TIME + timedelta(hours=hours_ahead),
+        impact_window=timedelta(hours=2),
+        affected_assets=assets or ["SPY", "QQQ"],
+    )
+
+
+class TestSQLiteEventStore:
+    def setup_method(self):
+        self.memory = EventStore()
+        self.store = SQLiteEventStore(":memory:")
+
+    def _save(self, source, events, incremental=False):
+        if incremental:
+            diff = self.memory.merge_source(source, events)
+        else:
+            diff = self.memory.replace_source(source, events)
+        self.store.apply_diff(source, diff, fetched_at=BASE_TIME)
+
+    def test_round_trip_by_source(self):
+        econ = [_event("a", 1), _event("b", 30, assets=["BTC"])]
+        crypto = [_event("c", 5, EventCategory.CRYPTO, ["BTC"])]
+        self._save("econ", econ)
+        self._save("crypto", crypto)
+
+        assert self.store.load() == {"econ": econ, "crypto": crypto}
+        assert self.store.last_fetched() == {"econ": BASE_TIME, "crypto": BASE_TIME}
+
+    def test_replace_removes_and_updates(self):
+        self._save("econ", [_event("a", 1), _event("b", 2)])
+        moved = _event("a", 3)
+        self._save("econ", [moved])
+
+        assert self.store.load() == {"econ": [moved]}
+        assert self.store.query(asset="SPY") == [moved]
+
+    def test_indexed_queries(self):
+        self._save("econ", [
+            _event("a", 1),
+            _event("b", 10, EventCategory.FED_SPEAKER),
+            _event("c", 20, assets=["GOLD"]),
+        ])
+
+        in_range = self.store.query(BASE_TIME, BASE_TIME + timedelta(hours=10))
+        assert [e.id for e in in_range] == ["a", "b"]
+        assert [e.id for e in self.store.query(category=EventCategory.FED_SPEAKER)] == ["b"]
+        assert [e.id for e in self.store.query(asset="GOLD")] == ["c"]
+        assert [e.id for e in self.store.query(end=BASE_TIME + timedelta(hours=5), asset="SPY")] == ["a"]
+
+    def test_prune_expired(self):
+        self._save("news", [_event("old", -5), _event("live", -1), _event("new", 4)], incremental=True)
+
+        assert self.store.prune_expired(BASE_TIME) == 1
+        assert [e.id for e in self.store.load()["news"]] == ["live", "new"]
+        assert self.store.query(asset="SPY", end=BASE_TIME - timedelta(hours=4)) == []
+
+    def test_indexes_used(self):
+        plan = " ".join(
+            str(row) for row in self.store._conn.execute(
+                "EXPLAIN QUERY PLAN DELETE FROM events WHERE impact_end < ?", ("x",)
+            )
+        )
+        assert "idx_events_impact_end" in plan
+
+
+class TestWarmStart:
+    def test_restart_serves_persisted_events(self, tmp_path):
+        config = Config(event_db_path=str(tmp_path / "events.db"))
+        first = RiskRadarEngine(config)
+        first._sources = [FakeSource("econ", [_create_event("a"), _create_event("b", 30)])]
+        asyncio.run(first._fetch_all_events())
+        first.persistent_store.close()
+
+        second = RiskRadarEngine(config)
+        source = FakeSource("econ", [_create_event("a")])
+        second._sources = [source]
+
+        assert second.warm_start()
+        assert source.calls == 0
+        assert {e.id for e in second.get_events()} == {"a", "b"}
+        assert second.persisted_is_fresh()
+
+        diff = asyncio.run(second._fetch_all_events())
+        assert [e.id for e in diff.removed] == ["b"]
+        assert second.persistent_store.load() == {"econ": second.get_events()}
+
+    def test_start_refreshes_in_background(self, tmp_path):
+        config = Config(event_db_path=str(tmp_path / "events.db"))
+        seed = RiskRadarEngine(config)
+        seed._sources = [FakeSource("econ", [_create_event("a")])]
+        asyncio.run(seed._fetch_all_events())
+        seed.persistent_store.close()
+
+        engine = RiskRadarEngine(config)
+        engine._sources = [FakeSource("econ", [_create_event("b")], delay=0.05)]
+
+        async def scenario():
+            await engine.start()
+            served = [e.id for e in engine.get_events()]
+            await engine._refresh_task
+            refreshed = [e.id for e in engine.get_events()]
+            await engine.stop()
+            return served, refreshed
+
+        assert asyncio.run(scenario()) == (["a"], ["b"])
+
+    def test_start_after_fetch_does_not_fetch_again(self, tmp_path):
+        config = Config(event_db_path=str(tmp_path / "events.db"))
+        engine = RiskRadarEngine(config)
+        source = FakeSource("econ", [_create_event("a")])
+        engine._sources = [source]
+
+        async def scenario():
+            await engine._fetch_all_events()
+            await engine.start()
+            refresh_task = engine._refresh_task
+            await engine.stop()
+            return refresh_task
+
+        assert asyncio.run(scenario()) is None
+        assert source.calls == 1
+
+    def test_disabled_without_path(self):
+        engine = RiskRadarEngine(Config(event_db_path=None))
+        assert engine.persistent_store is None
+        assert not engine.warm_start()
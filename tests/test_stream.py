@@ -0,0 +1,220 @@
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+from aiohttp.test_utils import TestClient, TestServer
+
+from edrr.analysis.risk_aggregator import RiskAggregator
+from edrr.api.endpoints import EDRRApi
+from edrr.api.stream import StreamBroker, sse_frame
+from edrr.engine import RiskRadarEngine
+from edrr.models.config import Config
+from edrr.models.events import Event, EventCategory, EventTier
+from edrr.storage.cache import MemoryCache
+
+
+def _create_event(event_id: str, hours_ahead: float = 2, assets=("SPY", "QQQ")) -> Event:
+    return Event(
+        id=event_id,
+        title=f"Event {event_id}",
+        category=EventCategory.ECONOMIC,
+        tier=EventTier.TIER_1,
+        scheduled_time=datetime.now() + timedelta(hours=hours_ahead),
+        impact_window=timedelta(hours=2),
+        affected_assets=list(assets),
+    )
+
+
+def _parse_frame(frame: bytes) -> dict:
+    fields = {}
+    for line in frame.decode().strip().split("\n"):
+        name, _, value = line.partition(": ")
+        fields[name] = value
+    fields["data"] = json.loads(fields["data"])
+    return fields
+
+
+class TestStreamBroker:
+    def setup_method(self):
+        self.broker = StreamBroker(max_queue=3)
+
+    def test_sse_frame(self):
+        assert sse_frame("risk", {"score": 7}, 4) == b'id: 4\nevent: risk\ndata: {"score": 7}\n\n'
+        assert sse_frame("risk", {}) == b"event: risk\ndata: {}\n\n"
+
+    def test_asset_and_severity_filters(self):
+        async def scenario():
+            btc = self.broker.subscribe(["btc"])
+            severe = self.broker.subscribe(min_severity=8)
+            self.broker.publish("risk", {"asset": "SPY"}, ["SPY"], 9)
+            self.broker.publish("risk", {"asset": "BTC"}, ["BTC"], 5)
+            self.broker.publish("alert", {"title": "all"}, [], 9)
+            return (
+                [(await btc.get(0)).data for _ in range(btc.pending())],
+                [(await severe.get(0)).data for _ in range(severe.pending())],
+            )
+
+        btc, severe = asyncio.run(scenario())
+        assert btc == [{"asset": "BTC"}, {"title": "all"}]
+        assert severe == [{"asset": "SPY"}, {"title": "all"}]
+
+    def test_full_queue_drops_oldest(self):
+        async def scenario():
+            subscription = self.broker.subscribe()
+            for i in range(5):
+                self.broker.publish("risk", {"i": i})
+            received = [(await subscription.get(0)).data["i"] for _ in range(subscription.pending())]
+            return subscription, received
+
+        subscription, received = asyncio.run(scenario())
+        assert received == [2, 3, 4]
+        assert subscription.dropped == 2
+
+    def test_unsubscribe(self):
+        async def scenario():
+            subscription = self.broker.subscribe()
+            self.broker.unsubscribe(subscription)
+            self.broker.publish("risk", {})
+            return await subscription.get(0.01)
+
+        assert asyncio.run(scenario()) is None
+        assert self.broker.subscriber_count == 0
+
+    def test_close_wakes_reader(self):
+        async def scenario():
+            subscription = self.broker.subscribe()
+            for i in range(3):
+                self.broker.publish("risk", {"i": i})
+            waiter = asyncio.ensure_future(subscription.get(60))
+            await asyncio.sleep(0)
+            self.broker.close_all()
+            first = await waiter
+            self.broker.publish("risk", {"i": 9})
+            return subscription, first
+
+        subscription, first = asyncio.run(scenario())
+        assert subscription.closed
+        assert first.data == {"i": 0}
+        assert subscription.pending() == 3  # two queued messages and the close marker
+
+
+class TestStreamEndpoint:
+    def setup_method(self):
+        self.aggregator = RiskAggregator()
+        self.aggregator.set_events([_create_event("a")])
+        self.broker = StreamBroker(max_queue=2)
+        self.api = EDRRApi(self.aggregator, stream_broker=self.broker)
+
+    def _run(self, scenario):
+        async def runner():
+            client = TestClient(TestServer(self.api.create_app()))
+            await client.start_server()
+            try:
+                return await scenario(client)
+            finally:
+                await client.close()
+
+        return asyncio.run(runner())
+
+    async def _wait_for_subscriber(self):
+        while self.broker.subscriber_count == 0:
+            await asyncio.sleep(0.01)
+
+    def test_streams_filtered_messages(self):
+        async def scenario(client):
+            response = await client.get("/stream?assets=SPY&min_severity=5")
+            initial = await response.content.readuntil(b"\n\n")
+            await self._wait_for_subscriber()
+            self.broker.publish("risk", {"asset": "BTC"}, ["BTC"], 9)
+            self.broker.publish("risk", {"asset": "SPY"}, ["SPY"], 3)
+            self.broker.publish("alert", {"title": "SPY danger"}, ["SPY"], 9)
+            pushed = await response.content.readuntil(b"\n\n")
+            response.close()
+            return response, initial, pushed
+
+        response, initial, pushed = self._run(scenario)
+        assert response.headers["Content-Type"] == "text/event-stream"
+        first = _parse_frame(initial)
+        assert first["event"] == "risk"
+        assert first["data"]["asset"] == "SPY"
+        message = _parse_frame(pushed)
+        assert message["event"] == "alert"
+        assert message["id"] == "3"
+        assert message["data"] == {"title": "SPY danger"}
+
+    def test_reports_dropped_messages(self):
+        async def scenario(client):
+            response = await client.get("/stream?assets=BTC")
+            await response.content.readuntil(b"\n\n")
+            await self._wait_for_subscriber()
+            for i in range(5):
+                self.broker.publish("risk", {"i": i}, ["BTC"], 5)
+            frames = [await response.content.readuntil(b"\n\n") for _ in range(3)]
+            response.close()
+            return [_parse_frame(frame) for frame in frames]
+
+        dropped, first, second = self._run(scenario)
+        assert dropped["event"] == "dropped"
+        assert dropped["data"] == {"count": 3}
+        assert [first["data"]["i"], second["data"]["i"]] == [3, 4]
+
+    def test_cleanup_ends_open_streams(self):
+        from aiohttp import ClientSession
+
+        from edrr.api.endpoints import start_server
+
+        async def scenario():
+            runner = await start_server(self.api, "127.0.0.1", 0)
+            host, port = runner.addresses[0][:2]
+            async with ClientSession() as session:
+                response = await session.get(f"http://{host}:{port}/stream")
+                await response.content.readuntil(b"\n\n")
+                await self._wait_for_subscriber()
+                started = asyncio.get_running_loop().time()
+                await asyncio.wait_for(runner.cleanup(), 5)
+                elapsed = asyncio.get_running_loop().time() - started
+                response.close()
+            return elapsed
+
+        assert asyncio.run(scenario()) < 5
+        assert self.broker.subscriber_count == 0
+
+    def test_bad_severity(self):
+        async def scenario(client):
+            response = await client.get("/stream?min_severity=high")
+            return response.status
+
+        assert self._run(scenario) == 400
+
+
+class TestEngineStreaming:
+    def setup_method(self):
+        self.engine = RiskRadarEngine(Config(), cache=MemoryCache())
+        self.engine._sources = []
+
+    def test_risk_changes_published_once(self):
+        async def scenario():
+            subscription = self.engine.stream_broker.subscribe(["SPY"])
+            event = _create_event("a", 0.5)
+            self.engine.risk_aggregator.set_events([event])
+            self.engine._stream_risk_changes()
+            self.engine._stream_risk_changes()
+            return [(await subscription.get(0)) for _ in range(subscription.pending())]
+
+        messages = asyncio.run(scenario())
+        assert len(messages) == 1
+        assert messages[0].kind == "risk"
+        assert messages[0].data["asset"] == "SPY"
+        assert messages[0].data["previous_score"] is None
+
+    def test_new_events_published(self):
+        async def scenario():
+            subscription = self.engine.stream_broker.subscribe(["QQQ"])
+            event = _create_event("a")
+            self.engine._apply_event_diff(self.engine.event_store.replace_source("test", [event]))
+            return [(await subscription.get(0)) for _ in range(subscription.pending())]
+
+        messages = asyncio.run(scenario())
+        assert [m.kind for m in messages] == ["event"]
+        assert messages[0].data["id"] == "a"
+        assert messages[0].severity > 1